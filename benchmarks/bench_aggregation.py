@@ -0,0 +1,46 @@
+"""
+Benchmarks for aggregating many :class:`staircase.Stairs` instances.
+
+Times :func:`staircase.sum` and its relatives over fifty thousand step
+functions, each with twenty step points, such as the utilisation of many
+machines.
+
+Run from the project root with::
+
+    python benchmarks/bench_aggregation.py
+"""
+
+import timeit
+
+import numpy as np
+
+import staircase as sc
+
+COLLECTION_SIZE = 50_000
+INTERVALS = 10
+
+
+def make_collection():
+    rng = np.random.default_rng(0)
+    collection = []
+    for _ in range(COLLECTION_SIZE):
+        points = np.sort(rng.choice(10**7, 2 * INTERVALS, replace=False))
+        collection.append(
+            sc.Stairs().layer(points[::2], points[1::2], rng.random(INTERVALS))
+        )
+    return collection
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    collection = make_collection()
+    print(f"{'aggregation':<14}{'time (s)':>10}")
+    for func in (sc.sum, sc.mean, sc.max, sc.min, sc.logical_or, sc.logical_and):
+        print(f"{func.__name__:<14}{time_func(lambda: func(collection)):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmarks for binary operations between :class:`staircase.Stairs` instances.
+
+Times, and measures the peak memory allocated by, arithmetic, relational and
+logical operators between two step functions, each with one million step points,
+most of which are not shared.  One of the step functions is masked, so that null
+values must be handled.  Operators between a step function and a scalar are
+measured too, where the allocation of the result dominates.
+
+Run from the project root with::
+
+    python benchmarks/bench_binary_ops.py
+"""
+
+import operator
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 1_000_000
+
+
+def make_stairs(rng):
+    step_points = np.sort(rng.choice(100 * STEPS, STEPS, replace=False))
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.normal(size=STEPS), index=step_points)
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    rng = np.random.default_rng(0)
+    stairs1 = make_stairs(rng)
+    stairs2 = make_stairs(rng).mask((10 * STEPS, 20 * STEPS))
+    print(f"{'operator':<14}{'operand':<10}{'time (s)':>10}{'peak (MB)':>12}")
+    for operand, other in (("stairs", stairs2), ("scalar", 2)):
+        for op in (
+            operator.add,
+            operator.mul,
+            operator.truediv,
+            operator.lt,
+            operator.eq,
+            operator.and_,
+        ):
+            func = lambda: op(stairs1, other)  # noqa: E731
+            print(
+                f"{op.__name__:<14}{operand:<10}"
+                f"{time_func(func):>10.3f}{peak_memory(func) / 1e6:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmarks for :class:`staircase.StairsArray` stored in columns.
+
+Times sampling, into a dataframe or an array, statistics and scalar arithmetic
+for two hundred thousand step functions, each with twenty step points, such as
+the utilisation of many resources, held in a :class:`pandas.Series` with the
+"Stairs" dtype.
+
+Run from the project root with::
+
+    python benchmarks/bench_columnar.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+COLLECTION_SIZE = 200_000
+STEPS = 20
+SAMPLE_POINTS = 50
+
+
+def make_series():
+    rng = np.random.default_rng(0)
+    gaps = rng.integers(1, 10**5, (COLLECTION_SIZE, STEPS))
+    array = sc.StairsArray.from_columns(
+        step_points=np.cumsum(gaps, axis=1).ravel(),
+        values=rng.random(COLLECTION_SIZE * STEPS),
+        offsets=np.arange(COLLECTION_SIZE + 1) * STEPS,
+    )
+    return pd.Series(array, dtype="Stairs")
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    series = make_series()
+    x = np.linspace(0, STEPS * 10**5 / 2, SAMPLE_POINTS)
+    print(f"memory: {series.values.nbytes / 1e6:.1f} MB")
+    print(f"{'operation':<14}{'time (s)':>10}")
+    for name, func in (
+        ("sample", lambda: series.sc.sample(x)),
+        ("sample matrix", lambda: series.sc.sample(x, as_frame=False)),
+        ("integral", series.sc.integral),
+        ("mean", series.sc.mean),
+        ("max", series.sc.max),
+        ("min", series.sc.min),
+        ("describe", series.sc.describe),
+        ("multiply", lambda: series * 2),
+    ):
+        print(f"{name:<14}{time_func(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
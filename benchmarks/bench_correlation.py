@@ -0,0 +1,55 @@
+"""
+Benchmarks for covariance and correlation matrices of many
+:class:`staircase.Stairs` instances.
+
+Times :func:`staircase.cov` and :func:`staircase.corr` for five hundred step
+functions, such as the readings of sensors, each with two hundred step points.
+The step points are either shared, as for sensors read at the same times, or
+distinct.  The domain is either bounded, or unbounded, in which case the means
+are over the step points of each step function and each pair.
+
+Run from the project root with::
+
+    python benchmarks/bench_correlation.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+COLLECTION_SIZE = 500
+STEPS = 200
+
+
+def make_collection(rng, points):
+    collection = []
+    for _ in range(COLLECTION_SIZE):
+        step_points = np.sort(rng.choice(points, STEPS, replace=False))
+        collection.append(
+            sc.Stairs.from_values(
+                0, pd.Series(rng.normal(size=STEPS), index=step_points)
+            )
+        )
+    return collection
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'step points':<14}{'where':<14}{'function':<10}{'time (s)':>10}")
+    for name, points in (("shared", 10 * STEPS), ("distinct", 10**7)):
+        collection = make_collection(rng, points)
+        for where in ((0, points), (None, None)):
+            for func in (sc.cov, sc.corr):
+                seconds = time_func(lambda: func(collection, where=where))
+                print(f"{name:<14}{str(where):<14}{func.__name__:<10}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
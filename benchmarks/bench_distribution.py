@@ -0,0 +1,64 @@
+"""
+Benchmarks for the distribution of values of a :class:`staircase.Stairs`.
+
+Times the median, a batch of percentiles, quartiles, the ECDF, the variance and
+the skewness of a step function with one million step points, such as the
+utilisation of a resource over a long period, and the median of each of ten
+thousand step functions with twenty step points.  Step functions are copied before each operation, so that
+their distributions are not cached between runs.
+
+Run from the project root with::
+
+    python benchmarks/bench_distribution.py
+"""
+
+import timeit
+
+import numpy as np
+
+import staircase as sc
+
+STEPS = 1_000_000
+PERCENTILES = 1_000
+COLLECTION_SIZE = 10_000
+INTERVALS = 10
+
+
+def make_stairs():
+    rng = np.random.default_rng(0)
+    points = np.sort(rng.choice(10**9, 2 * STEPS, replace=False))
+    return sc.Stairs().layer(points[::2], points[1::2], rng.random(STEPS))
+
+
+def make_collection():
+    rng = np.random.default_rng(0)
+    starts = np.arange(INTERVALS) * 2
+    return [
+        sc.Stairs().layer(starts, starts + 1, rng.integers(0, 10, INTERVALS))
+        for _ in range(COLLECTION_SIZE)
+    ]
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    stairs = make_stairs()
+    collection = make_collection()
+    q = np.linspace(0, 100, PERCENTILES)
+    print(f"{'operation':<14}{'time (s)':>10}")
+    for name, func in (
+        ("median", lambda: stairs.copy().median()),
+        ("percentiles", lambda: stairs.copy().percentile(q)),
+        ("quantiles", lambda: stairs.copy().quantiles(4)),
+        ("ecdf", lambda: stairs.copy().ecdf(0.5)),
+        ("var", lambda: stairs.copy().var()),
+        ("skew", lambda: stairs.copy().skew()),
+        ("small medians", lambda: [s.copy().median() for s in collection]),
+    ):
+        print(f"{name:<14}{time_func(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
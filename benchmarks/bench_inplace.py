@@ -0,0 +1,64 @@
+"""
+Benchmarks for accumulating :class:`staircase.Stairs` instances in a loop.
+
+Times adding two thousand step functions, each with twenty step points, to a
+running total, such as the utilisation of many machines, with the ``+``
+operator, with the in-place ``+=`` operator, and with :func:`staircase.sum`.
+
+Run from the project root with::
+
+    python benchmarks/bench_inplace.py
+"""
+
+import timeit
+
+import numpy as np
+
+import staircase as sc
+
+COLLECTION_SIZE = 2_000
+INTERVALS = 10
+
+
+def make_collection():
+    rng = np.random.default_rng(0)
+    collection = []
+    for _ in range(COLLECTION_SIZE):
+        points = np.sort(rng.choice(10**7, 2 * INTERVALS, replace=False))
+        collection.append(
+            sc.Stairs().layer(points[::2], points[1::2], rng.random(INTERVALS))
+        )
+    return collection
+
+
+def accumulate(collection):
+    total = sc.Stairs()
+    for stairs in collection:
+        total = total + stairs
+    return total
+
+
+def accumulate_inplace(collection):
+    total = sc.Stairs()
+    for stairs in collection:
+        total += stairs
+    return total.step_points
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    collection = make_collection()
+    print(f"{'accumulation':<14}{'time (s)':>10}")
+    for name, func in (
+        ("add", lambda: accumulate(collection)),
+        ("inplace add", lambda: accumulate_inplace(collection)),
+        ("sum", lambda: sc.sum(collection)),
+    ):
+        print(f"{name:<14}{time_func(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmarks for serializing :class:`staircase.Stairs` and :class:`staircase.StairsArray`.
+
+Times, and measures the size of, the binary and JSON formats of
+:mod:`staircase.io`, and pickling, for a step function with one million step
+points, and for two hundred thousand step functions, each with twenty step
+points, held in a :class:`staircase.StairsArray`.
+
+Run from the project root with::
+
+    python benchmarks/bench_io.py
+"""
+
+import pickle
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 1_000_000
+COLLECTION_SIZE = 200_000
+COLLECTION_STEPS = 20
+
+
+def make_stairs(rng):
+    step_points = np.sort(rng.choice(100 * STEPS, STEPS, replace=False))
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.normal(size=STEPS), index=step_points)
+    )
+
+
+def make_array(rng):
+    gaps = rng.integers(1, 10**5, (COLLECTION_SIZE, COLLECTION_STEPS))
+    return sc.StairsArray.from_columns(
+        step_points=np.cumsum(gaps, axis=1).ravel(),
+        values=rng.random(COLLECTION_SIZE * COLLECTION_STEPS),
+        offsets=np.arange(COLLECTION_SIZE + 1) * COLLECTION_STEPS,
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(
+        f"{'object':<12}{'format':<8}{'size (MB)':>11}"
+        f"{'write (s)':>11}{'read (s)':>10}"
+    )
+    for name, obj in (("Stairs", make_stairs(rng)), ("StairsArray", make_array(rng))):
+        for format_name, write, read in (
+            ("bytes", sc.io.to_bytes, sc.io.from_bytes),
+            ("pickle", pickle.dumps, pickle.loads),
+            ("json", sc.io.to_json, sc.io.from_json),
+        ):
+            data = write(obj)
+            print(
+                f"{name:<12}{format_name:<8}{len(data) / 1e6:>11.1f}"
+                f"{time_func(lambda: write(obj)):>11.3f}"
+                f"{time_func(lambda: read(data)):>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmarks for cross-correlation of :class:`staircase.Stairs` instances over
+many lags.
+
+Times :meth:`staircase.Stairs.xcorr` for two thousand lags, between two step
+functions with ten thousand step points each, over a bounded and an unbounded
+domain, against calling :meth:`staircase.Stairs.corr` for each lag, as estimated
+from a sample of the lags.
+
+Run from the project root with::
+
+    python benchmarks/bench_lags.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 10_000
+LAGS = 2_000
+# the number of lags for which Stairs.corr is timed, which is scaled up to LAGS
+SAMPLES = 20
+
+
+def make_stairs(rng):
+    step_points = np.sort(rng.choice(1000 * STEPS, STEPS, replace=False))
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.normal(size=STEPS), index=step_points)
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    stairs1, stairs2 = make_stairs(rng), make_stairs(rng)
+    lags = np.linspace(-10 * STEPS, 10 * STEPS, LAGS)
+    print(f"{'where':<20}{'method':<14}{'time (s)':>10}")
+    for where in [(0, 1000 * STEPS), (None, None)]:
+        xcorr = time_func(lambda: stairs1.xcorr(stairs2, lags, where=where))
+        per_lag = time_func(
+            lambda: [
+                stairs1.corr(stairs2, where=where, lag=lag)
+                for lag in lags[:: LAGS // SAMPLES]
+            ]
+        )
+        print(f"{str(where):<20}{'xcorr':<14}{xcorr:>10.3f}")
+        print(f"{str(where):<20}{'corr per lag':<14}{per_lag * LAGS / SAMPLES:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
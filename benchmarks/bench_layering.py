@@ -0,0 +1,93 @@
+"""
+Benchmarks for the reduction of deltas when layering intervals.
+
+Compares the sort-and-reduce implementation used by :meth:`staircase.Stairs.layer`
+with the pandas groupby implementation it replaced, on data the size of
+:func:`staircase.make_test_data` and 100 times larger.
+
+Also times layering intervals one at a time, as a simulation would, with the
+default buffer of pending layers and with the buffer disabled.
+
+Run from the project root with::
+
+    python benchmarks/bench_layering.py
+"""
+
+import timeit
+
+import pandas as pd
+
+import staircase as sc
+from staircase.core.layering import (
+    _sum_deltas_by_step_point,
+    _sum_deltas_by_step_point_groupby,
+)
+
+
+def make_data(dates, copies):
+    return pd.concat(
+        [sc.make_test_data(dates=dates, seed=seed) for seed in range(copies)],
+        ignore_index=True,
+    )
+
+
+def make_args(df):
+    start = df["start"].dropna()
+    end = df["end"].dropna()
+    step_points = [start.values, end.values]
+    deltas = [df.loc[start.index, "value"].values, -df.loc[end.index, "value"].values]
+    return step_points, deltas
+
+
+def time_func(func, *args, repeat=5, number=10):
+    return (
+        min(timeit.repeat(lambda: func(*args), repeat=repeat, number=number)) / number
+    )
+
+
+def layer_one_at_a_time(df, buffer_size):
+    default_buffer_size = sc.Stairs.layer_buffer_size
+    sc.Stairs.layer_buffer_size = buffer_size
+    try:
+        stairs = sc.Stairs()
+        for start, end, value in df.itertuples(index=False):
+            stairs.layer(start, end, value)
+        return stairs.integral()
+    finally:
+        sc.Stairs.layer_buffer_size = default_buffer_size
+
+
+def main():
+    print(
+        f"{'data':<22}{'rows':>10}{'groupby (ms)':>16}{'numpy (ms)':>14}{'layer (ms)':>14}"
+    )
+    for dates in (False, True):
+        for copies in (1, 100):
+            df = make_data(dates, copies)
+            args = make_args(df)
+            groupby_time = time_func(_sum_deltas_by_step_point_groupby, *args)
+            numpy_time = time_func(_sum_deltas_by_step_point, *args)
+            layer_time = time_func(sc.Stairs, df, "start", "end", "value")
+            label = f"{'dates' if dates else 'floats'} x{copies}"
+            print(
+                f"{label:<22}{len(df):>10}{groupby_time * 1000:>16.3f}"
+                f"{numpy_time * 1000:>14.3f}{layer_time * 1000:>14.3f}"
+            )
+
+    print()
+    print(f"{'data':<22}{'rows':>10}{'unbuffered (ms)':>16}{'buffered (ms)':>14}")
+    for copies in (1, 10, 50):
+        df = make_data(False, copies).dropna()
+        unbuffered_time = time_func(layer_one_at_a_time, df, 1, repeat=1, number=1)
+        buffered_time = time_func(
+            layer_one_at_a_time, df, sc.Stairs.layer_buffer_size, repeat=3, number=1
+        )
+        label = f"floats x{copies}"
+        print(
+            f"{label:<22}{len(df):>10}{unbuffered_time * 1000:>16.1f}"
+            f"{buffered_time * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmarks for lazy evaluation of expressions of :class:`staircase.Stairs`.
+
+Times, and measures the peak memory of, a rule combining twenty step functions,
+each with two hundred thousand step points, such as the capacity of many
+resources, evaluated eagerly and with :meth:`staircase.Stairs.lazy`.
+
+Run from the project root with::
+
+    python benchmarks/bench_lazy.py
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+COLLECTION_SIZE = 20
+STEPS = 200_000
+
+
+def make_collection():
+    rng = np.random.default_rng(0)
+    return [
+        sc.Stairs.from_values(
+            0,
+            pd.Series(
+                rng.integers(0, 10, STEPS),
+                index=np.sort(rng.choice(100 * STEPS, STEPS, replace=False)),
+            ),
+        )
+        for _ in range(COLLECTION_SIZE)
+    ]
+
+
+def rule(collection):
+    first, *rest = collection
+    total = first
+    for i, stairs in enumerate(rest):
+        total = total + stairs if i % 2 else total - stairs * 0.5
+    return (total > 5) & (collection[0] < 8)
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    collection = make_collection()
+    lazy_collection = [collection[0].lazy()] + collection[1:]
+    print(f"{'evaluation':<14}{'time (s)':>10}{'peak (MB)':>12}")
+    for name, func in (
+        ("eager", lambda: rule(collection)),
+        ("lazy", lambda: rule(lazy_collection).compute()),
+    ):
+        print(f"{name:<14}{time_func(func):>10.3f}{peak_memory(func) / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmarks for resampling a :class:`staircase.Stairs` instance to a regular grid.
+
+Times the mean, maximum and last value over one minute intervals of a step
+function with two million step points, at sub-second resolution over a year,
+such as the utilisation of a server.  The mean is also calculated with a
+:class:`staircase.StairsSlicer`, for comparison.
+
+Run from the project root with::
+
+    python benchmarks/bench_resample_grid.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 2_000_000
+
+
+def make_stairs():
+    rng = np.random.default_rng(0)
+    microseconds = 366 * 24 * 3600 * 10**6
+    offsets = np.sort(rng.choice(microseconds, STEPS, replace=False))
+    step_points = pd.Timestamp("2020") + pd.to_timedelta(offsets, unit="us")
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.integers(0, 100, STEPS), index=step_points)
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    stairs = make_stairs()
+    cuts = pd.date_range("2020", "2021-01-01 01:00", freq="min")
+    print(f"{'resampling':<26}{'time (s)':>10}")
+    for name, func in (
+        ("mean", lambda: stairs.resample_grid("min")),
+        ("max", lambda: stairs.resample_grid("min", "max")),
+        ("last", lambda: stairs.resample_grid("min", "last")),
+        ("mean, as series", lambda: stairs.resample_grid("min", as_series=True)),
+        ("mean, slicer", lambda: stairs.slice(cuts).resample("mean")),
+    ):
+        print(f"{name:<26}{time_func(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
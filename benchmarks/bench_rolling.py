@@ -0,0 +1,52 @@
+"""
+Benchmarks for rolling statistics of :class:`staircase.Stairs`.
+
+Times :meth:`staircase.Stairs.rolling_mean` and its relatives, with a trailing
+window, on a step function with one million step points.  The "slice" engine of
+:meth:`staircase.Stairs.rolling_mean` is timed on a smaller step function, and
+scaled up.
+
+Run from the project root with::
+
+    python benchmarks/bench_rolling.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 1_000_000
+SUBSET = 20_000
+WINDOW = (-60, 0)
+
+
+def make_stairs(steps):
+    rng = np.random.default_rng(0)
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.normal(size=steps), index=np.arange(steps))
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    stairs = make_stairs(STEPS)
+    print(f"{'method':<30}{'steps':>10}{'time (s)':>12}")
+    for method in ("rolling_mean", "rolling_integral", "rolling_max", "rolling_min"):
+        # copies are timed so that cached calculations are not reused
+        elapsed = time_func(lambda: getattr(stairs.copy(), method)(WINDOW))
+        print(f"{method:<30}{STEPS:>10}{elapsed:>12.3f}")
+    subset = make_stairs(SUBSET)
+    elapsed = time_func(lambda: subset.rolling_mean(WINDOW, engine="slice"), repeat=1)
+    print(
+        f"{'rolling_mean (slice, scaled)':<30}{STEPS:>10}{elapsed * STEPS / SUBSET:>12.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
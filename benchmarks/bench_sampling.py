@@ -0,0 +1,56 @@
+"""
+Benchmarks for sampling a :class:`staircase.Stairs` instance.
+
+Times sampling a step function with ten thousand step points on a regular grid
+of one million points, such as resampling utilisation to one second intervals,
+with points which are unsorted, sorted, sorted and known to be sorted, and
+sorted into an existing buffer.  Times sampling a timezone aware step function
+with a :class:`pandas.DatetimeIndex`.
+
+Run from the project root with::
+
+    python benchmarks/bench_sampling.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+STEPS = 10_000
+POINTS = 1_000_000
+
+
+def make_stairs(rng, step_points):
+    return sc.Stairs.from_values(
+        0, pd.Series(rng.normal(size=len(step_points)), index=step_points)
+    )
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    stairs = make_stairs(rng, np.sort(rng.choice(POINTS, STEPS, replace=False)))
+    x = np.arange(POINTS, dtype="float64")
+    shuffled = rng.permutation(x)
+    out = np.empty(POINTS)
+    dates = pd.date_range("2020", periods=POINTS, freq="s", tz="Australia/Sydney")
+    date_stairs = make_stairs(rng, dates[np.sort(rng.choice(POINTS, STEPS, False))])
+    print(f"{'points':<22}{'time (s)':>10}")
+    for name, func in (
+        ("unsorted", lambda: stairs.sample(shuffled)),
+        ("sorted", lambda: stairs.sample(x)),
+        ("assume sorted", lambda: stairs.sample(x, assume_sorted=True)),
+        ("assume sorted, out", lambda: stairs.sample(x, assume_sorted=True, out=out)),
+        ("DatetimeIndex", lambda: date_stairs.sample(dates)),
+    ):
+        print(f"{name:<22}{time_func(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
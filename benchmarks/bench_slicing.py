@@ -0,0 +1,64 @@
+"""
+Benchmarks for :class:`staircase.StairsSlicer` statistics.
+
+Times hourly statistics, including the variance, higher moments, median, mode,
+:meth:`staircase.StairsSlicer.describe` and :meth:`staircase.StairsSlicer.hist`,
+over a step function which changes value every minute for a year, and compares
+them with calculating each statistic on a clipped step function for every
+interval (timed on a subset of the intervals, and scaled up).
+
+Run from the project root with::
+
+    python benchmarks/bench_slicing.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import staircase as sc
+
+MINUTES_PER_YEAR = 525600
+SUBSET = 200
+
+
+def make_stairs():
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2021", periods=MINUTES_PER_YEAR, freq="min")
+    return sc.Stairs.from_values(0, pd.Series(rng.normal(size=len(index)), index=index))
+
+
+def time_func(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    stairs = make_stairs()
+    cuts = pd.date_range("2021", "2022", freq="h")
+    scale = (len(cuts) - 1) / SUBSET
+    print(f"{'statistic':<14}{'slices':>10}{'clipped (s)':>14}{'slicer (s)':>14}")
+    for func in (
+        "integral",
+        "mean",
+        "max",
+        "min",
+        "var",
+        "skew",
+        "kurtosis",
+        "median",
+        "mode",
+        "describe",
+        "hist",
+    ):
+        subset = cuts[: SUBSET + 1]
+        clipped_time = (
+            time_func(lambda: stairs.slice(subset).apply(getattr(sc.Stairs, func)))
+            * scale
+        )
+        slicer_time = time_func(lambda: getattr(stairs.copy().slice(cuts), func)())
+        print(f"{func:<14}{len(cuts) - 1:>10}{clipped_time:>14.3f}{slicer_time:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
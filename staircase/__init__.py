@@ -2,6 +2,7 @@ from staircase.core.stairs import Stairs, _add_operations  # isort: skip
 
 _add_operations()
 
+from staircase import io
 from staircase.constants import inf
 from staircase.core.arrays import (
     agg,
@@ -19,8 +20,10 @@ from staircase.core.arrays import (
     sum,
 )
 from staircase.core.arrays.extension import StairsArray
+from staircase.core.lazy import LazyStairs
 from staircase.core.slicing import StairsSlicer
 from staircase.core.stats.distribution import Dist
+from staircase.core.stream import StairsBuilder
 from staircase.test_data import make_test_data
 
 
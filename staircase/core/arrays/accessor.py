@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from pandas.api.extensions import register_series_accessor
 
@@ -43,17 +44,66 @@ class StairsAccessor:
         return self._obj.values.logical_and()
 
     @Appender(docstrings.make_docstring("accessor", "sample"), join="\n", indents=1)
-    def sample(self, x):
+    def sample(self, x, as_frame=True):
+        if not as_frame:
+            return self._obj.values.sample_matrix(x)
         result = self._obj.values.sample(x)
         result.index = self._obj.index
         return result
 
     @Appender(docstrings.make_docstring("accessor", "limit"), join="\n", indents=1)
-    def limit(self, x, side="right"):
+    def limit(self, x, side="right", as_frame=True):
+        if not as_frame:
+            return self._obj.values.limit_matrix(x, side)
         result = self._obj.values.limit(x, side)
         result.index = self._obj.index
         return result
 
+    def _elementwise(self, method):
+        # a statistic of each step function, calculated for all of them at once
+        # unless they cannot be stored in columns
+        array = self._obj.values
+        columns = array._get_columns()
+        if columns is not None:
+            values = getattr(columns, method)()
+        else:
+            values = [np.nan if s is None else getattr(s, method)() for s in array]
+        return pd.Series(values, index=self._obj.index)
+
+    @Appender(docstrings.make_elementwise_docstring("integral"), join="\n", indents=1)
+    def integral(self):
+        return self._elementwise("integral")
+
+    @Appender(docstrings.make_elementwise_docstring("mean"), join="\n", indents=1)
+    def mean(self):
+        return self._elementwise("mean")
+
+    @Appender(docstrings.make_elementwise_docstring("max"), join="\n", indents=1)
+    def max(self):
+        return self._elementwise("max")
+
+    @Appender(docstrings.make_elementwise_docstring("min"), join="\n", indents=1)
+    def min(self):
+        return self._elementwise("min")
+
+    @Appender(docstrings.describe_docstring, join="\n", indents=1)
+    def describe(self, percentiles=(25, 50, 75)) -> pd.DataFrame:
+        array = self._obj.values
+        columns = array._get_columns()
+        if columns is not None:
+            return pd.DataFrame(columns.describe(percentiles), index=self._obj.index)
+        return pd.DataFrame(
+            [
+                (
+                    pd.Series(dtype=float)
+                    if s is None
+                    else s.describe(percentiles=percentiles)
+                )
+                for s in array
+            ],
+            index=self._obj.index,
+        )
+
     @Appender(docstrings.make_docstring("accessor", "plot"), join="\n", indents=1)
     def plot(self, ax=None, **kwargs):
         labels = self._obj.index
@@ -0,0 +1,202 @@
+"""
+Aggregations of many step functions which avoid sampling every step function at
+the step points of all of them.
+"""
+
+import numpy as np
+
+from staircase.core.layering import _sum_deltas_by_step_point
+from staircase.core.ops.common import _merge_step_points
+from staircase.core.stairs import Stairs
+
+
+def _new_stairs(collection, initial_value, step_points, values):
+    tz = next((s._tz for s in collection if s._tz is not None), None)
+    return Stairs._new(
+        initial_value=float(initial_value),
+        step_points=step_points,
+        values=values,
+        closed=collection[0].closed,
+        tz=tz,
+    )._remove_redundant_step_points()
+
+
+def _sum(collection):
+    """
+    Sums step functions by reducing their deltas.
+
+    The result is null wherever any of the step functions are null.
+
+    Parameters
+    ----------
+    collection : sequence of :class:`Stairs`
+
+    Returns
+    -------
+    tuple
+        The initial value, step points and values of the sum.
+    """
+    initial_values = np.array([s.initial_value for s in collection], dtype="float64")
+    initial_nulls = np.isnan(initial_values)
+    # null values are replaced by zero, and counted separately
+    initial_sum = np.where(initial_nulls, 0, initial_values).sum()
+    initial_value = np.nan if initial_nulls.any() else initial_sum
+    with_steps = [i for i, s in enumerate(collection) if s._step_points is not None]
+    if not with_steps:
+        return initial_value, None, None
+
+    # the values of all step functions are concatenated, and each is preceded by
+    # the value before it, so that deltas are calculated in one pass
+    values = np.concatenate([collection[i]._get_values() for i in with_steps])
+    lengths = np.array([len(collection[i]._step_points) for i in with_steps])
+    previous = np.empty_like(values)
+    previous[1:] = values[:-1]
+    previous[np.cumsum(lengths) - lengths] = initial_values[with_steps]
+    isnull, previous_isnull = np.isnan(values), np.isnan(previous)
+    deltas = np.column_stack(
+        [
+            np.where(isnull, 0, values) - np.where(previous_isnull, 0, previous),
+            isnull.astype("float64") - previous_isnull,
+        ]
+    )
+    step_points, deltas = _sum_deltas_by_step_point(
+        [np.concatenate([collection[i]._step_points for i in with_steps])], [deltas]
+    )
+    values = initial_sum + np.cumsum(deltas[:, 0])
+    nulls = initial_nulls.sum() + np.cumsum(deltas[:, 1])
+    values[nulls > 0.5] = np.nan
+    return initial_value, step_points, values
+
+
+def sum_stairs(collection):
+    return _new_stairs(collection, *_sum(collection))
+
+
+def mean_stairs(collection):
+    initial_value, step_points, values = _sum(collection)
+    if values is not None:
+        values = values / len(collection)
+    return _new_stairs(collection, initial_value / len(collection), step_points, values)
+
+
+def _combine_pair(first, second, func):
+    # first and second are tuples of an initial value, step points and values
+    initial_value_1, step_points_1, values_1 = first
+    initial_value_2, step_points_2, values_2 = second
+    initial_value = func(initial_value_1, initial_value_2)
+    if step_points_1 is None and step_points_2 is None:
+        return initial_value, None, None
+    elif step_points_2 is None:
+        step_points, values = step_points_1, func(values_1, initial_value_2)
+    elif step_points_1 is None:
+        step_points, values = step_points_2, func(initial_value_1, values_2)
+    else:
+        step_points, index_1, index_2 = _merge_step_points(step_points_1, step_points_2)
+        values = func(
+            np.append(initial_value_1, values_1)[index_1],
+            np.append(initial_value_2, values_2)[index_2],
+        )
+    # step points which do not change the value are removed, so that step
+    # functions do not grow as they are combined
+    previous = np.append(initial_value, values[:-1])
+    changed = (values != previous) & ~(np.isnan(values) & np.isnan(previous))
+    if not changed.any():
+        return initial_value, None, None
+    return initial_value, step_points[changed], values[changed]
+
+
+def _reduce_pairwise(collection, func, transform=None):
+    """
+    Reduces step functions with a binary function of their values, by combining
+    them in pairs until one remains.
+
+    Each round merges the sorted step points of pairs of step functions, so the
+    step functions are never sampled at the step points of all of them.
+
+    Parameters
+    ----------
+    collection : sequence of :class:`Stairs`
+    func : callable
+        A binary function of arrays of values, which is associative and
+        commutative.
+    transform : callable, optional
+        A function applied to the values of each step function beforehand.
+
+    Returns
+    -------
+    :class:`Stairs`
+    """
+    if transform is None:
+        transform = np.asarray
+    items = [
+        (
+            transform(s.initial_value),
+            s._step_points,
+            None if s._step_points is None else transform(s._get_values()),
+        )
+        for s in collection
+    ]
+    while len(items) > 1:
+        paired = [
+            _combine_pair(first, second, func)
+            for first, second in zip(items[::2], items[1::2])
+        ]
+        items = paired + items[len(paired) * 2 :]
+    return _new_stairs(collection, *items[0])
+
+
+def _to_boolean(values):
+    return np.where(np.isnan(values), np.nan, values != 0)
+
+
+def _make_logical(func):
+    def combine(x, y):
+        return np.where(np.isnan(x) | np.isnan(y), np.nan, func(x, y))
+
+    return combine
+
+
+def max_stairs(collection):
+    return _reduce_pairwise(collection, np.maximum)
+
+
+def min_stairs(collection):
+    return _reduce_pairwise(collection, np.minimum)
+
+
+def logical_or_stairs(collection):
+    return _reduce_pairwise(collection, _make_logical(np.logical_or), _to_boolean)
+
+
+def logical_and_stairs(collection):
+    return _reduce_pairwise(collection, _make_logical(np.logical_and), _to_boolean)
+
+
+_aggregations = {
+    np.sum: sum_stairs,
+    np.mean: mean_stairs,
+    np.max: max_stairs,
+    np.amax: max_stairs,
+    np.min: min_stairs,
+    np.amin: min_stairs,
+}
+
+
+def get_aggregation(func):
+    """
+    Returns the aggregation of step functions equivalent to a numpy function, if
+    there is one.
+
+    Parameters
+    ----------
+    func : callable
+
+    Returns
+    -------
+    callable or None
+    """
+    try:
+        return _aggregations.get(func)
+    except TypeError:
+        # unhashable
+        return None
@@ -0,0 +1,879 @@
+"""
+Columnar storage for many step functions.
+
+The step points and values of all step functions are concatenated into two
+arrays, and the step function at position i owns the slice given by
+``offsets[i]:offsets[i + 1]``.  Initial values and closed flags are stored per
+step function.  Step functions without step points have empty slices, and
+missing step functions are flagged in a separate mask.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_list_like
+
+from staircase.constants import inf
+from staircase.core.stairs import Stairs
+from staircase.core.stats.distribution import _describe_tally, _segmented_tally
+from staircase.util import (
+    _changed,
+    _is_bounded,
+    _is_datetime_like,
+    _masked,
+    _replace_none_with_infs,
+)
+
+_INT64_BOUND = 2.0**63
+
+# the number of values which are sampled at once, which limits the size of
+# temporary arrays
+_SAMPLE_CHUNK_SIZE = 2**22
+
+
+def _to_points(x):
+    # converts points to the representation used for step points
+    if not is_list_like(x):
+        x = [x]
+    if len(x) and _is_datetime_like(next(iter(x))):
+        return pd.Series(x).values
+    return np.asarray(x)
+
+
+def _check_compatible(step_points, tzs):
+    # checked before concatenating, which may otherwise raise a TypeError or
+    # result in an object array
+    if len({str(tz) for tz in tzs}) > 1:
+        raise ValueError(
+            "Step functions with different timezones cannot be stored in columns."
+        )
+    kinds = {"n" if a.dtype.kind in "biuf" else a.dtype.kind for a in step_points}
+    if len(kinds) > 1 or not kinds <= {"n", "M", "m"}:
+        raise ValueError(
+            "Step functions with different types of step points cannot be stored in columns."
+        )
+
+
+class _StairsColumns:
+    def __init__(
+        self, step_points, values, offsets, initial_values, closed, isna, tz=None
+    ):
+        self.step_points = step_points
+        self.values = values
+        self.offsets = offsets
+        self.initial_values = initial_values
+        self.closed = closed
+        self.isna = isna
+        self.tz = tz
+
+    @classmethod
+    def from_arrays(
+        cls, step_points, values, offsets, initial_values=0, closed="left", tz=None
+    ):
+        """
+        Creates columns from concatenated arrays, which are validated.
+        """
+        offsets = np.asarray(offsets, dtype="int64")
+        step_points = np.asarray(step_points)
+        values = np.asarray(values, dtype="float64")
+        size = len(offsets) - 1
+        if size < 0 or offsets[0] != 0 or offsets[-1] != len(step_points):
+            raise ValueError(
+                "'offsets' must start at 0 and end at the number of step points."
+            )
+        if len(values) != len(step_points):
+            raise ValueError("'step_points' and 'values' must have the same length.")
+        if (np.diff(offsets) < 0).any():
+            raise ValueError("'offsets' must be non-decreasing.")
+        columns = cls(
+            step_points,
+            values,
+            offsets,
+            np.broadcast_to(np.asarray(initial_values, dtype="float64"), size).copy(),
+            np.broadcast_to(np.asarray(closed, dtype="<U5"), size).copy(),
+            np.zeros(size, dtype=bool),
+            tz,
+        )
+        ids = columns._ids()
+        if ((step_points[1:] <= step_points[:-1]) & (ids[1:] == ids[:-1])).any():
+            raise ValueError(
+                "The step points of each step function must be strictly increasing."
+            )
+        if not np.isin(columns.closed, ("left", "right")).all():
+            raise ValueError("'closed' must be 'left' or 'right'.")
+        return columns
+
+    @classmethod
+    def from_stairs(cls, data):
+        """
+        Creates columns from a sequence of :class:`Stairs`, or None for missing values.
+
+        Raises
+        ------
+        ValueError
+            If the step points cannot be concatenated, for example if the step
+            functions have different timezones.
+        """
+        isna = np.array([s is None for s in data], dtype=bool)
+        with_steps = [s for s in data if s is not None and s._step_points is not None]
+        if with_steps:
+            step_points = [s._step_points for s in with_steps]
+            _check_compatible(step_points, [s._tz for s in with_steps])
+            step_points = np.concatenate(step_points)
+            values = np.concatenate([s._get_values() for s in with_steps])
+        else:
+            step_points = np.array([], dtype="float64")
+            values = np.array([], dtype="float64")
+        lengths = [
+            0 if s is None or s._step_points is None else len(s._step_points)
+            for s in data
+        ]
+        return cls(
+            step_points,
+            values,
+            np.append(0, np.cumsum(lengths, dtype="int64")),
+            np.array(
+                [np.nan if s is None else s.initial_value for s in data],
+                dtype="float64",
+            ),
+            np.array(["left" if s is None else s.closed for s in data], dtype="<U5"),
+            isna,
+            with_steps[0]._tz if with_steps else None,
+        )
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenates columns.
+
+        Raises
+        ------
+        ValueError
+            If the step points cannot be concatenated.
+        """
+        with_steps = [c for c in to_concat if len(c.step_points)] or to_concat[:1]
+        step_points = [c.step_points for c in with_steps]
+        _check_compatible(step_points, [c.tz for c in with_steps])
+        step_points = np.concatenate(step_points)
+        lengths = np.concatenate([c.lengths for c in to_concat])
+        return cls(
+            step_points,
+            np.concatenate([c.values for c in with_steps]),
+            np.append(0, np.cumsum(lengths)),
+            np.concatenate([c.initial_values for c in to_concat]),
+            np.concatenate([c.closed for c in to_concat]),
+            np.concatenate([c.isna for c in to_concat]),
+            with_steps[0].tz,
+        )
+
+    def __len__(self):
+        return len(self.initial_values)
+
+    @property
+    def nbytes(self):
+        return sum(
+            array.nbytes
+            for array in (
+                self.step_points,
+                self.values,
+                self.offsets,
+                self.initial_values,
+                self.closed,
+                self.isna,
+            )
+        )
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def _ids(self):
+        # the position of the step function which owns each step point
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def _with_values(self, initial_values, values):
+        return _StairsColumns(
+            self.step_points,
+            values,
+            self.offsets,
+            initial_values,
+            self.closed,
+            self.isna,
+            self.tz,
+        )
+
+    def _without_step_points(self, initial_value):
+        return _StairsColumns(
+            self.step_points[:0],
+            self.values[:0],
+            np.zeros(len(self) + 1, dtype="int64"),
+            np.full(len(self), initial_value, dtype="float64"),
+            self.closed,
+            self.isna,
+        )
+
+    def stairs(self, i):
+        """
+        Creates the :class:`Stairs` at position *i*, or None if it is missing.
+
+        The arrays of the :class:`Stairs` are views of the columns, which is safe
+        as arrays of :class:`Stairs` are never modified in place.
+        """
+        if self.isna[i]:
+            return None
+        start, end = self.offsets[i], self.offsets[i + 1]
+        if start == end:
+            return Stairs._new(
+                initial_value=self.initial_values[i].item(), closed=str(self.closed[i])
+            )
+        return Stairs._new(
+            initial_value=self.initial_values[i].item(),
+            step_points=self.step_points[start:end],
+            values=self.values[start:end],
+            closed=str(self.closed[i]),
+            tz=self.tz,
+        )
+
+    def to_objects(self):
+        result = np.empty(len(self), dtype=object)
+        result[:] = [self.stairs(i) for i in range(len(self))]
+        return result
+
+    def take(self, indices, allow_fill=False):
+        """
+        Selects step functions by position.  If *allow_fill* then -1 indicates
+        a missing value, otherwise negative positions count from the end.
+        """
+        indices = np.asarray(indices, dtype="int64")
+        if allow_fill:
+            missing = indices == -1
+            indices = np.where(missing, 0, indices)
+        else:
+            missing = np.zeros(len(indices), dtype=bool)
+            indices = np.where(indices < 0, indices + len(self), indices)
+        if len(self) == 0:
+            if not missing.all():
+                raise IndexError("cannot take from an empty array")
+            return _StairsColumns(
+                self.step_points,
+                self.values,
+                np.zeros(len(indices) + 1, dtype="int64"),
+                np.full(len(indices), np.nan),
+                np.full(len(indices), "left", dtype="<U5"),
+                missing,
+            )
+        lengths = np.where(missing, 0, self.lengths[indices])
+        new_offsets = np.append(0, np.cumsum(lengths))
+        # positions of the selected step points, in order
+        positions = np.repeat(
+            self.offsets[indices] - new_offsets[:-1], lengths
+        ) + np.arange(new_offsets[-1])
+        return _StairsColumns(
+            self.step_points[positions],
+            self.values[positions],
+            new_offsets,
+            np.where(missing, np.nan, self.initial_values[indices]),
+            self.closed[indices],
+            self.isna[indices] | missing,
+            self.tz,
+        )
+
+    def copy(self):
+        return self.take(np.arange(len(self)))
+
+    def _limit(self, x, side_right):
+        # the limits of the step functions at points x, from the right for rows
+        # where side_right is True, otherwise from the left
+        size = len(self)
+        x_order = np.argsort(x, kind="stable")
+        result = np.empty((size, len(x)))
+        result[:] = self.initial_values[:, None]
+        if size and len(x) and len(self.step_points):
+            # each step point is located among the sorted points, and counted
+            # for every point at, or after, it (after it, for limits from the left)
+            sorted_x = x[x_order]
+            ids = self._ids()
+            columns = np.where(
+                side_right[ids],
+                np.searchsorted(sorted_x, self.step_points, side="left"),
+                np.searchsorted(sorted_x, self.step_points, side="right"),
+            )
+            width = len(x) + 1
+            rows_per_chunk = max(1, _SAMPLE_CHUNK_SIZE // width)
+            for start in range(0, size, rows_per_chunk):
+                end = min(start + rows_per_chunk, size)
+                first, last = self.offsets[start], self.offsets[end]
+                # the number of step points of each step function which are counted
+                # at each point
+                counts = np.bincount(
+                    (ids[first:last] - start) * width + columns[first:last],
+                    minlength=(end - start) * width,
+                )
+                counts = counts.reshape(end - start, width).cumsum(axis=1)[:, :-1]
+                positions = np.maximum(counts + self.offsets[start:end, None] - 1, 0)
+                result[start:end] = np.where(
+                    counts > 0, self.values[positions], result[start:end]
+                )
+            unsorted = np.empty_like(result)
+            unsorted[:, x_order] = result
+            result = unsorted
+        result[self.isna] = np.nan
+        return result
+
+    def limit(self, x, side):
+        """
+        Evaluates the limits of the step functions as they approach points.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-D array with a row for each step function, and a column for each point.
+        """
+        assert side in ("left", "right")
+        return self._limit(_to_points(x), np.full(len(self), side == "right"))
+
+    def sample(self, x):
+        """
+        Evaluates the step functions at points.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-D array with a row for each step function, and a column for each point.
+        """
+        return self._limit(_to_points(x), self.closed == "left")
+
+    def _notnull_durations(self):
+        # the durations of non-null values, which are followed by another step point
+        # of the same step function, alongside the values and the positions of
+        # the step functions they belong to
+        follows = np.ones(len(self.step_points), dtype=bool)
+        follows[self.offsets[1:][self.lengths > 0] - 1] = False
+        positions = np.flatnonzero(follows)
+        positions = positions[~np.isnan(self.values[positions])]
+        durations = self.step_points[positions + 1] - self.step_points[positions]
+        return self.values[positions], durations, self._ids()[positions]
+
+    def _integrals_and_durations(self):
+        values, durations, ids = self._notnull_durations()
+        size = len(self)
+        if not np.issubdtype(durations.dtype, np.timedelta64):
+            integrals = np.bincount(ids, weights=values * durations, minlength=size)
+            totals = np.bincount(ids, weights=durations, minlength=size)
+            return integrals, totals
+        # as per Stairs.integral, durations are integers in the units of the step
+        # points, and products are truncated towards zero
+        counts = durations.astype("int64")
+        areas = values * counts
+        if (
+            not (np.abs(areas) < _INT64_BOUND).all()
+            or not (
+                np.abs(np.bincount(ids, weights=areas, minlength=size)) < _INT64_BOUND
+            ).all()
+        ):
+            raise OverflowError(
+                "Integral calculation results in overflow error.  Consider scaling down step function values to accommodate."
+            )
+        integrals = np.zeros(size, dtype="int64")
+        np.add.at(integrals, ids, areas.astype("int64"))
+        totals = np.zeros(size, dtype="int64")
+        np.add.at(totals, ids, counts)
+        unit = np.datetime_data(durations.dtype)[0]
+        return integrals.view(f"timedelta64[{unit}]"), totals.view(
+            f"timedelta64[{unit}]"
+        )
+
+    def _undefined(self):
+        # as per Stairs, integrals and means of step functions with fewer than two
+        # step points are null
+        return (self.lengths < 2) | self.isna
+
+    def integral(self):
+        """
+        Calculates the integral of each step function.
+
+        Returns
+        -------
+        numpy.ndarray
+            Floats, or timedeltas for datetime step functions.
+        """
+        integrals, _ = self._integrals_and_durations()
+        if np.issubdtype(integrals.dtype, np.timedelta64):
+            integrals[self._undefined()] = np.timedelta64("NaT")
+            return integrals
+        return np.where(self._undefined(), np.nan, integrals)
+
+    def mean(self):
+        """
+        Calculates the mean of each step function.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        try:
+            integrals, totals = self._integrals_and_durations()
+            integrals, totals = _to_float(integrals), _to_float(totals)
+        except OverflowError:
+            # as per Stairs.mean, the mean is a weighted sum of values instead
+            values, durations, ids = self._notnull_durations()
+            durations = _to_float(durations)
+            totals = np.bincount(ids, weights=durations, minlength=len(self))
+            integrals = np.bincount(
+                ids, weights=values * (durations / totals[ids]), minlength=len(self)
+            )
+            totals = np.ones(len(self))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = integrals / totals
+        return np.where(self._undefined(), np.nan, means)
+
+    def _extrema(self, func, fill):
+        isnull = np.isnan(self.values)
+        result = np.where(np.isnan(self.initial_values), fill, self.initial_values)
+        nonempty = np.flatnonzero(self.lengths)
+        if len(nonempty):
+            result[nonempty] = func(
+                result[nonempty],
+                func.reduceat(
+                    np.where(isnull, fill, self.values), self.offsets[nonempty]
+                ),
+            )
+        notnull_counts = np.bincount(self._ids()[~isnull], minlength=len(self))
+        allnull = np.isnan(self.initial_values) & (notnull_counts == 0)
+        result[allnull | self.isna] = np.nan
+        return result
+
+    def max(self):
+        """
+        Calculates the maximum value of each step function.
+
+        Returns
+        -------
+        numpy.ndarray
+            Null where all values of a step function are null.
+        """
+        return self._extrema(np.maximum, -np.inf)
+
+    def min(self):
+        """
+        Calculates the minimum value of each step function.
+
+        Returns
+        -------
+        numpy.ndarray
+            Null where all values of a step function are null.
+        """
+        return self._extrema(np.minimum, np.inf)
+
+    def describe(self, percentiles=(25, 50, 75)):
+        """
+        Generates descriptive statistics of each step function, as per
+        :meth:`Stairs.describe`.
+
+        Returns
+        -------
+        dict
+            Arrays of the statistics, keyed by name.  Null for missing step functions.
+        """
+        values, durations, ids = self._notnull_durations()
+        result = _describe_tally(
+            *_segmented_tally(ids, values, durations, len(self)), percentiles
+        )
+        # as per Stairs.describe, the minimum and maximum are over the whole domain
+        result["min"], result["max"] = self.min(), self.max()
+        if self.isna.any():
+            result = {
+                name: np.where(self.isna, np.nan, column)
+                for name, column in result.items()
+            }
+        return result
+
+    def _domain(self, where):
+        # the bounds of a bounded interval, as step points
+        lower, upper = where
+        if not lower < upper:
+            raise ValueError("'lower' must be strictly less than 'upper'.")
+        return _to_points(lower)[0], _to_points(upper)[0]
+
+    def _grid_chunks(self, lower, upper):
+        """
+        Evaluates the step functions on a common grid, which divides the interval
+        from *lower* to *upper* at every step point.
+
+        Yields
+        ------
+        tuple of numpy.ndarray
+            The lengths of consecutive intervals of the grid, and a 2-D array of the
+            values of the step functions on these intervals, with a row for each
+            interval and a column for each step function.
+        """
+        inside = (self.step_points > lower) & (self.step_points < upper)
+        step_points = self.step_points[inside]
+        grid = np.unique(np.concatenate([step_points, _to_points([lower, upper])]))
+        lengths = _to_float(np.diff(grid))
+        # each step point sets the value of a step function from a row of the grid,
+        # which is carried forward to following rows
+        rows = np.searchsorted(grid, step_points)
+        order = np.argsort(rows, kind="stable")
+        rows = rows[order]
+        ids = self._ids()[inside][order]
+        values = self.values[inside][order]
+        current = self._limit(grid[:1], np.ones(len(self), dtype=bool))[:, 0]
+        size = len(self)
+        rows_per_chunk = max(1, _SAMPLE_CHUNK_SIZE // max(size, 1))
+        for start in range(0, len(lengths), rows_per_chunk):
+            end = min(start + rows_per_chunk, len(lengths))
+            first, last = np.searchsorted(rows, [start, end])
+            # the first row of the chunk holds the values carried forward
+            chunk = np.empty((end - start + 1, size))
+            chunk[0] = current
+            is_set = np.zeros(chunk.shape, dtype=bool)
+            is_set[0] = True
+            chunk_rows = rows[first:last] - start + 1
+            chunk[chunk_rows, ids[first:last]] = values[first:last]
+            is_set[chunk_rows, ids[first:last]] = True
+            sources = np.where(is_set, np.arange(len(chunk))[:, None], 0)
+            chunk = np.take_along_axis(chunk, np.maximum.accumulate(sources), axis=0)
+            current = chunk[-1]
+            yield lengths[start:end], chunk[1:]
+
+    def _pairwise_moments(self, lower, upper, centres, squares=False):
+        # for each pair of step functions, the length of the domain on which both
+        # are not null, and integrals over it of the first step function, the
+        # product of both, and optionally the square of the first step function,
+        # after subtracting the centres from the values
+        size = len(self)
+        moments = [np.zeros((size, size)) for _ in range(4 if squares else 3)]
+        for lengths, chunk in self._grid_chunks(lower, upper):
+            chunk = chunk - centres
+            notnull = ~np.isnan(chunk)
+            chunk[~notnull] = 0
+            weighted = chunk * lengths[:, None]
+            notnull = notnull.astype("float64")
+            moments[0] += (notnull * lengths[:, None]).T @ notnull
+            moments[1] += weighted.T @ notnull
+            moments[2] += weighted.T @ chunk
+            if squares:
+                moments[3] += (weighted * chunk).T @ notnull
+        return moments
+
+    def _bounded_moments(self, where, squares=False):
+        lower, upper = self._domain(where)
+        # values are centred, which does not change covariances, to limit the loss
+        # of precision when taking differences of the moments
+        centres = np.nan_to_num(self.mean())
+        moments = self._pairwise_moments(lower, upper, centres, squares)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return [moment / moments[0] for moment in moments[1:]]
+
+    def _hulls(self, initial_values, final_values):
+        """
+        Finds, for each pair of step functions, the first and last points at which
+        the first step function, masked where the second is null, changes value,
+        and likewise for the product of both.
+
+        Both can only change at the step points of either step function, so the
+        values of all step functions on the common grid are compared before and
+        after the step points of each.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Four 2-D arrays, with a row and a column for each step function, of
+            positions relative to the first step point.  Infinite where there is no
+            change.
+        """
+        size = len(self)
+        lower, upper = self.step_points.min(), self.step_points.max()
+        positions = _to_float(self.step_points - lower).astype("float64")
+        ids = self._ids()
+        previous = np.append(np.nan, self.values[:-1])
+        firsts = self.offsets[:-1][self.lengths > 0]
+        previous[firsts] = initial_values[ids[firsts]]
+        has_nulls = np.isnan(self.values).any() or np.isnan(initial_values).any()
+        if has_nulls:
+            first, last = np.full((size, size), np.inf), np.full((size, size), -np.inf)
+        else:
+            # step functions are only masked where they are null, so change at
+            # each of their own step points and no others
+            has_steps = self.lengths > 0
+            own_first, own_last = np.full(size, np.inf), np.full(size, -np.inf)
+            own_first[has_steps] = positions[self.offsets[:-1][has_steps]]
+            own_last[has_steps] = positions[self.offsets[1:][has_steps] - 1]
+            first = np.repeat(own_first[:, None], size, axis=1)
+            last = np.repeat(own_last[:, None], size, axis=1)
+        product_first, product_last = np.full((size, size), np.inf), np.full(
+            (size, size), -np.inf
+        )
+        rows = np.searchsorted(np.unique(self.step_points), self.step_points)
+        chunks = itertools.chain(
+            (chunk for _, chunk in self._grid_chunks(lower, upper)),
+            [final_values[None, :]],
+        )
+        before_row, start = initial_values, 0
+        for chunk in chunks:
+            end = start + len(chunk)
+            inside = np.flatnonzero((rows >= start) & (rows < end))
+            # the values of all step functions after, and before, the step points,
+            # with a row for each step point
+            before_chunk = np.vstack([before_row, chunk[:-1]])
+            after = chunk[rows[inside] - start]
+            before = before_chunk[rows[inside] - start]
+            before_row, start = chunk[-1], end
+            if not len(inside):
+                continue
+            owners = ids[inside]
+            own_after = self.values[inside][:, None]
+            own_before = previous[inside][:, None]
+            bounds = np.flatnonzero(np.append(True, owners[1:] != owners[:-1]))
+            owners = owners[bounds]
+            chunk_positions = positions[inside][:, None]
+
+            def reduce(changed):
+                # the first and last changes at the step points of each owner, with
+                # a row for each owner
+                return (
+                    np.minimum.reduceat(
+                        np.where(changed, chunk_positions, np.inf), bounds
+                    ),
+                    np.maximum.reduceat(
+                        np.where(changed, chunk_positions, -np.inf), bounds
+                    ),
+                )
+
+            if has_nulls:
+                # owners masked by each step function
+                owner_first, owner_last = reduce(
+                    _changed(_masked(own_after, after), _masked(own_before, before))
+                )
+                first[owners] = np.minimum(first[owners], owner_first)
+                last[owners] = np.maximum(last[owners], owner_last)
+                # each step function masked by the owners
+                other_first, other_last = reduce(
+                    _changed(_masked(after, own_after), _masked(before, own_before))
+                )
+                first[:, owners] = np.minimum(first[:, owners], other_first.T)
+                last[:, owners] = np.maximum(last[:, owners], other_last.T)
+            changed = _changed if has_nulls else np.not_equal
+            owner_first, owner_last = reduce(
+                changed(own_after * after, own_before * before)
+            )
+            product_first[owners] = np.minimum(product_first[owners], owner_first)
+            product_last[owners] = np.maximum(product_last[owners], owner_last)
+        product_first = np.minimum(product_first, product_first.T)
+        product_last = np.maximum(product_last, product_last.T)
+        return first, last, product_first, product_last
+
+    def _unbounded_moments(self, squares=False):
+        """
+        Calculates, for each pair of step functions, the means of the first step
+        function masked where the second is null, and of their product, as per
+        :meth:`Stairs.cov` with an unbounded domain.
+
+        Each mean is over the step points of the masked step function, or product,
+        after redundant step points are removed.  These differ for every pair, but
+        each step function is constant before its first step point and after its
+        last.  The integrals over the common domain of all step functions are
+        therefore calculated with matrix products, and the integrals of these
+        constants outside of the step points of each pair subtracted.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            2-D arrays, with a row and a column for each step function, of the means
+            of the masked step functions, their products, and optionally the squares
+            of the masked step functions.
+        """
+        size = len(self)
+        if len(np.unique(self.step_points)) < 2:
+            return [np.full((size, size), np.nan) for _ in range(3 if squares else 2)]
+        lower, upper = self.step_points.min(), self.step_points.max()
+        span = float(_to_float(np.array([upper - lower]))[0])
+        durations, *integrals = self._pairwise_moments(
+            lower, upper, np.zeros(size), squares
+        )
+        initial_values = np.where(self.isna, np.nan, self.initial_values)
+        final_values = initial_values.copy()
+        has_steps = self.lengths > 0
+        final_values[has_steps] = self.values[self.offsets[1:][has_steps] - 1]
+        first, last, product_first, product_last = self._hulls(
+            initial_values, final_values
+        )
+
+        def mean(integral, first, last, initial, final):
+            # the step function is constant before first and after last
+            defined = first < last
+            before = np.where(defined, first, 0)
+            after = np.where(defined, span - last, 0)
+            initial_notnull, final_notnull = ~np.isnan(initial), ~np.isnan(final)
+            integral = (
+                integral
+                - np.where(initial_notnull, initial * before, 0)
+                - np.where(final_notnull, final * after, 0)
+            )
+            duration = durations - initial_notnull * before - final_notnull * after
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(defined, integral / duration, np.nan)
+
+        masked = [
+            _masked(values[:, None], values[None, :])
+            for values in (initial_values, final_values)
+        ]
+        means = [mean(integrals[0], first, last, *masked)]
+        means.append(
+            mean(
+                integrals[1],
+                product_first,
+                product_last,
+                np.outer(initial_values, initial_values),
+                np.outer(final_values, final_values),
+            )
+        )
+        if squares:
+            means.append(mean(integrals[2], first, last, *(m**2 for m in masked)))
+        return means
+
+    def _irregular(self):
+        # step functions which have infinite values, or redundant step points, for
+        # which the unbounded moments do not follow Stairs.cov
+        ids = self._ids()
+        previous = np.append(np.nan, self.values[:-1])
+        firsts = self.offsets[:-1][self.lengths > 0]
+        previous[firsts] = self.initial_values[ids[firsts]]
+        irregular = np.isinf(self.initial_values)
+        invalid = np.isinf(self.values) | ~_changed(self.values, previous)
+        irregular[ids[invalid]] = True
+        return np.flatnonzero(irregular & ~self.isna)
+
+    def _clip(self, where):
+        # clipping step functions before they are masked and multiplied is
+        # equivalent to clipping the results, as per Stairs.cov
+        lower, upper = _replace_none_with_infs(where)
+        if lower == -inf and upper == inf:
+            return self
+        return _StairsColumns.from_stairs(
+            [None if s is None else s.clip(lower, upper) for s in self.to_objects()]
+        )
+
+    def _pairwise(self, method, where, result):
+        # replaces the results for irregular step functions with those of the
+        # Stairs method
+        stairs = self.to_objects()
+        for i in self._irregular():
+            for j in range(len(self)):
+                if stairs[j] is not None:
+                    result[i, j] = result[j, i] = method(
+                        stairs[i], stairs[j], where=where
+                    )
+        return result
+
+    def cov(self, where):
+        """
+        Calculates the covariance of each pair of step functions, on the domain
+        where both are not null.
+
+        Parameters
+        ----------
+        where : tuple
+            The interval on which the covariance is calculated.  If it is
+            unbounded, then the means are over the step points of each step
+            function, and of their product, as per :meth:`Stairs.cov`.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-D array, with a row and a column for each step function.
+        """
+        if not _is_bounded(where):
+            # results for infinite values are replaced by _pairwise
+            with np.errstate(invalid="ignore"):
+                means, products = self._clip(where)._unbounded_moments()
+                result = products - means * means.T
+            return self._pairwise(Stairs.cov, where, result)
+        means, products = self._bounded_moments(where)
+        return products - means * means.T
+
+    def corr(self, where):
+        """
+        Calculates the Pearson correlation coefficient of each pair of step
+        functions, on the domain where both are not null.
+
+        Parameters
+        ----------
+        where : tuple
+            The interval on which the correlation is calculated.  If it is
+            unbounded, then the means are over the step points of each step
+            function, and of their product, as per :meth:`Stairs.corr`.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-D array, with a row and a column for each step function.  Null
+            where either step function is constant, and one on the diagonal.
+        """
+        bounded = _is_bounded(where)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if bounded:
+                means, products, second_moments = self._bounded_moments(where, True)
+            else:
+                # results for infinite values are replaced by _pairwise
+                columns = self._clip(where)
+                means, products, second_moments = columns._unbounded_moments(True)
+            covariances = products - means * means.T
+            variances = second_moments - means**2
+            # variances of constant step functions are zero, up to rounding
+            variances[variances <= 1e-12 * second_moments] = 0
+            denominators = np.sqrt(variances * variances.T)
+            result = np.where(denominators == 0, np.nan, covariances / denominators)
+        if not bounded:
+            result = self._pairwise(Stairs.corr, where, result)
+        np.fill_diagonal(result, 1)
+        return result
+
+    def arithmetic(self, name, other):
+        """
+        Applies an arithmetic operator with a scalar, as per the corresponding
+        :class:`Stairs` method.
+
+        Parameters
+        ----------
+        name : str
+            One of "add", "subtract", "multiply", "divide", or these prefixed
+            with "r" for reflected operators.
+        other : int or float
+
+        Returns
+        -------
+        _StairsColumns
+        """
+        if np.isnan(other) or (name == "divide" and other == 0):
+            return self._without_step_points(np.nan)
+        reflected = name.startswith("r")
+        func = {
+            "add": np.add,
+            "subtract": np.subtract,
+            "multiply": np.multiply,
+            "divide": np.divide,
+        }[name[1:] if reflected else name]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if reflected:
+                initial_values = func(other, self.initial_values)
+                values = func(other, self.values)
+            else:
+                initial_values = func(self.initial_values, other)
+                values = func(self.values, other)
+        if name in ("multiply", "rmultiply", "divide", "rdivide"):
+            initial_values[~np.isfinite(initial_values)] = np.nan
+        if name in ("divide", "rdivide"):
+            values[values == np.inf] = np.nan
+        return self._with_values(initial_values, values)
+
+    def negate(self):
+        return self._with_values(-self.initial_values, -self.values)
+
+
+def _to_float(array):
+    if np.issubdtype(array.dtype, np.timedelta64):
+        return array.view("int64").astype("float64")
+    return array
@@ -185,11 +185,11 @@ x : scalar or vector data
 side : {{'left', 'right'}}, default 'right'
     if points where step changes occur do not coincide with x then this parameter
     has no effect.  Where a step changes occurs at a point given by x, this parameter
-    determines if the step function is evaluated at the interval to the left, or the right.
+    determines if the step function is evaluated at the interval to the left, or the right.{extra_params}
 
 Returns
 -------
-:class:`pandas.DataFrame`
+{return_type}
     {return_desc}
 
 See Also
@@ -225,6 +225,10 @@ Examples
 1  0.0  NaN -1.0
 """
 
+_as_frame_param = """
+as_frame : bool, default True
+    If False then a 2-D :class:`numpy.ndarray` is returned, rather than a :class:`pandas.DataFrame`."""
+
 _collection_param = """----------
 collection : array-like, dictionary or pandas.Series
     The Stairs instances at which to evaluate"""
@@ -260,8 +264,9 @@ def _make_limit_docstring(which):
         setup = 'stairs = pd.Series([s2, s3], dtype="Stairs")'
         calc_preamble = "stairs.sc.limit("
         return_desc = """A dataframe, where rows correspond to the Stairs instances in the :class:`pandas.Series`.
-    and columns correspond to the points in *x*.  The dataframe will have the same index as the Series."""
-        see_also = ":meth:`staircase.limit`, :meth:`staircase.StairsArray.limit`, :meth:`staircase.core.arrays.accessor.StairsAccessor.sample`"
+    and columns correspond to the points in *x*.  The dataframe will have the same index as the Series.
+    If *as_frame* is False then a 2-D array of the same values."""
+        see_also = ":meth:`staircase.limit`, :meth:`staircase.StairsArray.limit_matrix`, :meth:`staircase.StairsArray.limit`, :meth:`staircase.core.arrays.accessor.StairsAccessor.sample`"
     elif which == "array":
         collection_param = "----------"
         setup = "stairs = sc.StairsArray([s2, s3])"
@@ -269,8 +274,14 @@ def _make_limit_docstring(which):
         return_desc = """A dataframe, where rows correspond to the Stairs instances in the :class:`StairsArray`.
     and columns correspond to the points in *x*."""
         see_also = ":meth:`staircase.limit`, :meth:`staircase.core.arrays.accessor.StairsAccessor.limit`, :meth:`staircase.StairsArray.sample`"
+    extra_params, return_type = "", ":class:`pandas.DataFrame`"
+    if which == "accessor":
+        extra_params = _as_frame_param
+        return_type = ":class:`pandas.DataFrame` or :class:`numpy.ndarray`"
     doc = _limit_base.format(
         collection_param=collection_param,
+        extra_params=extra_params,
+        return_type=return_type,
         setup=setup,
         calc_preamble=calc_preamble,
         return_desc=return_desc,
@@ -287,11 +298,11 @@ Takes a collection of Stairs instances and evaluates their values across a set o
 Parameters
 {collection_param}
 x : scalar or vector data
-    The points at which to sample the Stairs instances.  Must belong to the step function domain.
+    The points at which to sample the Stairs instances.  Must belong to the step function domain.{extra_params}
 
 Returns
 -------
-:class:`pandas.DataFrame`
+{return_type}
     {return_desc}
 
 See Also
@@ -353,8 +364,9 @@ def _make_sample_docstring(which):
         setup = 'stairs = pd.Series([s2, s3], dtype="Stairs")'
         calc_preamble = "stairs.sc.sample("
         return_desc = """A dataframe, where rows correspond to the Stairs instances in the :class:`pandas.Series`.
-    and columns correspond to the points in *x*.  The dataframe will have the same index as the Series."""
-        see_also = ":meth:`staircase.sample`, :meth:`staircase.StairsArray.sample`, :meth:`staircase.core.arrays.accessor.StairsAccessor.limit`"
+    and columns correspond to the points in *x*.  The dataframe will have the same index as the Series.
+    If *as_frame* is False then a 2-D array of the same values."""
+        see_also = ":meth:`staircase.sample`, :meth:`staircase.StairsArray.sample_matrix`, :meth:`staircase.StairsArray.sample`, :meth:`staircase.core.arrays.accessor.StairsAccessor.limit`"
     elif which == "array":
         collection_param = "----------"
         setup = "stairs = sc.StairsArray([s2, s3])"
@@ -362,8 +374,14 @@ def _make_sample_docstring(which):
         return_desc = """A dataframe, where rows correspond to the Stairs instances in the :class:`StairsArray`.
     and columns correspond to the points in *x*."""
         see_also = ":meth:`staircase.sample`, :meth:`staircase.core.arrays.accessor.StairsAccessor.sample`, :meth:`staircase.StairsArray.limit`"
+    extra_params, return_type = "", ":class:`pandas.DataFrame`"
+    if which == "accessor":
+        extra_params = _as_frame_param
+        return_type = ":class:`pandas.DataFrame` or :class:`numpy.ndarray`"
     doc = _sample_base.format(
         collection_param=collection_param,
+        extra_params=extra_params,
+        return_type=return_type,
         setup=setup,
         calc_preamble=calc_preamble,
         return_desc=return_desc,
@@ -377,12 +395,17 @@ def _make_sample_docstring(which):
 _cov_corr_base = """
 Calculates the {calc_name} matrix for a collection of :class:`Stairs` instances
 
+The {calc_name} of each pair of step functions is calculated where neither is null, as per
+:meth:`Stairs.{method}`.  The step functions are evaluated together, on intervals between the
+step points of all of them.  If the domain is unbounded then, as per :meth:`Stairs.{method}`, each
+mean is over the step points of the step function, or product, it is taken of.  These are found by
+comparing the values of each step function at the step points of every other.
+
 Parameters
 {collection_param}
-lower : int, float or pandas.Timestamp
-    lower bound of the interval on which to perform the calculation
-upper : int, float or pandas.Timestamp
-    upper bound of the interval on which to perform the calculation
+where : tuple or list of length two, optional
+    Indicates the domain interval over which to perform the calculation.
+    Default is (-sc.inf, sc.inf) or equivalently (None, None).
 
 Returns
 -------
@@ -461,6 +484,7 @@ def _make_cov_corr_docstring(which, method):
     doc = _cov_corr_base.format(
         collection_param=collection_param,
         calc_name=calc_name,
+        method=method,
         see_also=see_also,
         examples=examples.format(setup=setup, calc_method=calc_method),
     )
@@ -713,3 +737,225 @@ Examples
     ...     stair_instance.plot(ax=ax, arrows=True)
     ...     ax.set_title(title)
 """
+
+
+from_columns_docstring = """
+Creates a :class:`staircase.StairsArray` from the concatenated step points and values of many step functions.
+
+The step functions are stored in columns, rather than as :class:`staircase.Stairs` instances, which
+requires far less memory when there are many of them.  The step function at position *i* has the step
+points and values given by the slice ``offsets[i]:offsets[i+1]`` of *step_points* and *values*.
+
+Parameters
+----------
+step_points : array-like
+    The step points of all step functions, concatenated.  The step points of each step function
+    must be strictly increasing.  If a timezone aware :class:`pandas.DatetimeIndex` then the timezone
+    is used for all step functions.
+values : array-like
+    The values of all step functions, concatenated.  The value at each step point is the value of the step
+    function on the interval which follows it.
+offsets : array-like of int
+    Positions in *step_points* at which each step function starts, followed by the length of *step_points*.
+initial_values : float or array-like, default 0
+    The value of each step function, before its first step point.
+closed : {"left", "right"} or array-like, default "left"
+    Indicates whether the intervals of each step function are left-closed or right-closed.
+tz : tzinfo or str, optional
+    The timezone of the step points, if they are naive datetimes in UTC.
+
+Returns
+-------
+:class:`staircase.StairsArray`
+
+See Also
+--------
+:meth:`staircase.StairsArray.to_columnar`
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> arr = sc.StairsArray.from_columns(
+...     step_points=[1, 3, 2, 4, 5],
+...     values=[1, 0, -1, 1, 0],
+...     offsets=[0, 2, 5],
+... )
+>>> arr.sample([0, 2, 4])
+     0    2    4
+0  0.0  1.0  0.0
+1  0.0 -1.0  1.0
+"""
+
+to_columnar_docstring = """
+Returns a :class:`staircase.StairsArray` which stores its step functions in columns.
+
+The step points, and values, of the step functions are concatenated into single arrays, which requires far
+less memory than :class:`staircase.Stairs` instances when there are many step functions.  Sampling,
+statistics and arithmetic with scalars are then calculated for all step functions at once.  Step functions
+are created when elements are accessed.
+
+Returns
+-------
+:class:`staircase.StairsArray`
+
+Raises
+------
+ValueError
+    If the step points of the step functions cannot be concatenated, for example if they are datetimes
+    in different timezones.
+
+See Also
+--------
+:meth:`staircase.StairsArray.from_columns`
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> arr = sc.StairsArray([s1, s2]).to_columnar()
+>>> arr.sample([1, 2, 3])
+     1    2    3
+0  1.0  0.0  1.0
+1  0.5  0.0 -1.0
+"""
+
+_elementwise_base = """
+Calculates the {calc_name} of each step function in the :class:`pandas.Series`.
+
+The calculation is performed for all step functions at once.
+
+Returns
+-------
+:class:`pandas.Series`
+    With the same index as the Series.  {null_desc}
+
+See Also
+--------
+:meth:`staircase.Stairs.{method}`
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> stairs = pd.Series([s1, s2], dtype="Stairs")
+>>> stairs.sc.{method}()
+{result}
+"""
+
+
+def make_elementwise_docstring(method):
+    calc_name, null_desc, result = {
+        "integral": (
+            "integral",
+            "Null for step functions with fewer than two step points.",
+            "0    1.0\n1   -1.5\ndtype: float64",
+        ),
+        "mean": (
+            "mean",
+            "Null for step functions with fewer than two step points.",
+            "0    0.250000\n1   -0.272727\ndtype: float64",
+        ),
+        "max": (
+            "maximum value",
+            "Null for step functions whose values are all null.",
+            "0    1.0\n1    0.5\ndtype: float64",
+        ),
+        "min": (
+            "minimum value",
+            "Null for step functions whose values are all null.",
+            "0   -1.0\n1   -1.0\ndtype: float64",
+        ),
+    }[method]
+    return _elementwise_base.format(
+        calc_name=calc_name, null_desc=null_desc, method=method, result=result
+    )
+
+
+describe_docstring = """
+Generates descriptive statistics of each step function in the :class:`pandas.Series`,
+as per :meth:`staircase.Stairs.describe`.
+
+The calculation is performed for all step functions at once.
+
+Parameters
+----------
+percentiles : array-like of float, default (25, 50, 75)
+    The percentiles to include in output.  Numbers should be in the range 0 to 100.
+
+Returns
+-------
+:class:`pandas.DataFrame`
+    With the same index as the Series, and a column for each statistic.  Null for
+    missing step functions.
+
+See Also
+--------
+:meth:`staircase.Stairs.describe`
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> stairs = pd.Series([s1, s2], dtype="Stairs")
+>>> stairs.sc.describe()
+   unique      mean       std  min  25%  50%  75%  max
+0       3  0.250000  0.829156 -1.0 -0.5  0.5  1.0  1.0
+1       3 -0.272727  0.686349 -1.0 -1.0  0.0  0.5  0.5
+"""
+
+
+_matrix_base = """
+Evaluates the {calc_name} of the step functions across a set of points, as a 2-D array.
+
+The step functions are evaluated at all points at once, without creating a :class:`pandas.Series`
+for each of them, which makes this method suitable for creating features from many step functions.
+The values are the same as those of :meth:`staircase.StairsArray.{method}`.
+
+Parameters
+----------
+x : scalar or vector data
+    The points at which to evaluate the step functions.  Must belong to the step function domain.{side_param}
+
+Returns
+-------
+:class:`numpy.ndarray`
+    A 2-D array of floats, where rows correspond to the Stairs instances in the :class:`StairsArray`
+    and columns correspond to the points in *x*.  Rows for missing step functions are null.
+
+See Also
+--------
+:meth:`staircase.StairsArray.{method}`, :meth:`staircase.core.arrays.accessor.StairsAccessor.{method}`
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> stairs = sc.StairsArray([s2, s3])
+>>> {calc}
+{result}
+"""
+
+_matrix_side_param = """
+side : {'left', 'right'}, default 'right'
+    If points where step changes occur do not coincide with x then this parameter
+    has no effect.  Where a step changes occurs at a point given by x, this parameter
+    determines if the step function is evaluated at the interval to the left, or the right."""
+
+
+def make_matrix_docstring(method):
+    if method == "sample":
+        calc_name, side_param = "values", ""
+        calc = "stairs.sample_matrix([2,3,4])"
+        result = "array([[ 0., -1., -1.],\n       [ 0., nan, -1.]])"
+    else:
+        calc_name, side_param = "limits", _matrix_side_param
+        calc = 'stairs.limit_matrix([2,3,4], side="left")'
+        result = "array([[ 0.5,  0. , -1. ],\n       [ 1. ,  nan,  1. ]])"
+    return _matrix_base.format(
+        calc_name=calc_name,
+        method=method,
+        side_param=side_param,
+        calc=calc,
+        result=result,
+    )
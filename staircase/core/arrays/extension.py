@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import numbers
 from collections.abc import Iterable
+from functools import partial
 from typing import Any, Callable, Type
 
 import matplotlib.pyplot as plt
@@ -15,10 +16,13 @@ from pandas.api.extensions import (
 from pandas.core.dtypes.inference import is_dict_like, is_list_like
 
 from staircase.constants import inf
+from staircase.core.arrays import aggregation as aggregations
 from staircase.core.arrays import docstrings
+from staircase.core.arrays.columnar import _StairsColumns
 from staircase.core.stairs import Stairs
 from staircase.core.stats.statistic import corr as _corr
 from staircase.core.stats.statistic import cov as _cov
+from staircase.util import _is_bounded, _split_index
 from staircase.util._decorators import Appender
 
 
@@ -45,54 +49,94 @@ def _isna(value: pd.Series) -> pd.Series:
     return pd.isna(value)
 
 
-def _make_logical(func: Callable) -> Callable:
-    def logical_func(x, axis=0):
-        return np.where(
-            np.logical_or.reduce(np.isnan(x), axis=axis),
-            np.nan,
-            func.reduce(x, axis=axis),
-        )
-
-    return logical_func
-
-
 class StairsArray(ExtensionArray):
 
     _dtype = StairsDtype()
     ndim = 1
 
     def __init__(self, data):
-        if isinstance(data, self.__class__):
-            self.data = data.data
+        # step functions are stored either as an array of Stairs objects, or in
+        # columns (see staircase.core.arrays.columnar), in which case the objects
+        # are only created when required
+        self._columns = None
+        if isinstance(data, _StairsColumns):
+            self._data = None
+            self._columns = data
+        elif isinstance(data, self.__class__):
+            self._data = data._data
+            self._columns = data._columns
         elif isinstance(data, np.ndarray):
             if not data.ndim == 1:
                 raise ValueError(
                     "'data' should be a 1-dimensional array of Stairs objects."
                 )
-            self.data = data
+            self._data = data
         elif is_dict_like(data):
-            self.data = np.array([data[k] for k in data.keys()])
+            self._data = np.array([data[k] for k in data.keys()])
         elif isinstance(data, Stairs) or is_list_like(data):
-            self.data = np.array(data, ndmin=1)
+            self._data = np.array(data, ndmin=1)
         else:
             raise TypeError("'data' should be array of Stairs objects.")
 
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._columns.to_objects()
+        return self._data
+
+    @classmethod
+    @Appender(docstrings.from_columns_docstring, join="\n", indents=1)
+    def from_columns(
+        cls, step_points, values, offsets, initial_values=0, closed="left", tz=None
+    ):
+        if isinstance(step_points, (pd.Index, pd.Series)):
+            step_points, index_tz = _split_index(pd.Index(step_points))
+            tz = index_tz if tz is None else tz
+        return cls(
+            _StairsColumns.from_arrays(
+                step_points, values, offsets, initial_values, closed, tz
+            )
+        )
+
+    @Appender(docstrings.to_columnar_docstring, join="\n", indents=1)
+    def to_columnar(self):
+        if self._columns is not None:
+            return self.copy()
+        return StairsArray(_StairsColumns.from_stairs(self._data))
+
+    def _get_columns(self):
+        # the step functions in columns, or None if they cannot be stored in columns
+        if self._columns is not None:
+            return self._columns
+        try:
+            return _StairsColumns.from_stairs(self._data)
+        except ValueError:
+            return None
+
     @property
     def dtype(self) -> type:
         return self._dtype
 
     def __len__(self) -> int:
-        return len(self.data)
+        if self._columns is not None:
+            return len(self._columns)
+        return len(self._data)
 
     def __getitem__(self, idx: int) -> Any:
         if isinstance(idx, numbers.Integral):
+            if self._columns is not None:
+                return self._columns.stairs(range(len(self))[idx])
             return self.data[idx]
         elif isinstance(idx, (Iterable, slice)):
+            if self._columns is not None:
+                return StairsArray(self._columns.take(np.arange(len(self))[idx]))
             return StairsArray(self.data[idx])
         else:
             raise TypeError("Index type not supported", idx)
 
     def __setitem__(self, key, value):
+        # step functions in columns cannot be replaced individually
+        self._data, self._columns = self.data, None
         if isinstance(value, Stairs) or _isna(value):
             if _isna(value):
                 # internally only use None as missing value indicator
@@ -105,18 +149,39 @@ class StairsArray(ExtensionArray):
             else:
                 self.data[key] = value
 
+    def __reduce__(self):
+        # arrays which can be stored in columns are pickled in the binary format
+        # of staircase.io
+        from staircase.io.pickle import _reduce
+
+        try:
+            return _reduce(self)
+        except ValueError:
+            return StairsArray, (self.data,)
+
     def copy(self):
+        if self._columns is not None:
+            return StairsArray(self._columns.copy())
         return StairsArray(self.data.copy())
 
     def take(self, indices, allow_fill=False, fill_value=None):
         from pandas.api.extensions import take
 
+        if self._columns is not None and (
+            not allow_fill or fill_value is None or _isna(fill_value)
+        ):
+            positions = take(
+                np.arange(len(self)), indices, allow_fill=allow_fill, fill_value=-1
+            )
+            return StairsArray(self._columns.take(positions, allow_fill=allow_fill))
         result = take(self.data, indices, allow_fill=allow_fill, fill_value=fill_value)
         if allow_fill and fill_value is None:
             result[pd.isna(result)] = None
         return StairsArray(result)
 
     def isna(self):
+        if self._columns is not None:
+            return self._columns.isna.copy()
         return np.array([g is None for g in self.data], dtype="bool")
 
     def bool(self):
@@ -135,10 +200,19 @@ class StairsArray(ExtensionArray):
 
     @property
     def nbytes(self):
+        if self._columns is not None:
+            return self._columns.nbytes
         return self._itemsize * len(self)
 
     @classmethod
     def _concat_same_type(cls, to_concat):
+        if all(array._columns is not None for array in to_concat):
+            try:
+                return cls(
+                    _StairsColumns.concat([array._columns for array in to_concat])
+                )
+            except ValueError:
+                pass
         return cls(np.concatenate([array.data for array in to_concat]))
 
     @Appender(docstrings.make_docstring("array", "mean"), join="\n", indents=1)
@@ -163,6 +237,9 @@ class StairsArray(ExtensionArray):
 
     @Appender(docstrings.make_docstring("array", "agg"), join="\n", indents=1)
     def agg(self, func):
+        aggregation = aggregations.get_aggregation(func)
+        if aggregation is not None:
+            return aggregation(self.data)
         index = pd.Index(
             np.unique(
                 np.concatenate(
@@ -177,33 +254,47 @@ class StairsArray(ExtensionArray):
         if new_values.dtype == "bool":
             new_values = new_values.astype(int)
 
+        step_points, tz = _split_index(index)
         return Stairs._new(
             initial_value=func([s.initial_value for s in self.data]),
-            data=pd.Series(
-                new_values,
-                index=index,
-                name="value",
-            ).to_frame(),
+            step_points=step_points,
+            values=new_values,
             closed=self.data[0].closed,
+            tz=tz,
         )._remove_redundant_step_points()
 
     @Appender(docstrings.make_docstring("array", "sample"), join="\n", indents=1)
     def sample(self, x) -> pd.Series:
-        array = pd.Series(self.data)
-        return array.apply(Stairs.sample, x=x, include_index=True)
+        return _make_frame(self.sample_matrix(x), x)
 
     @Appender(docstrings.make_docstring("array", "limit"), join="\n", indents=1)
     def limit(self, x, side="right"):
-        array = pd.Series(self.data)
-        return array.apply(Stairs.limit, x=x, side=side, include_index=True)
+        return _make_frame(self.limit_matrix(x, side), x)
+
+    @Appender(docstrings.make_matrix_docstring("sample"), join="\n", indents=1)
+    def sample_matrix(self, x):
+        columns = self._get_columns()
+        if columns is not None:
+            return columns.sample(x)
+        return _stack_rows([s.sample if s is not None else None for s in self.data], x)
+
+    @Appender(docstrings.make_matrix_docstring("limit"), join="\n", indents=1)
+    def limit_matrix(self, x, side="right"):
+        columns = self._get_columns()
+        if columns is not None:
+            return columns.limit(x, side)
+        return _stack_rows(
+            [partial(s.limit, side=side) if s is not None else None for s in self.data],
+            x,
+        )
 
     @Appender(docstrings.make_docstring("array", "logical_or"), join="\n", indents=1)
     def logical_or(self):
-        return self.agg(_make_logical(np.logical_or))
+        return aggregations.logical_or_stairs(self.data)
 
     @Appender(docstrings.make_docstring("array", "logical_and"), join="\n", indents=1)
     def logical_and(self):
-        return self.agg(_make_logical(np.logical_and))
+        return aggregations.logical_and_stairs(self.data)
 
     @Appender(docstrings.make_docstring("array", "plot"), join="\n", indents=1)
     def plot(self, ax=None, labels=None, **kwargs):
@@ -232,11 +323,44 @@ class StairsArray(ExtensionArray):
 
     @Appender(docstrings.negate_docstring, join="\n", indents=1)
     def negate(self):
+        if self._columns is not None:
+            return StairsArray(self._columns.negate())
         return StairsArray(-self.data)
 
     __neg__ = negate
 
 
+def _stack_rows(funcs, x):
+    # a 2-D array with a row for each function evaluated at points x, where rows
+    # without a function are null
+    if not is_list_like(x):
+        x = [x]
+    result = np.full((len(funcs), len(x)), np.nan)
+    for row, func in zip(result, funcs):
+        if func is not None:
+            row[:] = func(x)
+    return result
+
+
+def _make_frame(values, x):
+    # a dataframe of values of step functions, with a column for each point in x
+    if not is_list_like(x):
+        x = [x]
+    return pd.DataFrame(values, columns=pd.Index(x))
+
+
+_arithmetic_funcstrs = (
+    "add",
+    "subtract",
+    "multiply",
+    "divide",
+    "radd",
+    "rsubtract",
+    "rmultiply",
+    "rdivide",
+)
+
+
 def _make_binary_func(func_str: str) -> Callable:
 
     stairs_func = getattr(Stairs, func_str)
@@ -244,7 +368,13 @@ def _make_binary_func(func_str: str) -> Callable:
 
     @Appender(docstring, join="\n", indents=1)
     def func(self, other):
-        if isinstance(other, (int, float, Stairs)):
+        if (
+            self._columns is not None
+            and func_str in _arithmetic_funcstrs
+            and isinstance(other, (int, float))
+        ):
+            result = StairsArray(self._columns.arithmetic(func_str, other))
+        elif isinstance(other, (int, float, Stairs)):
             result = StairsArray([stairs_func(s, other) for s in self.data])
         elif is_list_like(other):
             if len(other) != len(self):
@@ -289,10 +419,14 @@ for funcstr in (
 
 
 def _make_corr_cov_func(
-    docstring: str, stairs_method: Callable, assume_ones_diagonal: int
+    docstring: str, name: str, stairs_method: Callable, assume_ones_diagonal: int
 ) -> Callable:
     @Appender(docstring, join="\n", indents=1)
     def func(self, where=(-inf, inf)):
+        columns = self._get_columns()
+        # all step functions are evaluated on a common grid at once
+        if columns is not None:
+            return getattr(columns, name)(where)
         size = len(self.data)
         vals = np.ones(shape=(size, size))
         for i in range(size):
@@ -305,8 +439,14 @@ def _make_corr_cov_func(
 
 
 StairsArray.corr = _make_corr_cov_func(
-    docstrings.make_docstring("array", "corr"), _corr, assume_ones_diagonal=True
+    docstrings.make_docstring("array", "corr"),
+    "corr",
+    _corr,
+    assume_ones_diagonal=True,
 )
 StairsArray.cov = _make_corr_cov_func(
-    docstrings.make_docstring("array", "cov"), _cov, assume_ones_diagonal=False
+    docstrings.make_docstring("array", "cov"),
+    "cov",
+    _cov,
+    assume_ones_diagonal=False,
 )
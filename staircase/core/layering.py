@@ -16,6 +16,7 @@ from pandas.api.types import (
 
 from staircase.constants import Inf, NegInf
 from staircase.docstrings import examples
+from staircase.util import _split_index
 from staircase.util._decorators import Appender
 
 
@@ -98,38 +99,197 @@ def _extract_from_frame(frame=None, start=None, end=None, value=None):
     return start, end, value
 
 
+def _sum_deltas_by_step_point(step_points, deltas):
+    """
+    Sums deltas which share a step point, using a sort and reduce.
+
+    Null step points are expected to have been removed.
+
+    Parameters
+    ----------
+    step_points : list of numpy.ndarray
+        Step points, each array being sorted or unsorted.
+    deltas : list of numpy.ndarray
+        Deltas corresponding to *step_points*.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Sorted unique step points, and the summed deltas.
+    """
+    pairs = [(points, d) for points, d in zip(step_points, deltas) if len(points)]
+    if not pairs:
+        return None, None
+    step_points = np.concatenate([points for points, _ in pairs])
+    deltas = np.concatenate([d for _, d in pairs])
+    # a stable sort (timsort) merges already sorted runs, such as existing step
+    # points, in linear time
+    order = np.argsort(step_points, kind="stable")
+    step_points = step_points[order]
+    deltas = deltas[order]
+    boundaries = np.flatnonzero(np.append(True, step_points[1:] != step_points[:-1]))
+    return step_points[boundaries], np.add.reduceat(deltas, boundaries)
+
+
+def _sum_deltas_by_step_point_groupby(step_points, deltas):
+    # reference implementation for _sum_deltas_by_step_point
+    series = pd.concat(
+        [pd.Series(d, index=points) for points, d in zip(step_points, deltas)]
+    )
+    if series.empty:
+        return None, None
+    summed = series.groupby(series.index).sum()
+    return np.asarray(summed.index.values), summed.to_numpy()
+
+
+def _merge_pending_layers(self):
+    """
+    Merges the buffered step points and deltas, from layering single intervals
+    and from in-place addition or subtraction of step functions, into the step
+    function.
+
+    Parameters
+    ----------
+    self : :class:`Stairs`
+
+    Returns
+    -------
+    None
+    """
+    # the buffers are only cleared once the merge has succeeded
+    pending, pending_arrays = self._pending_layers, self._pending_arrays
+    step_points, deltas, tz = [], [], None
+    if pending:
+        points, pending_deltas = zip(*pending)
+        points, tz = _split_index(pd.Index(points))
+        step_points.append(points)
+        deltas.append(np.array(pending_deltas, dtype="float64"))
+    for points, pending_deltas, points_tz in pending_arrays:
+        step_points.append(points)
+        deltas.append(pending_deltas)
+        tz = tz if tz is not None else points_tz
+    if self._stored_step_points is not None:
+        step_points.insert(0, self._stored_step_points)
+        deltas.insert(0, self._stored_deltas.astype("float64"))
+        tz = self._stored_tz
+    step_points, deltas = _sum_deltas_by_step_point(step_points, deltas)
+    if step_points is not None:
+        if pending_arrays:
+            # as for the addition of step functions, all redundant step points
+            # are removed
+            keep = deltas != 0
+        else:
+            # only step points which have been layered are removed if their
+            # deltas cancel
+            keep = (deltas != 0) | ~np.isin(step_points, points)
+        step_points, deltas = step_points[keep], deltas[keep]
+    self._pending_layers, self._pending_arrays = [], []
+    self._pending_arrays_size = 0
+    self._set_arrays(step_points, deltas, None, tz)
+
+
+def _stored_has_na(self):
+    # buffered deltas are never null, so only the stored arrays are checked
+    if np.isnan(self.initial_value):
+        return True
+    if self._stored_values is not None:
+        return bool(np.isnan(self._stored_values).any())
+    if self._stored_deltas is not None:
+        return bool(np.isnan(self._stored_deltas).any())
+    return False
+
+
+def _layer_with_na(self, start, end, value):
+    # deltas cannot be summed across null values, so combine via values instead
+    layered = self.__class__(closed=self._closed).layer(start, end, value)
+    result = self + layered
+    self.initial_value = result.initial_value
+    self._set_arrays(result._step_points, result._deltas, result._values, result._tz)
+    return self
+
+
+_POINT_KINDS = {"M": "datetime", "m": "timedelta", "n": "numeric"}
+
+
+def _point_type(point):
+    # the kind of a scalar step point, and its timezone if it is a datetime
+    if is_number(point):
+        return "n", None
+    if isinstance(point, (datetime.datetime, np.datetime64)):
+        return "M", getattr(point, "tzinfo", None)
+    if isinstance(point, (datetime.timedelta, np.timedelta64)):
+        return "m", None
+    return None, None
+
+
+def _check_scalar_points(self, start, end):
+    """
+    Checks that single interval end points are comparable with the step points
+    of the step function, before they are buffered.
+
+    Layering is deferred, so an incompatible point would otherwise only be
+    detected when the buffer is merged.  Timezone aware datetimes are converted
+    to the timezone of the step function.
+
+    Returns
+    -------
+    tuple
+        The start and end points.
+    """
+    if self._stored_step_points is not None:
+        kind = self._stored_step_points.dtype.kind
+        kind = "n" if kind in "biuf" else kind if kind in "Mm" else None
+        expected = kind, self._stored_tz
+    elif self._pending_layers:
+        expected = _point_type(self._pending_layers[0][0])
+    else:
+        expected = None
+    points = []
+    for point in (start, end):
+        if point is not None:
+            point_type = _point_type(point)
+            if expected is None:
+                expected = point_type
+            elif point_type != expected and None not in (point_type[0], expected[0]):
+                if point_type[0] != expected[0]:
+                    raise TypeError(
+                        f"{_POINT_KINDS[point_type[0]]} step points cannot be layered "
+                        f"onto {_POINT_KINDS[expected[0]]} step points"
+                    )
+                if (point_type[1] is None) != (expected[1] is None):
+                    raise TypeError("Cannot compare tz-naive and tz-aware timestamps")
+                if point_type[1] is not None:
+                    point = pd.Timestamp(point).tz_convert(expected[1])
+        points.append(point)
+    return tuple(points)
+
+
 def _layer_scalar(self, start, end, value):
     _check_args_types(start, end)
+    start, end = _check_scalar_points(self, start, end)
 
     if start is not None and end is not None and start == end:
         return self
 
-    if self._data is None:
-        deltas = pd.Series(name="delta", dtype="float64")
-    else:
-        deltas = self._get_deltas()
+    if _stored_has_na(self):
+        return _layer_with_na(self, start, end, value)
+
+    if not self._pending_layers and self._stored_values is not None:
+        # values depend on the initial value, so only deltas are kept while
+        # layers are pending
+        self._set_arrays(
+            self._stored_step_points, self._get_deltas(), None, self._stored_tz
+        )
 
     if start is None:
         self.initial_value += value
     else:
-        if start in deltas.index:
-            deltas.loc[start] += value
-        else:
-            deltas.loc[start] = float(value)
-        if deltas.loc[start] == 0:
-            deltas.drop(start, inplace=True)
-
+        self._pending_layers.append((start, float(value)))
     if end is not None:
-        if end in deltas.index:
-            deltas.loc[end] -= value
-        else:
-            deltas.loc[end] = -value
-        if deltas.loc[end] == 0:
-            deltas.drop(end, inplace=True)
-    if len(deltas) > 0:
-        self._data = deltas.sort_index().to_frame()
-        self._valid_deltas = True
-    self._valid_values = False
+        self._pending_layers.append((end, -value))
+
+    if len(self._pending_layers) >= self.layer_buffer_size:
+        _merge_pending_layers(self)
     return self
 
 
@@ -164,8 +324,21 @@ def layer(self, start=None, end=None, value=None, frame=None):
     -------
     :class:`Stairs`
         The current instance is returned to facilitate method chaining
+
+    Notes
+    -----
+    Layering a single interval, where *start* and *end* are scalars, is deferred.
+    The interval is buffered and merged into the step function when it is next
+    used, or when the number of buffered step points reaches
+    ``Stairs.layer_buffer_size``.  This makes layering intervals one at a time,
+    for example in a simulation, efficient.
     """
-    if self._data is None and np.isnan(self.initial_value):
+    if (
+        self._stored_step_points is None
+        and not self._pending_layers
+        and not self._pending_arrays
+        and np.isnan(self.initial_value)
+    ):
         return self
     self._clear_cache()
     start, end, value = _preprocess_layer_args(frame, start, end, value)
@@ -176,25 +349,29 @@ def layer(self, start=None, end=None, value=None, frame=None):
     start = _convert_to_series(start)
     end = _convert_to_series(end)
     _check_args_dtypes(start, end)  # conversion to Series required before checking
-    df = pd.concat([start, end], axis=1, ignore_index=True)
-    start_series = pd.Series(value, index=df.iloc[:, 0])
-    self.initial_value += start_series[start_series.index.isna()].sum()
-    if self._data is None:
-        to_concat = [
-            start_series,
-            pd.Series(-value, index=df.iloc[:, 1]),
-        ]
-    else:
-        to_concat = [
-            start_series,
-            pd.Series(-value, index=df.iloc[:, 1]),
-            self._get_deltas(),
-        ]
-    deltas = pd.concat(to_concat)
-
-    self._data = deltas.groupby(deltas.index).sum().rename("delta").to_frame()
-    self._valid_deltas = True
-    self._valid_values = False
+    if self._has_na():
+        return _layer_with_na(self, start, end, value)
+
+    # start and end are padded with nulls to a common length
+    value = np.broadcast_to(value, max(len(start), len(end)))
+    start_points, start_tz = _split_index(start)
+    end_points, end_tz = _split_index(end)
+    start_notnull = ~pd.isna(start_points)
+    end_notnull = ~pd.isna(end_points)
+    step_points = [start_points[start_notnull], end_points[end_notnull]]
+    deltas = [value[: len(start)][start_notnull], -value[: len(end)][end_notnull]]
+    tz = start_tz if start_tz is not None else end_tz
+    if self._step_points is not None:
+        # deltas must be retrieved before the initial value changes
+        step_points.append(self._step_points)
+        deltas.append(self._get_deltas())
+        tz = self._tz
+    self.initial_value += (
+        value[: len(start)][~start_notnull].sum() + value[len(start) :].sum()
+    )
+
+    step_points, deltas = _sum_deltas_by_step_point(step_points, deltas)
+    self._set_arrays(step_points, deltas, None, tz)
     self._remove_redundant_step_points()
     return self
 
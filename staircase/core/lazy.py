@@ -0,0 +1,395 @@
+"""
+Deferred evaluation of expressions of step functions.
+
+Operators applied to a :class:`LazyStairs` are recorded in an expression tree
+rather than evaluated.  When the expression is computed, the step points of all
+step functions in the tree are merged once, each step function is evaluated at
+the merged step points, and the operators are applied to arrays of values.  No
+intermediate :class:`Stairs` instances are created.
+"""
+
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+
+import staircase as sc
+from staircase.core.exceptions import ClosedMismatchError
+
+
+def _mask(values, x, y):
+    return np.where(np.isnan(x) | np.isnan(y), np.nan, values)
+
+
+def _first_step(values):
+    # the index of the first value which differs from the initial value, or the
+    # number of values if there is none, as per the first step point which remains
+    # when the operators of Stairs remove redundant step points
+    if np.isnan(values[0]):
+        differs = ~np.isnan(values)
+    else:
+        differs = values != values[0]
+    return int(np.argmax(differs)) if differs.any() else len(values)
+
+
+def _null_infinities(values, first):
+    # division of, or into, a number nulls positive infinity, and infinite values
+    # before the first step point
+    values[:first][np.isinf(values[:first])] = np.nan
+    values[values == np.inf] = np.nan
+
+
+def _arithmetic(array_op):
+    def func(x, y, x_first, y_first):
+        x_constant, y_constant = x_first == len(x), y_first == len(y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = array_op(x, y)
+        if x_constant == y_constant:
+            if array_op is np.divide:
+                values[np.isinf(values)] = np.nan
+            return values, 1 if x_constant else _first_step(values)
+        number, first = (x[0], y_first) if x_constant else (y[0], x_first)
+        if np.isnan(number) or (array_op is np.divide and y_constant and number == 0):
+            return np.full(1, np.nan), 1
+        # operators with a number keep the step points of the step function, and
+        # multiplication and division null an initial value which is not finite
+        if array_op is np.divide:
+            _null_infinities(values, first)
+        elif array_op is np.multiply:
+            values[:first][np.isinf(values[:first])] = np.nan
+        return values, first
+
+    return func
+
+
+def _relational(array_op):
+    def func(x, y, x_first, y_first):
+        x_constant, y_constant = x_first == len(x), y_first == len(y)
+        # comparisons with a constant are only null where the constant is null,
+        # and at the initial value, as per the relational operators of Stairs
+        for constant, values in ((x_constant, x), (y_constant, y)):
+            if constant and np.isnan(values[0]):
+                return np.full(1, np.nan), 1
+        with np.errstate(invalid="ignore"):
+            values = array_op(x, y) * 1.0
+        masked = _mask(values, x, y)
+        if x_constant == y_constant:
+            values = masked
+        else:
+            first = y_first if x_constant else x_first
+            values[:first] = masked[:first]
+        return values, _first_step(values)
+
+    return func
+
+
+def _make_boolean(x):
+    return np.where(np.isnan(x), np.nan, (x != 0) * 1.0)
+
+
+def _invert(x):
+    return np.where(np.isnan(x), np.nan, (x == 0) * 1.0)
+
+
+def _full(x, value):
+    return np.full(len(x), value, dtype=float)
+
+
+_logical_with_constant = {
+    # functions of the values of a step function, given a non-zero constant, or zero
+    np.logical_and: (_make_boolean, lambda x: _full(x, 0)),
+    np.logical_or: (lambda x: _full(x, 1), _make_boolean),
+    np.logical_xor: (_invert, _make_boolean),
+}
+
+
+def _logical(array_op):
+    def func(x, y, x_first, y_first):
+        x_constant, y_constant = x_first == len(x), y_first == len(y)
+        # logical operators with a constant, as per the logical operators of Stairs
+        if y_constant or x_constant:
+            if not y_constant:
+                x, y = y, x
+            if np.isnan(y[0]):
+                values = _full(x, np.nan)
+            else:
+                nonzero, zero = _logical_with_constant[array_op]
+                values = nonzero(x) if y[0] != 0 else zero(x)
+        else:
+            values = _mask(array_op(x, y) * 1.0, x, y)
+        return values, _first_step(values)
+
+    return func
+
+
+_binary_funcs = {
+    "add": _arithmetic(np.add),
+    "subtract": _arithmetic(np.subtract),
+    "multiply": _arithmetic(np.multiply),
+    "divide": _arithmetic(np.divide),
+    "eq": _relational(np.equal),
+    "ne": _relational(np.not_equal),
+    "lt": _relational(np.less),
+    "gt": _relational(np.greater),
+    "le": _relational(np.less_equal),
+    "ge": _relational(np.greater_equal),
+    "logical_and": _logical(np.logical_and),
+    "logical_or": _logical(np.logical_or),
+    "logical_xor": _logical(np.logical_xor),
+}
+
+
+def _negate(x, first):
+    # negation keeps the step points of a step function
+    return -x, first
+
+
+def _unary(func):
+    def wrapper(x, first):
+        values = func(x)
+        return values, _first_step(values)
+
+    return wrapper
+
+
+_unary_funcs = {
+    "negate": _negate,
+    "invert": _unary(_invert),
+    "make_boolean": _unary(_make_boolean),
+}
+
+
+class LazyStairs:
+    """
+    An expression of step functions, which is evaluated when computed.
+
+    Arithmetic, relational and logical operators, between instances of
+    :class:`LazyStairs`, :class:`Stairs` and numbers, are recorded rather than
+    evaluated.  :meth:`LazyStairs.compute` evaluates the expression with a single
+    merge of the step points of all step functions in it, which avoids creating a
+    step function for every operator.  The result is the same as if the operators
+    were applied to the step functions directly, except that the sign of a zero
+    value, and so of an infinite value from dividing by it, may differ.
+
+    Instances are created with :meth:`Stairs.lazy`.
+
+    See Also
+    --------
+    Stairs.lazy
+
+    Examples
+    --------
+
+    >>> import staircase as sc
+    >>> expression = (s1.lazy() + s2 - 0.5) * s2 > 0
+    >>> expression.compute().step_values
+    1.0    1.0
+    2.0    0.0
+    3.0    1.0
+    5.5    0.0
+    Name: value, dtype: float64
+    """
+
+    def __init__(self, stairs):
+        if not isinstance(stairs, sc.Stairs):
+            raise TypeError("LazyStairs can only be created from a Stairs instance.")
+        self._op = None
+        self._operands = (stairs,)
+
+    @classmethod
+    def _new(cls, op, operands) -> LazyStairs:
+        new_instance = cls.__new__(cls)
+        new_instance._op = op
+        new_instance._operands = tuple(
+            operand if isinstance(operand, cls) else _leaf(operand)
+            for operand in operands
+        )
+        return new_instance
+
+    def _nodes(self):
+        # the nodes of the expression tree, each once, in post-order, so that the
+        # operands of each node precede it.  Trees are traversed with a stack, as
+        # chains of operators may be deeper than the recursion limit.
+        nodes, seen, pending = [], set(), [(self, False)]
+        while pending:
+            node, expanded = pending.pop()
+            if expanded:
+                nodes.append(node)
+                continue
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            pending.append((node, True))
+            if node._op is not None:
+                pending.extend((operand, False) for operand in reversed(node._operands))
+        return nodes
+
+    def compute(self) -> sc.Stairs:
+        """
+        Evaluates the expression.
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        Raises
+        ------
+        ClosedMismatchError
+            If step functions in the expression have different values for *closed*.
+        """
+        nodes = self._nodes()
+        stairs = [node._operands[0] for node in nodes if node._op is None]
+        with_steps = [s for s in stairs if s._step_points is not None]
+        for s in with_steps[1:]:
+            if s._closed != with_steps[0]._closed:
+                raise ClosedMismatchError(with_steps[0], s)
+        step_points = _union_step_points(with_steps) if with_steps else None
+        # the number of nodes which depend on each node, so that values can be
+        # released once they are no longer required
+        remaining = {}
+        for node in nodes:
+            if node._op is not None:
+                for operand in node._operands:
+                    remaining[id(operand)] = remaining.get(id(operand), 0) + 1
+        values, _ = _evaluate(nodes, step_points, remaining)
+        closed = with_steps[0]._closed if with_steps else stairs[0]._closed
+        if step_points is None:
+            return sc.Stairs._new(initial_value=float(values[0]), closed=closed)
+        if len(values) == 1:
+            values = np.full(len(step_points) + 1, values[0])
+        return sc.Stairs._new(
+            initial_value=float(values[0]),
+            step_points=step_points,
+            values=values[1:],
+            closed=closed,
+            tz=next((s._tz for s in with_steps if s._tz is not None), None),
+        )._remove_redundant_step_points()
+
+    def __neg__(self) -> LazyStairs:
+        return LazyStairs._new("negate", (self,))
+
+    def invert(self) -> LazyStairs:
+        return LazyStairs._new("invert", (self,))
+
+    def make_boolean(self) -> LazyStairs:
+        return LazyStairs._new("make_boolean", (self,))
+
+    __invert__ = invert
+    negate = __neg__
+
+
+def _leaf(operand):
+    if not isinstance(operand, sc.Stairs):
+        operand = sc.Stairs(initial_value=operand)
+    return LazyStairs(operand)
+
+
+def _union_step_points(stairs):
+    step_points = np.concatenate([s._step_points for s in stairs])
+    step_points.sort(kind="stable")  # merges the sorted runs
+    return step_points[np.append(True, step_points[1:] != step_points[:-1])]
+
+
+def _values_at(stairs, step_points):
+    # the values of a step function at step points which include its own, preceded
+    # by the initial value.  A step function without step points has a single
+    # value, which is broadcast.
+    if stairs._step_points is None:
+        return np.array([stairs.initial_value], dtype=float)
+    amended_values = np.append(stairs.initial_value, stairs._get_values())
+    positions = np.searchsorted(step_points, stairs._step_points) + 1
+    counts = np.diff(positions, prepend=0, append=len(step_points) + 1)
+    return np.repeat(amended_values.astype(float), counts)
+
+
+def _evaluate(nodes, step_points, remaining):
+    # the values of the last node, whose operands precede it in nodes.  Values are
+    # accompanied by the index of the first step point of the corresponding step
+    # function, before which is its initial value, which determines the behaviour
+    # of some operators.  A step function without step points has a single value.
+    # Values are released once all nodes which depend on them are evaluated.
+    results = {}
+    for node in nodes:
+        if node._op is None:
+            stairs = node._operands[0]
+            values = _values_at(stairs, step_points)
+            if stairs._step_points is None:
+                first = 1
+            else:
+                first = np.searchsorted(step_points, stairs._step_points[0]) + 1
+        else:
+            operands = [results[id(operand)] for operand in node._operands]
+            for operand in node._operands:
+                remaining[id(operand)] -= 1
+                if not remaining[id(operand)]:
+                    del results[id(operand)]
+            if node._op in _unary_funcs:
+                values, first = _unary_funcs[node._op](*operands[0])
+            else:
+                (x, x_first), (y, y_first) = operands
+                values, first = _binary_funcs[node._op](x, y, x_first, y_first)
+            if first == len(values):
+                values, first = values[:1], 1
+        results[id(node)] = values, first
+    return results[id(nodes[-1])]
+
+
+def _make_binary_method(op, reflected=False):
+    def method(self, other):
+        if not isinstance(other, (LazyStairs, sc.Stairs)) and not np.isscalar(other):
+            return NotImplemented
+        operands = (other, self) if reflected else (self, other)
+        return LazyStairs._new(op, operands)
+
+    return method
+
+
+for _op, _dunders in (
+    ("add", ("__add__", "__radd__")),
+    ("subtract", ("__sub__", "__rsub__")),
+    ("multiply", ("__mul__", "__rmul__")),
+    ("divide", ("__truediv__", "__rtruediv__")),
+    ("logical_and", ("__and__", "__rand__")),
+    ("logical_or", ("__or__", "__ror__")),
+    ("logical_xor", ("__xor__", "__rxor__")),
+):
+    setattr(LazyStairs, _op, _make_binary_method(_op))
+    setattr(LazyStairs, _dunders[0], _make_binary_method(_op))
+    setattr(LazyStairs, _dunders[1], _make_binary_method(_op, reflected=True))
+
+for _op in ("eq", "ne", "lt", "gt", "le", "ge"):
+    setattr(LazyStairs, _op, _make_binary_method(_op))
+    setattr(LazyStairs, f"__{_op}__", _make_binary_method(_op))
+
+LazyStairs.__hash__ = None
+
+
+def lazy(self) -> LazyStairs:
+    """
+    Returns a :class:`LazyStairs`, which records operators applied to it.
+
+    Expressions of many step functions, such as ``(s1.lazy() + s2 - s3) * s4 > 5``,
+    are evaluated with :meth:`LazyStairs.compute`, which merges the step points of all
+    of the step functions once, rather than creating a step function for each operator.
+
+    Returns
+    -------
+    :class:`LazyStairs`
+
+    See Also
+    --------
+    LazyStairs.compute
+
+    Examples
+    --------
+
+    >>> expression = s1.lazy() + s2
+    >>> expression.compute().identical(s1 + s2)
+    True
+    """
+    return LazyStairs(self)
+
+
+def add_methods(cls):
+    cls.lazy = lazy
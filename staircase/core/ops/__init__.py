@@ -1,4 +1,5 @@
 from staircase.core.ops.arithmetic import add, divide, multiply, negate, subtract
+from staircase.core.ops.inplace import iadd, imul, isub
 from staircase.core.ops.logical import (
     invert,
     logical_and,
@@ -81,3 +82,7 @@ def add_operations(cls):
     cls.__rand__ = logical_rand
     cls.__ror__ = logical_ror
     cls.__rxor__ = logical_rxor
+
+    cls.__iadd__ = iadd
+    cls.__isub__ = isub
+    cls.__imul__ = imul
@@ -2,9 +2,9 @@ import operator
 import warnings
 
 import numpy as np
-import pandas as pd
 
 import staircase as sc
+from staircase.core.layering import _sum_deltas_by_step_point
 from staircase.core.ops import docstrings
 from staircase.core.ops.common import _combine_stairs_via_values, requires_closed_match
 from staircase.util import _sanitize_binary_operands
@@ -13,76 +13,81 @@ from staircase.util._decorators import Appender
 
 @Appender(docstrings.negate_docstring, join="\n", indents=1)
 def negate(self):
-    data = -self._data if self._data is not None else None
     return sc.Stairs._new(
         initial_value=-self.initial_value,
-        data=data,
+        step_points=self._step_points,
+        deltas=None if self._deltas is None else -self._deltas,
+        values=None if self._values is None else -self._values,
         closed=self.closed,
+        tz=self._tz,
     )
 
 
-def _add_or_sub_deltas_no_mask(self, other, series_op, float_op):
-    # assume self and other have ._data, and at least one has valid _deltas
-    # if not other._valid_deltas:
-    #     other._create_deltas()
-    # if not self._valid_deltas:
-    #     self._create_deltas()
-
-    deltas = series_op(self._get_deltas(), other._get_deltas(), fill_value=0)
-
+def _add_or_sub_deltas_no_mask(self, other, array_op, float_op):
+    # assume self and other have step points, and at least one has valid deltas
+    step_points, deltas = _sum_deltas_by_step_point(
+        [self._step_points, other._step_points],
+        [self._get_deltas(), array_op(0, other._get_deltas())],
+    )
     new_instance = sc.Stairs._new(
         initial_value=float_op(self.initial_value, other.initial_value),
-        data=pd.DataFrame({"delta": deltas}),
+        step_points=step_points,
+        deltas=deltas,
         closed=self.closed,
+        tz=self._tz if self._tz is not None else other._tz,
     )
     new_instance._remove_redundant_step_points()
     return new_instance
 
 
-def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
+def _make_add_or_sub_func(docstring, array_op, float_op):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
         self, other = _sanitize_binary_operands(self, other)
-        if self._data is None and other._data is None:
+        initial_value = float_op(self.initial_value, other.initial_value)
+        if self._step_points is None and other._step_points is None:
             return sc.Stairs._new(
-                initial_value=float_op(self.initial_value, other.initial_value),
-                data=None,
+                initial_value=initial_value,
                 closed=self.closed,
             )
-        elif other._data is None:  # means self._data is not None
+        elif other._step_points is None:  # means self has step points
             if np.isnan(other.initial_value):
-                data = None
-            else:
-                data = self._data.copy()
-                if self._valid_values:
-                    data["value"] = series_op(data["value"], other.initial_value)
+                return sc.Stairs._new(initial_value=initial_value, closed=self.closed)
+            values = self._values
+            if values is not None:
+                values = float_op(values, other.initial_value)
             return sc.Stairs._new(
-                initial_value=float_op(self.initial_value, other.initial_value),
-                data=data,
+                initial_value=initial_value,
+                step_points=self._step_points,
+                deltas=self._deltas,
+                values=values,
                 closed=self.closed,
+                tz=self._tz,
             )
-        elif self._data is None:  # means other._data is not None
+        elif self._step_points is None:  # means other has step points
             if np.isnan(self.initial_value):
-                data = None
-            else:
-                data = other._data.copy()
-                if other._valid_values:
-                    data["value"] = series_rop(data["value"], self.initial_value)
-                if other._valid_deltas:
-                    data["delta"] = series_rop(data["delta"], 0)
+                return sc.Stairs._new(initial_value=initial_value, closed=other.closed)
+            values, deltas = other._values, other._deltas
+            if values is not None:
+                values = float_op(self.initial_value, values)
+            if deltas is not None:
+                deltas = float_op(0, deltas)
             return sc.Stairs._new(
-                initial_value=float_op(self.initial_value, other.initial_value),
-                data=data,
+                initial_value=initial_value,
+                step_points=other._step_points,
+                deltas=deltas,
+                values=values,
                 closed=other.closed,
+                tz=other._tz,
             )
-        # self._data or other._data exists
+        # self and other both have step points
         elif self._has_na() or other._has_na():
-            return _combine_stairs_via_values(self, other, series_op, float_op)
-        elif self._valid_deltas or other._valid_deltas:
-            return _add_or_sub_deltas_no_mask(self, other, series_op, float_op)
-        elif self._valid_values and other._valid_values:
-            return _combine_stairs_via_values(self, other, series_op, float_op)
+            return _combine_stairs_via_values(self, other, array_op, float_op)
+        elif self._deltas is not None or other._deltas is not None:
+            return _add_or_sub_deltas_no_mask(self, other, array_op, float_op)
+        elif self._values is not None and other._values is not None:
+            return _combine_stairs_via_values(self, other, array_op, float_op)
         else:
             raise RuntimeError("This code should not execute")
 
@@ -91,48 +96,50 @@ def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
 
 add = _make_add_or_sub_func(
     docstrings.add_docstring,
-    pd.Series.add,
+    np.add,
     operator.add,
-    pd.Series.radd,
 )
 
 subtract = _make_add_or_sub_func(
     docstrings.subtract_docstring,
-    pd.Series.sub,
+    np.subtract,
     operator.sub,
-    pd.Series.rsub,
 )
 
 
-def _make_mul_div_func(docstring, series_op, float_op, series_rop, float_rop):
+def _make_mul_div_func(docstring, array_op, float_op, float_rop):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
-        def op_with_scalar(self, other, series_op, float_op):
+        def op_with_scalar(self, other, float_op):
             # other is scalar
-            if other == 0 and series_op == pd.Series.divide:
+            if other == 0 and float_op is np.divide:
                 return sc.Stairs._new(np.nan, None, closed=self.closed)
-            if self._data is None or np.isnan(other):
-                data = None
+            if self._step_points is None or np.isnan(other):
+                step_points, values = None, None
             else:
-                data = pd.DataFrame({"value": series_op(self._get_values(), other)})
-                if series_op in (pd.Series.divide, pd.Series.rdiv):
-                    data = data.replace(np.inf, np.nan)
+                step_points = self._step_points
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    values = float_op(self._get_values(), other)
+                if array_op is np.divide:
+                    values = np.where(values == np.inf, np.nan, values)
             initial_value = float_op(self.initial_value, other)
             initial_value = initial_value if np.isfinite(initial_value) else np.nan
             return sc.Stairs._new(
                 initial_value=initial_value,
-                data=data,
+                step_points=step_points,
+                values=values,
                 closed=self.closed,
+                tz=self._tz,
             )
 
         self, other = _sanitize_binary_operands(self, other)
-        if other._data is None:
-            return op_with_scalar(self, other.initial_value, series_op, float_op)
-        elif self._data is None:
-            return op_with_scalar(other, self.initial_value, series_rop, float_rop)
+        if other._step_points is None:
+            return op_with_scalar(self, other.initial_value, float_op)
+        elif self._step_points is None:
+            return op_with_scalar(other, self.initial_value, float_rop)
         else:
-            return _combine_stairs_via_values(self, other, series_op, float_op)
+            return _combine_stairs_via_values(self, other, array_op, float_op)
 
     return func
 
@@ -145,16 +152,14 @@ def float_rdiv(a, b):
 
 multiply = _make_mul_div_func(
     docstrings.multiply_docstring,
-    pd.Series.multiply,
+    np.multiply,
     operator.mul,
-    pd.Series.rmul,
     operator.mul,
 )
 
 divide = _make_mul_div_func(
     docstrings.divide_docstring,
-    pd.Series.divide,
     np.divide,
-    pd.Series.rdiv,
+    np.divide,
     float_rdiv,
 )
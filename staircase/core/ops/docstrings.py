@@ -489,3 +489,50 @@ Examples
 """.format(
     examples=fillna_examples
 )
+
+_inplace_add_or_sub_docstring = """
+{operation} *other* {preposition} *self* in place.
+
+The step points and deltas of *other* are buffered, and merged into *self* when it
+is next used, which makes accumulating many step functions efficient.
+
+Parameters
+----------
+other : int, float, or :class:`Stairs`
+
+Returns
+-------
+:class:`Stairs`
+    *self*
+
+See Also
+--------
+Stairs.{method}
+"""
+
+iadd_docstring = _inplace_add_or_sub_docstring.format(
+    operation="Adds", preposition="to", method="add"
+)
+isub_docstring = _inplace_add_or_sub_docstring.format(
+    operation="Subtracts", preposition="from", method="subtract"
+)
+
+imul_docstring = """
+Multiplies *self* by *other* in place.
+
+Multiplication changes the value at every step point, so the product is calculated
+as it is by :meth:`Stairs.multiply`, and the arrays of *self* are replaced.
+
+Parameters
+----------
+other : int, float, or :class:`Stairs`
+
+Returns
+-------
+:class:`Stairs`
+    *self*
+
+See Also
+--------
+Stairs.multiply
+"""
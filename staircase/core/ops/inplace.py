@@ -0,0 +1,111 @@
+"""
+In-place arithmetic operators, for accumulating step functions in a loop.
+
+Adding or subtracting a step function in place appends its step points and
+deltas to a buffer, rather than creating a new step function.  The buffer is
+merged, with a single sort and reduce, when the step function is next read, or
+when the number of buffered step points exceeds both the number of step points
+of the step function and ``Stairs.layer_buffer_size``.  As with a dynamic array,
+the cost of merging is therefore amortised over the step functions added.
+"""
+
+import operator
+
+import numpy as np
+from pandas.api.types import is_number
+
+import staircase as sc
+from staircase.core.layering import _merge_pending_layers, _stored_has_na
+from staircase.core.ops import docstrings
+from staircase.core.ops.arithmetic import add, multiply, subtract
+from staircase.core.ops.common import _assert_closeds_equal
+from staircase.util._decorators import Appender
+
+
+def _has_pending(self):
+    return bool(self._pending_layers or self._pending_arrays)
+
+
+def _assign(self, result):
+    # updates self with the arrays of a step function resulting from an operation
+    self._pending_layers, self._pending_arrays = [], []
+    self._pending_arrays_size = 0
+    self.initial_value = result.initial_value
+    self._closed = result._closed
+    self._set_arrays(result._step_points, result._deltas, result._values, result._tz)
+    self._clear_cache()
+    return self
+
+
+def _buffer_deltas(self, step_points, deltas, tz):
+    self._pending_arrays.append((step_points, deltas.astype("float64", copy=False), tz))
+    self._pending_arrays_size += len(step_points)
+    stored_size = (
+        0 if self._stored_step_points is None else len(self._stored_step_points)
+    )
+    if self._pending_arrays_size >= max(self.layer_buffer_size, stored_size):
+        _merge_pending_layers(self)
+
+
+def _make_inplace_add_or_sub_func(docstring, op, float_op, array_op):
+    @Appender(docstring, join="\n", indents=1)
+    def func(self, other):
+        if is_number(other):
+            other = sc.Stairs(initial_value=other, closed=self._closed)
+        elif not isinstance(other, sc.Stairs):
+            return NotImplemented
+        if other._step_points is not None and other._closed != self._closed:
+            _assert_closeds_equal(self, other)
+        if (
+            (self._stored_step_points is None and not _has_pending(self))
+            or _stored_has_na(self)
+            or other._has_na()
+        ):
+            # deltas cannot be summed across null values, and a step function
+            # without step points takes those of the other operand as they are
+            return _assign(self, op(self, other))
+
+        self._clear_cache()
+        if not _has_pending(self) and self._stored_values is not None:
+            if other._step_points is None:
+                # values are shifted by a constant, so are kept
+                self.initial_value = float_op(self.initial_value, other.initial_value)
+                self._set_arrays(
+                    self._stored_step_points,
+                    self._stored_deltas,
+                    float_op(self._stored_values, other.initial_value),
+                    self._stored_tz,
+                )
+                return self
+            # values depend on the initial value, so only deltas are kept while
+            # deltas are pending
+            self._set_arrays(
+                self._stored_step_points,
+                self._get_deltas(),
+                None,
+                self._stored_tz,
+            )
+        self.initial_value = float_op(self.initial_value, other.initial_value)
+        if other._step_points is not None:
+            _buffer_deltas(
+                self, other._step_points, array_op(other._get_deltas()), other._tz
+            )
+        return self
+
+    return func
+
+
+iadd = _make_inplace_add_or_sub_func(
+    docstrings.iadd_docstring, add, operator.add, np.asarray
+)
+
+isub = _make_inplace_add_or_sub_func(
+    docstrings.isub_docstring, subtract, operator.sub, np.negative
+)
+
+
+@Appender(docstrings.imul_docstring, join="\n", indents=1)
+def imul(self, other):
+    if not is_number(other) and not isinstance(other, sc.Stairs):
+        return NotImplemented
+    return _assign(self, multiply(self, other))
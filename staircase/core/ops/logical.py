@@ -10,7 +10,7 @@ from staircase.util import _sanitize_binary_operands
 from staircase.util._decorators import Appender
 
 
-def _make_boolean_func(docstring, series_comp, float_comp):
+def _make_boolean_func(docstring, array_comp, float_comp):
     @Appender(docstring, join="\n", indents=1)
     def func(self):
         if np.isnan(self.initial_value):
@@ -18,16 +18,16 @@ def _make_boolean_func(docstring, series_comp, float_comp):
         else:
             initial_value = float_comp(self.initial_value, 0) * 1
 
-        if self._data is None:
+        if self._step_points is None:
             return sc.Stairs(initial_value=initial_value, closed=self.closed)
-        values = series_comp(self._get_values(), 0) * 1
-        values.loc[np.isnan(self._get_values().values)] = np.nan
+        values = self._get_values()
+        values = np.where(np.isnan(values), np.nan, array_comp(values, 0) * 1)
         result = sc.Stairs._new(
             initial_value=initial_value,
-            data=pd.DataFrame(
-                {"value": values},
-            ),
+            step_points=self._step_points,
+            values=values,
             closed=self.closed,
+            tz=self._tz,
         )
         result._remove_redundant_step_points()
         return result
@@ -36,11 +36,11 @@ def _make_boolean_func(docstring, series_comp, float_comp):
 
 
 make_boolean = _make_boolean_func(
-    docstrings.make_boolean_docstring, pd.Series.ne, operator.ne
+    docstrings.make_boolean_docstring, np.not_equal, operator.ne
 )
 
 
-invert = _make_boolean_func(docstrings.invert_docstring, pd.Series.eq, operator.eq)
+invert = _make_boolean_func(docstrings.invert_docstring, np.equal, operator.eq)
 
 
 def _make_logical_func(docstring, array_op, float_op):
@@ -78,9 +78,9 @@ def _make_logical_func(docstring, array_op, float_op):
     @requires_closed_match
     def func(self, other):
         self, other = _sanitize_binary_operands(self, other)
-        if other._data is None:
+        if other._step_points is None:
             return _op_with_scalar_func(self, other.initial_value)
-        elif self._data is None:
+        elif self._step_points is None:
             return _op_with_scalar_func(other, self.initial_value)
         else:
             return _combine_stairs_via_values(self, other, array_op, float_op)
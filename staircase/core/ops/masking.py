@@ -11,19 +11,19 @@ from staircase.core.ops.common import (
     convert_string_args_to_timestamp,
     requires_closed_match,
 )
-from staircase.util import _replace_none_with_infs
+from staircase.util import _replace_none_with_infs, _split_index
 from staircase.util._decorators import Appender
 
 
 def _get_slice_index(self, lower, upper, lower_how, upper_how):
     # returns series
-    if self._data is None:
+    if self._step_points is None:
         return -1, -1
     bisect_funcs = {
         "right": bisect.bisect_right,
         "left": bisect.bisect_left,
     }
-    index_values = self._data.index.values
+    index_values = self._step_points
     lower_val_for_bisect = pd.Series([lower]).values[0]
     upper_val_for_bisect = pd.Series([upper]).values[0]
     left_index = bisect_funcs[lower_how](index_values, lower_val_for_bisect) - 1
@@ -43,49 +43,59 @@ def clip(self, lower=-inf, upper=inf):
         self, lower, upper, lower_how="right", upper_how="left"
     )
 
+    def concat(*arrays):
+        return np.concatenate([array for array in arrays if array is not None])
+
     if right_index == -1:
-        sliced_values = pd.Series(dtype="float64")
+        step_points = None
+        values = np.array([], dtype="float64")
     else:
-        sliced_values = self._get_values().iloc[max(0, left_index) : right_index]
+        step_points = self._step_points[max(0, left_index) : right_index]
+        values = self._get_values()[max(0, left_index) : right_index]
+    tz = self._tz
     if upper != inf:
-        sliced_values.loc[upper] = np.nan
-    if lower != -inf and left_index < 0:
-        sliced_values = pd.concat(
-            [pd.Series([self.initial_value], index=[lower]), sliced_values]
-        )
-    elif sliced_values.index[0] < lower:
-        index = pd.Series(sliced_values.index)
-        index.iloc[0] = lower
-        sliced_values.index = index
-
-    data = pd.DataFrame({"value": sliced_values})
+        upper_point, upper_tz = _split_index(pd.Index([upper]))
+        step_points = concat(step_points, upper_point)
+        values = np.append(values, np.nan)
+        tz = upper_tz if tz is None else tz
+    if lower != -inf:
+        lower_point, lower_tz = _split_index(pd.Index([lower]))
+        tz = lower_tz if tz is None else tz
+        if left_index < 0:
+            step_points = concat(lower_point, step_points)
+            values = np.append(self.initial_value, values)
+        elif step_points[0] < lower_point[0]:
+            step_points = concat(lower_point, step_points[1:])
 
     initial_value = self.initial_value if lower == -inf else np.nan
 
     result = sc.Stairs._new(
         initial_value=initial_value,
-        data=data,
+        step_points=step_points,
+        values=values,
         closed=self.closed,
+        tz=tz,
     )
     result._remove_redundant_step_points()
     return result
 
 
 def _maskify(self, inverse=False):
-    func = np.array(0).__eq__ if not inverse else np.array(0).__ne__
     op = operator.ne if not inverse else operator.eq
 
-    if self._data is None:
-        data = None
+    if self._step_points is None:
+        values = None
     else:
-        data = pd.DataFrame(
-            {"value": self._get_values().where(func, np.nan).where(np.isnan, 0)}
-        )
+        values = self._get_values()
+        unmasked = values != 0 if inverse else values == 0
+        values = np.where(unmasked & ~np.isnan(values), 0.0, np.nan)
 
     return sc.Stairs._new(
         initial_value=np.nan if op(self.initial_value, 0) else 0,
-        data=data,
+        step_points=self._step_points,
+        values=values,
         closed=self.closed,
+        tz=self._tz,
     )
 
 
@@ -94,7 +104,7 @@ def _mask_stairs(self, other, inverse):
         return initial_value == 0 or np.isnan(initial_value)
 
     full_mask_comparator = is_full_inverse_mask if inverse else float(0).__ne__
-    if other._data is None:
+    if other._step_points is None:
         if full_mask_comparator(other.initial_value):
             return sc.Stairs(initial_value=np.nan)
         else:
@@ -143,15 +153,17 @@ def _make_null_comparison_func(docstring, comp_func):
     @Appender(docstring, join="\n", indents=1)
     def func(self):
         initial_value = 1 if comp_func(self.initial_value) else 0
-        if self._data is None:
-            data = None
+        if self._step_points is None:
+            values = None
         else:
-            data = pd.DataFrame(
-                comp_func(self._get_values()) * 1, index=self._data.index
-            )
+            values = comp_func(self._get_values()) * 1
 
         new_instance = sc.Stairs._new(
-            initial_value=initial_value, data=data, closed=self.closed
+            initial_value=initial_value,
+            step_points=self._step_points,
+            values=values,
+            closed=self.closed,
+            tz=self._tz,
         )
         new_instance._remove_redundant_step_points()
         return new_instance
@@ -166,13 +178,13 @@ isna = _make_null_comparison_func(docstrings.isna_docstring, np.isnan)
 notna = _make_null_comparison_func(docstrings.notna_docstring, lambda x: ~np.isnan(x))
 
 
-def _make_data_fillna_method(self, value):
+def _make_values_fillna_method(self, value):
     # value is a string
     initial_value = self.initial_value
-    if self._data is None:
-        data = None
+    if self._step_points is None:
+        values = None
     else:
-        values = self._get_values().copy()
+        values = pd.Series(self._get_values())
         fillmethod = {
             "pad": pd.Series.ffill,
             "ffill": pd.Series.ffill,
@@ -181,25 +193,24 @@ def _make_data_fillna_method(self, value):
         }[value]
         if value in ("pad", "ffill") and np.isnan(values.iloc[0]):
             values.iloc[0] = self.initial_value
-        values = fillmethod(values)
+        values = fillmethod(values).to_numpy()
         if value in ("backfill", "bfill") and np.isnan(self.initial_value):
-            initial_value = values.iloc[0]
-        data = pd.DataFrame({"value": values})
-    return initial_value, data
+            initial_value = values[0]
+    return initial_value, values
 
 
-def _make_data_fillna_scalar(self, value):
+def _make_values_fillna_scalar(self, value):
     if np.isnan(self.initial_value):
         initial_value = value
     else:
         initial_value = self.initial_value
 
-    if self._data is None:
-        data = None
+    if self._step_points is None:
+        values = None
     else:
-        values = self._get_values().copy().fillna(value=value)
-        data = pd.DataFrame({"value": values})
-    return initial_value, data
+        values = self._get_values()
+        values = np.where(np.isnan(values), value, values)
+    return initial_value, values
 
 
 @requires_closed_match
@@ -216,12 +227,16 @@ def fillna(self, value):
         return _fillna_with_stairs(self, value)
 
     if isinstance(value, str):
-        initial_value, data = _make_data_fillna_method(self, value)
+        initial_value, values = _make_values_fillna_method(self, value)
     else:
-        initial_value, data = _make_data_fillna_scalar(self, value)
+        initial_value, values = _make_values_fillna_scalar(self, value)
 
     new_instance = sc.Stairs._new(
-        initial_value=initial_value, data=data, closed=self.closed
+        initial_value=initial_value,
+        step_points=self._step_points,
+        values=values,
+        closed=self.closed,
+        tz=self._tz,
     )
     new_instance._remove_redundant_step_points()
     return new_instance
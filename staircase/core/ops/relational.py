@@ -10,9 +10,7 @@ from staircase.util import _sanitize_binary_operands
 from staircase.util._decorators import Appender
 
 
-def _make_relational_func(
-    docstring, numpy_relational, series_relational, float_relational
-):
+def _make_relational_func(docstring, numpy_relational, float_relational):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
@@ -27,40 +25,38 @@ def _make_relational_func(
             )
 
         if (
-            (self._data is None and other._data is None)
-            or (np.isnan(other.initial_value) and other._data is None)
-            or (np.isnan(self.initial_value) and self._data is None)
+            (self._step_points is None and other._step_points is None)
+            or (np.isnan(other.initial_value) and other._step_points is None)
+            or (np.isnan(self.initial_value) and self._step_points is None)
         ):
             return sc.Stairs._new(
                 initial_value=initial_value,
-                data=None,
                 closed=other.closed if np.isnan(self.initial_value) else self.closed,
             )
-        elif self._data is None or other._data is None:
-            if other._data is None:  # self._data exists
-                values = self._get_values()
-                new_values = numpy_relational(values, other.initial_value) * 1
+        elif self._step_points is None or other._step_points is None:
+            if other._step_points is None:  # self has step points
+                new_values = (
+                    numpy_relational(self._get_values(), other.initial_value) * 1
+                )
                 # new_values[values.isna()] = np.nan  # *1 converts bool to nan where applicable
-                new_index = self._data.index
-            else:  # other._data exists
-                values = other._get_values()
-                new_values = numpy_relational(self.initial_value, values)
+                stairs = self
+            else:  # other has step points
+                new_values = numpy_relational(self.initial_value, other._get_values())
                 # new_values[values.isna()] = np.nan  # *1 converts bool to nan where applicable
-                new_index = other._data.index
+                stairs = other
 
             new_instance = sc.Stairs._new(
                 initial_value=initial_value,
-                data=pd.DataFrame(
-                    {"value": new_values},
-                    index=new_index,
-                ),
+                step_points=stairs._step_points,
+                values=new_values,
                 closed=self.closed,
+                tz=stairs._tz,
             )
             new_instance._remove_redundant_step_points()
             return new_instance
         else:
             return _combine_stairs_via_values(
-                self, other, series_relational, float_relational
+                self, other, numpy_relational, float_relational
             )
 
     return func
@@ -119,20 +115,19 @@ def identical(self, other):
         np.isnan(self.initial_value) and np.isnan(other.initial_value)
     ):
         return False
-    elif self._data is None and other._data is None:
+    elif self._step_points is None and other._step_points is None:
         return True
-    elif self._data is None or other._data is None:
+    elif self._step_points is None or other._step_points is None:
         return False
-    elif self._valid_values and other._valid_values:
-        return _is_series_equal(self._data["value"], other._data["value"])
+    elif self._values is not None and other._values is not None:
+        return _is_series_equal(self.step_values, other.step_values)
     else:
-        return _is_series_equal(self._get_deltas(), other._get_deltas())
+        return _is_series_equal(self.step_changes, other.step_changes)
 
 
 lt = _make_relational_func(
     docstrings.lt_docstring,
     np.less,
-    pd.Series.lt,
     operator.lt,
 )
 
@@ -140,7 +135,6 @@ lt = _make_relational_func(
 gt = _make_relational_func(
     docstrings.gt_docstring,
     np.greater,
-    pd.Series.gt,
     operator.gt,
 )
 
@@ -148,7 +142,6 @@ gt = _make_relational_func(
 le = _make_relational_func(
     docstrings.le_docstring,
     np.less_equal,
-    pd.Series.le,
     operator.le,
 )
 
@@ -156,7 +149,6 @@ le = _make_relational_func(
 ge = _make_relational_func(
     docstrings.ge_docstring,
     np.greater_equal,
-    pd.Series.ge,
     operator.ge,
 )
 
@@ -164,7 +156,6 @@ ge = _make_relational_func(
 eq = _make_relational_func(
     docstrings.eq_docstring,
     np.equal,
-    pd.Series.eq,
     operator.eq,
 )
 
@@ -172,6 +163,5 @@ eq = _make_relational_func(
 ne = _make_relational_func(
     docstrings.ne_docstring,
     np.not_equal,
-    pd.Series.ne,
     operator.ne,
 )
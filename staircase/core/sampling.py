@@ -10,10 +10,45 @@ from staircase.util import _is_datetime_like
 from staircase.util._decorators import Appender
 
 
+def _to_points(x):
+    # converts vector data to an array comparable with the step points.  Series and
+    # indexes already hold such an array, in UTC if timezone aware
+    if isinstance(x, (pd.Index, pd.Series)) and x.dtype != object:
+        return np.asarray(x.values)
+    if isinstance(x, np.ndarray):
+        return x
+    if len(x) and _is_datetime_like(next(iter(x))):
+        return pd.Series(x).values  # faster, but also bug free in numpy
+    return np.asarray(x)
+
+
+def _is_sorted(x):
+    return len(x) < 2 or bool((x[1:] >= x[:-1]).all())
+
+
+def _limit_sorted(step_points, values, x, side, out=None):
+    # merges step points into sorted points x, rather than locating each point in
+    # the step points.  values are preceded by the initial value
+    opposite = "left" if side == "right" else "right"
+    boundaries = np.searchsorted(x, step_points, side=opposite)
+    if out is None:
+        return np.repeat(values, np.diff(boundaries, prepend=0, append=len(x)))
+    # each run of points between step points is filled in place
+    for value, start, end in zip(
+        values, np.append(0, boundaries), np.append(boundaries, len(x))
+    ):
+        out[start:end] = value
+    return out
+
+
 # capable of single or vector
 @Appender(examples.sample_example, join="\n", indents=1)
 def sample(
-    self: Stairs, x: int | float | np.array | pd.Series, include_index=False
+    self: Stairs,
+    x: int | float | np.array | pd.Series,
+    include_index=False,
+    assume_sorted=False,
+    out=None,
 ) -> pd.Series:
     """
     Evaluates the value of the step function at one, or more, points.
@@ -27,6 +62,12 @@ def sample(
     include_index : bool, default False
         Indicates if the values returned should be a :class:`numpy.ndarray`, or in a :class:`pandas.Series`
         indexed by the values in *x*
+    assume_sorted : bool, default False
+        Indicates if the values in *x* are known to be in ascending order.  If False then *x* is checked,
+        and sorted values are evaluated in a single pass over *x* and the step points.
+    out : :class:`numpy.ndarray`, optional
+        An array of floats, with the same length as *x*, in which to place the result.  Only valid
+        if *x* is vector data.
 
     Returns
     -------
@@ -38,7 +79,7 @@ def sample(
     staircase.sample
     """
     side = "right" if self._closed == "left" else "left"
-    values = limit(self, x, side)
+    values = limit(self, x, side, assume_sorted=assume_sorted, out=out)
     if include_index:
         if not is_list_like(x):
             x = [x]
@@ -47,7 +88,9 @@ def sample(
 
 
 @Appender(examples.limit_example, join="\n", indents=1)
-def limit(self: Stairs, x, side, include_index=False) -> pd.Series:
+def limit(
+    self: Stairs, x, side, include_index=False, assume_sorted=False, out=None
+) -> pd.Series:
     """
     Evaluates the limit of the step function as it approaches one, or more, points.
 
@@ -66,6 +109,12 @@ def limit(self: Stairs, x, side, include_index=False) -> pd.Series:
     include_index : bool, default False
         Indicates if the values returned should be a :class:`numpy.ndarray`, or in a :class:`pandas.Series`
         indexed by the values in *x*
+    assume_sorted : bool, default False
+        Indicates if the values in *x* are known to be in ascending order.  If False then *x* is checked,
+        and sorted values are evaluated in a single pass over *x* and the step points.
+    out : :class:`numpy.ndarray`, optional
+        An array of floats, with the same length as *x*, in which to place the result.  Only valid
+        if *x* is vector data.
 
     Returns
     -------
@@ -78,19 +127,39 @@ def limit(self: Stairs, x, side, include_index=False) -> pd.Series:
     """
     assert side in ("left", "right")
     passed_x = x
-    if self._data is None:
-        if pd.api.types.is_list_like(x):
-            return self.initial_value * np.ones_like(x, dtype=float)
-        else:
+    if not pd.api.types.is_list_like(x):
+        if out is not None:
+            raise ValueError("'out' is only valid if x is vector data.")
+        if self._step_points is None:
             return self.initial_value
-    amended_values = np.append(
-        self._get_values().values, [self.initial_value]
-    )  # hack for -1 index value
-    if pd.api.types.is_list_like(x) and _is_datetime_like(next(iter(x))):
-        x = pd.Series(x).values  # faster, but also bug free in numpy
-    elif _is_datetime_like(x):
-        x = pd.Series([x]).values[0]
-    values = amended_values[np.searchsorted(self._data.index.values, x, side=side) - 1]
+        if _is_datetime_like(x):
+            x = pd.Series([x]).values[0]
+        index = np.searchsorted(self._step_points, x, side=side)
+        return np.append(self.initial_value, self._get_values())[index]
+    x = _to_points(x)
+    if self._step_points is None:
+        if out is None:
+            values = np.full(x.shape, self.initial_value, dtype=float)
+        else:
+            out.fill(self.initial_value)
+            values = out
+    elif (
+        x.ndim == 1
+        and len(x) > len(self._step_points)
+        and (assume_sorted or _is_sorted(x))
+    ):
+        amended_values = np.append(self.initial_value, self._get_values())
+        values = _limit_sorted(self._step_points, amended_values, x, side, out=out)
+    else:
+        amended_values = np.append(
+            self._get_values(), [self.initial_value]
+        )  # hack for -1 index value
+        values = np.take(
+            amended_values,
+            np.searchsorted(self._step_points, x, side=side) - 1,
+            out=out,
+            mode="wrap",  # out is buffered if mode is "raise"
+        )
     if include_index:
         values = pd.Series(values, index=passed_x)
     return values
@@ -9,8 +9,21 @@ from typing_extensions import Literal
 
 import staircase as sc
 from staircase.core.ops.masking import clip
-from staircase.core.stats.statistic import _get_stairs_method
+from staircase.core.stats.distribution import (
+    _describe_tally,
+    _hist_over_intervals,
+    _segmented_modes,
+    _segmented_percentiles,
+    _tally_over_intervals,
+)
+from staircase.core.stats.statistic import (
+    _get_stairs_method,
+    _integrals_over_intervals,
+    _moments_over_intervals,
+    _range_extrema,
+)
 from staircase.docstrings import slicing as docstrings
+from staircase.util import _split_index
 from staircase.util._decorators import Appender
 
 
@@ -19,6 +32,7 @@ class StairsSlicer:
         self._stairs = stairs
         self._interval_index = interval_index
         self._slices: pd.Series | None = None
+        self._tally: tuple | None = None
 
     def _create_slices(self) -> None:
         slices = self._interval_index.map(lambda i: clip(self._stairs, i.left, i.right))
@@ -29,16 +43,170 @@ class StairsSlicer:
             self._create_slices()
         return self
 
+    def _get_bounds(self, bounded=True) -> tuple[np.ndarray, np.ndarray] | None:
+        # the interval bounds in the representation of the step points, or None if
+        # statistics cannot be calculated without clipping the step function
+        left, left_tz = _split_index(self._interval_index.left)
+        right, _ = _split_index(self._interval_index.right)
+        step_points = self._stairs._step_points
+        if left.dtype.kind in "iuf":
+            if np.isnan(left).any() or np.isnan(right).any():
+                return None
+            if bounded and not (np.isfinite(left).all() and np.isfinite(right).all()):
+                return None
+            if step_points is not None and step_points.dtype.kind not in "iuf":
+                return None
+        elif left.dtype.kind in "mM":
+            if pd.isna(left).any() or pd.isna(right).any():
+                return None
+            if step_points is not None:
+                if step_points.dtype.kind != left.dtype.kind:
+                    return None
+                if (left_tz is None) != (self._stairs._tz is None):
+                    return None
+                left = left.astype(step_points.dtype)
+                right = right.astype(step_points.dtype)
+        else:
+            return None
+        return left, right
+
+    def _get_tally(self) -> tuple | None:
+        # the tally of the values over each interval, shared by the statistics of
+        # the distributions of the slices, or None if the step function must be
+        # clipped to calculate them
+        if self._tally is None:
+            bounds = self._get_bounds()
+            if bounds is None:
+                return None
+            self._tally = _tally_over_intervals(self._stairs, *bounds)
+        return self._tally
+
+    def _integrals_and_durations(self) -> tuple[np.ndarray, np.ndarray] | None:
+        bounds = self._get_bounds()
+        if bounds is None:
+            return None
+        return _integrals_over_intervals(self._stairs, *bounds)
+
+    def _moments(self, position: int, how: str) -> pd.Series:
+        # the mean, variance, skewness or kurtosis over each interval, as per the
+        # position in the result of _moments_over_intervals
+        bounds = self._get_bounds()
+        if bounds is None:
+            return getattr(self, f"_slices_{how}")()
+        return pd.Series(
+            _moments_over_intervals(self._stairs, *bounds)[position],
+            index=self._interval_index,
+        )
+
+    def _extrema(self, how: str) -> pd.Series:
+        # the maximum, or minimum, over the interior of each interval
+        bounds = self._get_bounds(bounded=False)
+        if bounds is None:
+            return getattr(self, f"_slices_{how}")()
+        step_points = self._stairs._step_points
+        if step_points is None:
+            first = last = np.zeros(len(self._interval_index), dtype="int64")
+        else:
+            # indexes to the values preceded by the initial value
+            first = np.searchsorted(step_points, bounds[0], side="right")
+            last = np.searchsorted(step_points, bounds[1], side="left")
+            if (last < first).any():
+                return getattr(self, f"_slices_{how}")()
+        return pd.Series(
+            _range_extrema(self._stairs, how, first, last), index=self._interval_index
+        )
+
+    def _max(self) -> pd.Series:
+        return self._extrema("max")
+
+    def _min(self) -> pd.Series:
+        return self._extrema("min")
+
     @Appender(docstrings.agg_docstring, join="\n", indents=1)
     def agg(self, funcs) -> pd.DataFrame:
         if isinstance(funcs, str):
             funcs = [funcs]
-        self._ensure_slices()
-        df = pd.DataFrame(index=self._slices.index)
+        df = pd.DataFrame(index=self._interval_index)
         for func in funcs:
             df[func] = getattr(self, func)()
         return df
 
+    @Appender(docstrings._docstrings["integral"], join="\n", indents=1)
+    def integral(self) -> pd.Series:
+        result = self._integrals_and_durations()
+        if result is None:
+            return self._slices_integral()
+        integrals, _ = result
+        left = self._get_bounds()[0]
+        if left.dtype.kind in "mM":
+            if np.nanmax(np.abs(integrals), initial=0) >= np.iinfo("int64").max:
+                raise OverflowError(
+                    "Integral calculation results in overflow error.  Consider scaling down step function values to accommodate."
+                )
+            unit = np.datetime_data(left.dtype)[0]
+            integrals = np.round(integrals).astype(f"timedelta64[{unit}]")
+        return pd.Series(integrals, index=self._interval_index)
+
+    @Appender(docstrings._docstrings["mean"], join="\n", indents=1)
+    def mean(self) -> pd.Series:
+        result = self._integrals_and_durations()
+        if result is None:
+            return self._slices_mean()
+        integrals, durations = result
+        return pd.Series(integrals / durations, index=self._interval_index)
+
+    @Appender(docstrings._docstrings["var"], join="\n", indents=1)
+    def var(self) -> pd.Series:
+        return self._moments(1, "var")
+
+    @Appender(docstrings._docstrings["std"], join="\n", indents=1)
+    def std(self) -> pd.Series:
+        return np.sqrt(self.var())
+
+    @Appender(docstrings._docstrings["skew"], join="\n", indents=1)
+    def skew(self) -> pd.Series:
+        return self._moments(2, "skew")
+
+    @Appender(docstrings._docstrings["kurtosis"], join="\n", indents=1)
+    def kurtosis(self) -> pd.Series:
+        return self._moments(3, "kurtosis")
+
+    @Appender(docstrings.describe_docstring, join="\n", indents=1)
+    def describe(self, percentiles=(25, 50, 75)) -> pd.DataFrame:
+        tally = self._get_tally()
+        if tally is None:
+            self._ensure_slices()
+            return self._slices.apply(
+                sc.Stairs.describe, percentiles=percentiles
+            ).astype({"unique": "int64"})
+        return pd.DataFrame(
+            _describe_tally(*tally, percentiles), index=self._interval_index
+        )
+
+    @Appender(docstrings.percentile_docstring, join="\n", indents=1)
+    def percentile(self, q) -> pd.Series | pd.DataFrame:
+        tally = self._get_tally()
+        if tally is None:
+            return self._slices_percentile(q)
+        offsets, ids, values, _, percentages = tally
+        result = _segmented_percentiles(offsets, ids, values, percentages, q)
+        if is_list_like(q):
+            return pd.DataFrame(result, index=self._interval_index, columns=q)
+        return pd.Series(result[:, 0], index=self._interval_index)
+
+    @Appender(docstrings._docstrings["median"], join="\n", indents=1)
+    def median(self) -> pd.Series:
+        if self._get_tally() is None:
+            return self._slices_median()
+        return self.percentile(50)
+
+    @Appender(docstrings._docstrings["mode"], join="\n", indents=1)
+    def mode(self) -> pd.Series:
+        tally = self._get_tally()
+        if tally is None:
+            return self._slices_mode()
+        return pd.Series(_segmented_modes(*tally[:4]), index=self._interval_index)
+
     @Appender(docstrings.apply_docstring, join="\n", indents=1)
     def apply(self, func: Callable, *args, **kwargs) -> pd.Series:
         self._ensure_slices()
@@ -75,11 +243,28 @@ class StairsSlicer:
         return result
 
     @Appender(docstrings.hist_docstring, join="\n", indents=1)
-    def hist(self, *args, **kwargs):
+    def hist(self, bins="unit", closed="left", stat="sum") -> pd.DataFrame:
+        bounds = self._get_bounds()
+        if bounds is None:
+            return self._slices_hist(bins=bins, closed=closed, stat=stat)
+        values, bins = _hist_over_intervals(
+            self._stairs, *bounds, bins=bins, closed=closed, stat=stat
+        )
+        return pd.DataFrame(values, index=self._interval_index, columns=bins)
+
+    def _slices_percentile(self, q) -> pd.Series | pd.DataFrame:
+        # used when intervals are not supported by the vectorised calculation
         self._ensure_slices()
-        zero = (
-            self._stairs._data.index[0] - self._stairs._data.index[0]
-        )  # hack to get 0 or pd.Timedelta(0)
+        result = self._slices.map(lambda s: s.percentile(q))
+        if is_list_like(q):
+            return pd.DataFrame(list(result), index=self._interval_index, columns=q)
+        return result
+
+    def _slices_hist(self, *args, **kwargs) -> pd.DataFrame:
+        # used when intervals are not supported by the vectorised calculation
+        self._ensure_slices()
+        step_points = self._stairs._get_index()
+        zero = step_points[0] - step_points[0]  # hack to get 0 or pd.Timedelta(0)
         return self._slices.apply(sc.Stairs.hist, *args, **kwargs).fillna(zero)
 
     @Appender(docstrings.resample_docstring, join="\n", indents=1)
@@ -88,10 +273,9 @@ class StairsSlicer:
             raise ValueError(
                 "Slices must be monotonic increasing (ascending order) and not overlapping"
             )
-        self._ensure_slices()
         new_values = getattr(self, func)()
-        left_bound = self._slices.index.left.min()
-        right_bound = self._slices.index.right.max()
+        left_bound = self._interval_index.left.min()
+        right_bound = self._interval_index.right.max()
         stairs_na = self._stairs.isna().mask((left_bound, right_bound)).fillna(0)
         return (
             self._stairs.mask((left_bound, right_bound))
@@ -114,9 +298,16 @@ def make_slice_method(method_name: str) -> Callable:
     return method
 
 
-for method_name in ["_max", "_min", "mean", "median", "integral", "mode"]:
-    method = make_slice_method(method_name)
-    setattr(StairsSlicer, method_name, method)
+# used when intervals are not supported by the vectorised calculations
+StairsSlicer._slices_median = make_slice_method("median")
+StairsSlicer._slices_mode = make_slice_method("mode")
+StairsSlicer._slices_integral = make_slice_method("integral")
+StairsSlicer._slices_mean = make_slice_method("mean")
+StairsSlicer._slices_max = make_slice_method("_max")
+StairsSlicer._slices_min = make_slice_method("_min")
+StairsSlicer._slices_var = make_slice_method("var")
+StairsSlicer._slices_skew = make_slice_method("skew")
+StairsSlicer._slices_kurtosis = make_slice_method("kurtosis")
 
 
 def slice(
@@ -9,8 +9,10 @@ modelling step functions. See :ref:`Getting Started <getting_started>` for more
 
 from __future__ import annotations
 
+import copyreg
+import datetime
 import warnings
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import numpy as np
 import pandas as pd
@@ -26,37 +28,75 @@ from staircase import docstrings
 from staircase.constants import inf
 from staircase.core import stats
 from staircase.core.accessor import CachedAccessor
-from staircase.core.layering import _check_args_dtypes
+from staircase.core.layering import _check_args_dtypes, _merge_pending_layers
+from staircase.core.stream import StairsBuilder
 from staircase.plotting.accessor import PlotAccessor
-from staircase.util import _replace_none_with_infs
+from staircase.util import (
+    _is_datetime_like,
+    _make_index,
+    _replace_none_with_infs,
+    _split_index,
+    _to_point,
+)
 from staircase.util._decorators import Appender
 
 
-def _make_deltas_from_vals(init_val, vals: pd.DataFrame) -> pd.Series:
-    if not np.isnan(vals).any():
-        result = pd.Series(
-            np.diff((np.append([init_val], vals.values))), dtype="float64"
-        )
-    else:
-        temp = pd.Series(np.append([init_val], vals.values), dtype="float64")
-        result = pd.Series.add(
-            temp[pd.notnull(temp)].diff(), temp[pd.isnull(temp)], fill_value=0
-        )[1:]
-    if np.isnan(init_val):
-        result.iloc[0] = vals.iloc[0]
-    result.index = vals.index
-    return result
-
-
-def _make_vals_from_deltas(init_val: float, deltas: pd.DataFrame):
+def _make_deltas_from_vals(init_val, vals: np.ndarray) -> np.ndarray:
+    temp = np.append([init_val], vals).astype("float64")
+    isnull = np.isnan(temp)
+    if not isnull.any():
+        return np.diff(temp)
+    # the delta at a non-null value is relative to the most recent non-null value,
+    # or zero if there is none, which makes this the inverse of a nan-skipping cumsum
+    last_valid = np.maximum.accumulate(np.where(isnull, 0, np.arange(len(temp))))
+    previous = temp[last_valid[:-1]]
+    previous[np.isnan(previous)] = 0
+    return temp[1:] - previous
+
+
+def _make_vals_from_deltas(init_val: float, deltas: np.ndarray) -> np.ndarray:
     base = 0 if np.isnan(init_val) else init_val
-    return deltas.cumsum() + base
+    values = np.nancumsum(deltas) + base
+    isnull = np.isnan(deltas)
+    if isnull.any():
+        values = np.where(isnull, np.nan, values)
+    return values
+
+
+def _read_only(array: np.ndarray | None) -> np.ndarray | None:
+    # a read-only view, which leaves the flags of the array itself unchanged
+    if array is None:
+        return None
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _merged_array(name: str) -> property:
+    # read access to the internal arrays merges any pending layers first
+    stored_name = f"_stored{name}"
+
+    def getter(self):
+        if self._pending_layers or self._pending_arrays:
+            _merge_pending_layers(self)
+        return getattr(self, stored_name)
+
+    return property(getter)
 
 
 class Stairs:
 
     class_name = "Stairs"
 
+    # the number of buffered step points, from layering single intervals, which
+    # triggers a merge into the step function
+    layer_buffer_size = 10000
+
+    _step_points = _merged_array("_step_points")
+    _deltas = _merged_array("_deltas")
+    _values = _merged_array("_values")
+    _tz = _merged_array("_tz")
+
     @Appender(docstrings.Stairs_docstring, join="\n", indents=2)
     def __init__(
         self,
@@ -68,10 +108,18 @@ class Stairs:
         closed: Literal["left", "right"] = "left",
     ):
         assert frame is None or isinstance(frame, pd.DataFrame)
-        self._data = None
-        self._valid_deltas = False
-        self._valid_values = False
-        self._masked = False
+        # step points are stored as a sorted numpy array (timezone aware datetimes
+        # as UTC, with the timezone kept separately).  Deltas and values are numpy
+        # arrays aligned with the step points, either of which may be None until
+        # required.  These arrays are read-only, so they are shared, rather than
+        # copied, by the step functions resulting from operations.  Layering single
+        # intervals appends (step point, delta) pairs to a buffer, and in-place
+        # addition appends arrays of step points and deltas to another, which are
+        # merged into the arrays when they are next read.
+        self._pending_layers = []
+        self._pending_arrays = []
+        self._pending_arrays_size = 0
+        self._set_arrays(None)
         self._closed = closed
         self.initial_value = initial_value
         self._clear_cache()
@@ -82,21 +130,46 @@ class Stairs:
     def _clear_cache(self):
         self.dist._reset()
         self._integral_and_mean = None
+        self._moments = None
+        self._prefix_integral = None
+        self._prefix_moments = None
+        self._sparse_tables = None
 
     @classmethod
     def _new(
         cls,
         initial_value: float,
-        data: pd.DataFrame,
+        step_points: np.ndarray | None = None,
+        deltas: np.ndarray | None = None,
+        values: np.ndarray | None = None,
         closed: Literal["left", "right"] = "left",
+        tz=None,
     ) -> Stairs:
         new_instance = cls(closed=closed)
         new_instance.initial_value = initial_value
-        new_instance._data = data
-        new_instance._valid_deltas = False if data is None else "delta" in data.columns
-        new_instance._valid_values = False if data is None else "value" in data.columns
+        new_instance._set_arrays(step_points, deltas, values, tz)
         return new_instance
 
+    def _set_arrays(
+        self,
+        step_points: np.ndarray | None,
+        deltas: np.ndarray | None = None,
+        values: np.ndarray | None = None,
+        tz=None,
+    ) -> Stairs:
+        if step_points is None or len(step_points) == 0:
+            self._stored_step_points = None
+            self._stored_deltas = None
+            self._stored_values = None
+            self._stored_tz = None
+        else:
+            assert deltas is not None or values is not None
+            self._stored_step_points = _read_only(step_points)
+            self._stored_deltas = _read_only(deltas)
+            self._stored_values = _read_only(values)
+            self._stored_tz = tz
+        return self
+
     @classmethod
     def from_values(
         cls,
@@ -141,45 +214,127 @@ class Stairs:
             values = values.replace([np.inf], np.nan)
             warnings.warn("Infinity values detected and have been converted to NaN")
 
-        new_instance = cls(closed=closed)
-        new_instance.initial_value = initial_value
-        new_instance._data = values.to_frame("value")
-        new_instance._valid_deltas = False
-        new_instance._valid_values = True
-        return new_instance
+        step_points, tz = _split_index(values.index)
+        return cls._new(
+            initial_value=initial_value,
+            step_points=step_points.copy(),
+            values=values.to_numpy(copy=True),
+            closed=closed,
+            tz=tz,
+        )
+
+    @classmethod
+    def from_stream(
+        cls,
+        chunks: Iterable,
+        start: str | None = "start",
+        end: str | None = "end",
+        value: str | None = None,
+        initial_value: float = 0,
+        closed: Literal["left", "right"] = "left",
+        lateness=None,
+        late: Literal["raise", "drop", "merge"] = "raise",
+    ) -> Stairs:
+        """
+        Construct :class:`Stairs` from chunks of intervals, such as a stream of events.
+
+        The chunks are added, in order, to a :class:`StairsBuilder`.  If intervals
+        arrive roughly in order of their start points, then specifying *lateness*
+        bounds the amount of data which is kept unsorted.
+
+        Parameters
+        ----------
+        chunks : iterable of :class:`pandas.DataFrame` or tuple
+            Each chunk is either a dataframe, or a tuple of the *start*, *end* and
+            (optionally) *value* parameters for :meth:`Stairs.layer`.
+        start : str, optional, default "start"
+            The name of the column of start points, when chunks are dataframes.
+        end : str, optional, default "end"
+            The name of the column of end points, when chunks are dataframes.
+        value : str, optional
+            The name of the column of values, when chunks are dataframes.
+            If None then each interval has a value of 1.
+        initial_value : float, default 0
+            The value of the step function at negative infinity.
+        closed : {"left", "right"}
+            Indicates whether the half-open intervals comprising the step function should be interpreted
+            as left-closed or right-closed.
+        lateness : int, float, or timedelta-like, optional
+            If given, the watermark is advanced after each chunk to the largest
+            start point seen, less *lateness*.
+        late : {"raise", "drop", "merge"}, default "raise"
+            How to handle intervals with a start or end point before the watermark.
 
-    def _has_na(self) -> bool | np.array:
-        return np.isnan(self._data.values).any() or np.isnan(self.initial_value)
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        StairsBuilder
+        """
+        builder = StairsBuilder(
+            initial_value=initial_value, closed=closed, lateness=lateness, late=late
+        )
+        for chunk in chunks:
+            if isinstance(chunk, pd.DataFrame):
+                builder.add(start, end, value, frame=chunk)
+            else:
+                builder.add(*chunk)
+        return builder.to_stairs()
+
+    @property
+    def _data(self) -> pd.DataFrame | None:
+        # pandas view of the internal arrays, constructed on demand
+        if self._step_points is None:
+            return None
+        columns = {}
+        if self._deltas is not None:
+            columns["delta"] = self._deltas
+        if self._values is not None:
+            columns["value"] = self._values
+        return pd.DataFrame(columns, index=self._get_index())
+
+    def _has_na(self) -> bool:
+        if np.isnan(self.initial_value):
+            return True
+        if self._step_points is None:
+            return False
+        array = self._values if self._values is not None else self._deltas
+        return bool(np.isnan(array).any())
 
     def _create_values(self) -> Stairs:
-        assert self._valid_deltas
-        self._data["value"] = _make_vals_from_deltas(
-            self.initial_value, self._data["delta"]
+        assert self._deltas is not None
+        self._stored_values = _read_only(
+            _make_vals_from_deltas(self.initial_value, self._deltas)
         )
-        self._valid_values = True
         return self
 
     def _create_deltas(self) -> Stairs:
-        assert self._valid_values
-        self._data["delta"] = _make_deltas_from_vals(
-            self.initial_value, self._data["value"]
+        assert self._values is not None
+        self._stored_deltas = _read_only(
+            _make_deltas_from_vals(self.initial_value, self._values)
         )
-        self._valid_deltas = True
         return self
 
-    def _get_deltas(self) -> pd.Series:
-        if self._data is None:
-            return pd.Series(dtype="float64")
-        if not self._valid_deltas:
+    def _get_deltas(self) -> np.ndarray:
+        if self._step_points is None:
+            return np.array([], dtype="float64")
+        if self._deltas is None:
             self._create_deltas()
-        return self._data["delta"]
+        return self._deltas
 
-    def _get_values(self) -> pd.Series:
-        if self._data is None:
-            return pd.Series(dtype="float64")
-        if not self._valid_values:
+    def _get_values(self) -> np.ndarray:
+        if self._step_points is None:
+            return np.array([], dtype="float64")
+        if self._values is None:
             self._create_values()
-        return self._data["value"]
+        return self._values
+
+    def _get_index(self) -> pd.Index:
+        if self._step_points is None:
+            return pd.Index([], dtype="float64")
+        return _make_index(self._step_points, self._tz)
 
     @property
     def closed(self):
@@ -427,7 +582,11 @@ class Stairs:
             5    1
             dtype: int64
         """
-        return self._get_deltas().copy()
+        if self._step_points is None:
+            return pd.Series(dtype="float64")
+        return pd.Series(
+            self._get_deltas(), index=self._get_index(), name="delta", copy=True
+        )
 
     @property
     def step_values(self):
@@ -460,7 +619,11 @@ class Stairs:
             5    0
             dtype: int64
         """
-        return self._get_values().copy()
+        if self._step_points is None:
+            return pd.Series(dtype="float64")
+        return pd.Series(
+            self._get_values(), index=self._get_index(), name="value", copy=True
+        )
 
     @property
     def step_points(self) -> np.array:
@@ -487,9 +650,9 @@ class Stairs:
             >>> s1.step_values
             array([1, 2, 3, 4, 5], dtype=int64)
         """
-        if self._data is None:
+        if self._step_points is None:
             return np.array([])
-        return self._data.index.values
+        return self._step_points
 
     @Appender(docstrings.examples.number_of_steps_example, join="\n", indents=2)
     @property
@@ -507,41 +670,46 @@ class Stairs:
         Stairs.step_values
         Stairs.step_points
         """
-        return len(self.step_points)
+        if self._step_points is None:
+            return 0
+        return len(self._step_points)
 
     def _remove_redundant_step_points(self) -> Stairs:
+        if self._step_points is None:
+            return self
 
         # preferred over values method
-        def remove_via_deltas() -> None:
-            remove_index = (
-                self._data["delta"].isna() & self._data["delta"].isna().shift()
-            ) | (self._data["delta"] == 0)
-            self._data = self._data.loc[~remove_index]
-
-        # do we just make deltas and then run above method?
-        def remove_via_values() -> None:
-            remove_index = (
-                self._data["value"].isna() & self._data["value"].isna().shift()
-            ) | (self._data["value"] == self._data["value"].shift())
-            if (self._data["value"].iloc[0] == self.initial_value) or (
-                pd.isnull(self._data.loc[:, "value"].iloc[0])
-                and pd.isnull(self.initial_value)
-            ):
-                remove_index.iloc[0] = True
-            self._data = self._data.loc[~remove_index]
-
-        if self._data is not None:
-            if self._valid_deltas:
-                remove_via_deltas()
-            elif self._valid_values:
-                remove_via_values()
-            else:
-                assert False, "no deltas or values valid!"
-            if len(self._data) == 0:
-                self._data = None
-
+        if self._deltas is not None:
+            isnull = np.isnan(self._deltas)
+            remove = (isnull & np.append(False, isnull[:-1])) | (self._deltas == 0)
+        elif self._values is not None:
+            isnull = np.isnan(self._values)
+            previous_isnull = np.append(np.isnan(self.initial_value), isnull[:-1])
+            previous = np.append(self.initial_value, self._values[:-1])
+            remove = (isnull & previous_isnull) | (self._values == previous)
+        else:
+            assert False, "no deltas or values valid!"
+
+        if remove.any():
+            keep = ~remove
+            self._set_arrays(
+                self._step_points[keep],
+                None if self._deltas is None else self._deltas[keep],
+                None if self._values is None else self._values[keep],
+                self._tz,
+            )
         return self
 
+    def __reduce__(self):
+        # pickled in the binary format of staircase.io, which excludes caches, if
+        # the step points can be stored in it
+        from staircase.io.pickle import _reduce
+
+        try:
+            return _reduce(self)
+        except ValueError:
+            return copyreg.__newobj__, (type(self),), vars(self)
+
     def copy(self) -> Stairs:
         """
         Returns a deep copy of this Stairs instance
@@ -550,10 +718,17 @@ class Stairs:
         -------
         :class:`Stairs`
         """
+
+        def copy_array(array):
+            return None if array is None else array.copy()
+
         new_instance = Stairs._new(
             initial_value=self.initial_value,
-            data=self._data.copy() if self._data is not None else None,
+            step_points=copy_array(self._step_points),
+            deltas=copy_array(self._deltas),
+            values=copy_array(self._values),
             closed=self.closed,
+            tz=self._tz,
         )
         return new_instance
 
@@ -572,8 +747,7 @@ class Stairs:
     @Appender(docstrings.examples.describe_example, join="\n", indents=2)
     def describe(
         self,
-        where: tuple[float | int, float | int]
-        | list[float | int, float | int] = (
+        where: tuple[float | int, float | int] | list[float | int, float | int] = (
             -inf,
             inf,
         ),
@@ -600,19 +774,7 @@ class Stairs:
         """
         where = _replace_none_with_infs(where)
         stairs = self if where == (-inf, inf) else self.clip(*where)
-
-        return pd.Series(
-            {
-                **{
-                    "unique": stairs.percentile.clip(0, 100).number_of_steps - 1,
-                    "mean": stairs.mean,
-                    "std": stairs.std,
-                    "min": stairs.min,
-                },
-                **{f"{perc}%": stairs.percentile(perc) for perc in percentiles},
-                **{"max": stairs.max},
-            }
-        )
+        return stats.distribution._describe(stairs, percentiles)
 
     @Appender(docstrings.examples.shift_example, join="\n", indents=2)
     def shift(self, delta: pd.Series | int | float) -> Stairs:
@@ -636,12 +798,16 @@ class Stairs:
         --------
         Stairs.diff
         """
-        if self._data is None:
+        if self._step_points is None:
             return Stairs(initial_value=self.initial_value)
+        step_points, tz = _split_index(self._get_index() + delta)
         return Stairs._new(
             initial_value=self.initial_value,
-            data=self._data.set_index(self._data.index + delta),
+            step_points=step_points,
+            deltas=self._deltas,
+            values=self._values,
             closed=self.closed,
+            tz=tz,
         )
 
     @Appender(docstrings.examples.diff_example, join="\n", indents=2)
@@ -666,11 +832,43 @@ class Stairs:
         """
         return self - self.shift(delta)
 
+    def _rolling_windows(self, window, where):
+        # returns the step function clipped to *where*, the focal points at which a
+        # rolling statistic may change gradient (or value), and the window deltas in
+        # the representation of the step points.  The focal points are None if there
+        # are no step points.
+        where = _replace_none_with_infs(where)
+        assert len(window) == 2, "Window should be a listlike object of length 2."
+        lower, upper = where
+        clipped = self.clip(lower, upper)
+        if clipped._step_points is None:
+            return clipped, None, None, None
+        step_points = clipped._step_points
+        left_delta, right_delta = (_to_point(delta) for delta in window)
+        if step_points.dtype.kind in "mM":
+            unit = np.datetime_data(step_points.dtype)[0]
+            left_delta = left_delta.astype(f"timedelta64[{unit}]")
+            right_delta = right_delta.astype(f"timedelta64[{unit}]")
+        focal_points = np.concatenate(
+            [step_points - left_delta, step_points - right_delta]
+        )
+        focal_points.sort(kind="stable")  # merges the two sorted runs
+        focal_points = focal_points[
+            np.append(True, focal_points[1:] != focal_points[:-1])
+        ]
+        keep = np.ones(len(focal_points), dtype=bool)
+        if lower != -inf:
+            keep &= focal_points >= _to_point(lower) - left_delta
+        if upper != inf:
+            keep &= focal_points <= _to_point(upper) - right_delta
+        return clipped, focal_points[keep], left_delta, right_delta
+
     @Appender(docstrings.examples.rolling_mean_example, join="\n", indents=2)
     def rolling_mean(
         self,
         window: tuple[int | int] = (0, 0),
         where: tuple[float | float] = (-inf, inf),
+        engine: Literal["prefix", "slice"] = "prefix",
     ) -> pd.Series:
         """
         Returns coordinates defining rolling mean
@@ -693,6 +891,10 @@ class Stairs:
         where : tuple or list of length two, optional
             Indicates the domain interval over which to evaluate the step function.
             Default is (-sc.inf, sc.inf) or equivalently (None, None).
+        engine : {"prefix", "slice"}, default "prefix"
+            If "prefix" the means are calculated from the cumulative integral of the
+            step function.  If "slice" the step function is clipped to each window,
+            which is much slower but may be useful for verification.
 
         Returns
         -------
@@ -700,16 +902,31 @@ class Stairs:
 
         See Also
         --------
-        Stairs.mean
+        Stairs.mean, Stairs.rolling_integral
         """
+        if engine == "slice":
+            return self._rolling_mean_via_slices(window, where)
+        clipped, focal_points, left_delta, right_delta = self._rolling_windows(
+            window, where
+        )
+        if focal_points is None:
+            return pd.Series([clipped.initial_value] * 2, index=where)
+        integrals, durations = stats.statistic._integrals_over_intervals(
+            clipped, focal_points + left_delta, focal_points + right_delta
+        )
+        return pd.Series(
+            integrals / durations, index=_make_index(focal_points, clipped._tz)
+        )
+
+    def _rolling_mean_via_slices(self, window, where):
         where = _replace_none_with_infs(where)
         assert len(window) == 2, "Window should be a listlike object of length 2."
         left_delta, right_delta = window
         lower, upper = where
         clipped = self.clip(lower, upper)
-        if clipped._data is None:
+        if clipped._step_points is None:
             return pd.Series([clipped.initial_value] * 2, index=where)
-        step_points = clipped._data.index
+        step_points = clipped._get_index()
         sample_points = pd.Index.union(
             step_points - left_delta,
             step_points - right_delta,
@@ -718,7 +935,7 @@ class Stairs:
             sample_points + left_delta, sample_points + right_delta
         )
         s = pd.Series(
-            clipped.slice(ii).mean().values,
+            clipped.slice(ii)._slices_mean().values,
             index=sample_points,
         )
         if lower != -inf:
@@ -727,6 +944,275 @@ class Stairs:
             s = s.loc[s.index <= upper - right_delta]
         return s
 
+    @Appender(docstrings.examples.rolling_integral_example, join="\n", indents=2)
+    def rolling_integral(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> pd.Series:
+        """
+        Returns coordinates defining rolling integral
+
+        The rolling integral, like the rolling mean, is a continuous piece-wise linear function.
+        It is described by the x,y coordinates which mark where the function changes gradient,
+        returned as a :class:`pandas.Series`.  The window is defined as per :meth:`Stairs.rolling_mean`.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`pandas.Series`
+
+        See Also
+        --------
+        Stairs.integral, Stairs.rolling_mean
+        """
+        clipped, focal_points, left_delta, right_delta = self._rolling_windows(
+            window, where
+        )
+        if focal_points is None:
+            width = window[1] - window[0]
+            return pd.Series([clipped.initial_value * width] * 2, index=where)
+        integrals, _ = stats.statistic._integrals_over_intervals(
+            clipped, focal_points + left_delta, focal_points + right_delta
+        )
+        if focal_points.dtype.kind in "mM":
+            unit = np.datetime_data(focal_points.dtype)[0]
+            integrals = np.round(integrals).astype(f"timedelta64[{unit}]")
+        return pd.Series(integrals, index=_make_index(focal_points, clipped._tz))
+
+    def _rolling_extrema(self, how, window, where):
+        clipped, focal_points, left_delta, right_delta = self._rolling_windows(
+            window, where
+        )
+        if focal_points is None:
+            return clipped.copy()
+        step_points = clipped._step_points
+        # the value for each focal point applies until the next focal point, during
+        # which the windows contain the same step points.  Step points are shifted,
+        # rather than focal points, so that the comparisons are exact.
+        first = np.searchsorted(step_points - left_delta, focal_points, side="right")
+        last = np.searchsorted(step_points - right_delta, focal_points, side="right")
+        values = stats.statistic._range_extrema(clipped, how, first, last)
+        initial_value = stats.statistic._range_extrema(
+            clipped, how, np.array([0]), np.array([0])
+        )[0]
+        result = self.__class__._new(
+            initial_value=initial_value,
+            step_points=focal_points,
+            values=values,
+            closed=self._closed,
+            tz=clipped._tz,
+        )._remove_redundant_step_points()
+        # the first and last focal points correspond to *where*, if it is bounded
+        lower, upper = _replace_none_with_infs(where)
+        focal_index = _make_index(focal_points, clipped._tz)
+        if len(focal_index) and (lower != -inf or upper != inf):
+            result = result.clip(
+                focal_index[0] if lower != -inf else None,
+                focal_index[-1] if upper != inf else None,
+            )
+        return result
+
+    @Appender(docstrings.examples.rolling_max_example, join="\n", indents=2)
+    def rolling_max(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> Stairs:
+        """
+        Returns the rolling maximum as a step function
+
+        The rolling maximum of a step function is itself a step function.  The value at a
+        focal point is the maximum of the step function over the window, which is defined
+        as per :meth:`Stairs.rolling_mean`.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        Stairs.max, Stairs.rolling_min, Stairs.rolling_mean
+        """
+        return self._rolling_extrema("max", window, where)
+
+    @Appender(docstrings.examples.rolling_min_example, join="\n", indents=2)
+    def rolling_min(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> Stairs:
+        """
+        Returns the rolling minimum as a step function
+
+        The rolling minimum of a step function is itself a step function.  The value at a
+        focal point is the minimum of the step function over the window, which is defined
+        as per :meth:`Stairs.rolling_mean`.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        Stairs.min, Stairs.rolling_max, Stairs.rolling_mean
+        """
+        return self._rolling_extrema("min", window, where)
+
+    def _grid_edges(self, freq, where):
+        # the edges of consecutive intervals of length freq, aligned to multiples of
+        # freq, which cover *where*, or the step points if it is unbounded
+        lower, upper = _replace_none_with_infs(where)
+        if self._step_points is None and (lower == -inf or upper == inf):
+            raise ValueError(
+                "The grid must be bounded by 'where' if there are no step points."
+            )
+        index = self._get_index()
+        lower = index[0] if lower == -inf else lower
+        upper = index[-1] if upper == inf else upper
+        if not lower < upper:
+            raise ValueError("'where' must be an interval of positive length.")
+        if _is_datetime_like(lower):
+            offset = pd.tseries.frequencies.to_offset(freq)
+            if isinstance(lower, (pd.Timedelta, datetime.timedelta, np.timedelta64)):
+                lower, upper = pd.Timedelta(lower), pd.Timedelta(upper)
+                start, date_range = lower.floor(offset), pd.timedelta_range
+            elif isinstance(offset, pd.offsets.Tick):
+                lower, upper = pd.Timestamp(lower), pd.Timestamp(upper)
+                start, date_range = lower.floor(offset), pd.date_range
+            else:
+                lower, upper = pd.Timestamp(lower), pd.Timestamp(upper)
+                start, date_range = offset.rollback(lower.normalize()), pd.date_range
+            edges = date_range(start, upper, freq=offset)
+            if edges[-1] < upper:
+                edges = edges.append(pd.Index([edges[-1] + offset]))
+            return _split_index(edges)
+        start = np.floor(lower / freq) * freq
+        intervals = max(int(np.ceil((upper - start) / freq)), 1)
+        return start + freq * np.arange(intervals + 1), None
+
+    @Appender(docstrings.examples.resample_grid_example, join="\n", indents=2)
+    def resample_grid(
+        self,
+        freq,
+        agg: Literal["mean", "max", "min", "integral", "last"] = "mean",
+        where: tuple[float | float] = (-inf, inf),
+        as_series: bool = False,
+    ) -> Stairs | pd.Series:
+        """
+        Aggregates the step function over the intervals of a regular grid
+
+        The grid consists of consecutive intervals whose length is given by *freq*, and which are
+        aligned to multiples of *freq*.  The aggregate for every interval is calculated at once,
+        from the cumulative integral of the step function, or a table of the extrema of its values,
+        which is much faster than using :meth:`StairsSlicer.resample` for many intervals.
+
+        Parameters
+        ----------
+        freq : int, float, str, pandas.Timedelta or pandas.DateOffset
+            The length of each interval.  Must be a number if the step points are numbers, and
+            otherwise a frequency understood by :func:`pandas.tseries.frequencies.to_offset`, for
+            example "1min".
+        agg : {"mean", "max", "min", "integral", "last"}, default "mean"
+            The aggregate of the step function over each interval.  If "last" then the value at the
+            end of each interval.
+        where : tuple or list of length two, optional
+            Indicates the domain interval to be covered by the grid.  Default is (-sc.inf, sc.inf), or
+            equivalently (None, None), in which case the grid covers the step points.
+        as_series : bool, default False
+            If True then the aggregates are returned in a :class:`pandas.Series`, indexed by the
+            intervals of the grid, rather than as a step function.
+
+        Returns
+        -------
+        :class:`Stairs` or :class:`pandas.Series`
+            If a step function then it is equal to the aggregate on each interval of the grid,
+            and equal to *self* outside of the grid.
+
+        See Also
+        --------
+        Stairs.slice, StairsSlicer.resample
+        """
+        edges, tz = self._grid_edges(freq, where)
+        step_points = self._step_points
+        if step_points is not None and step_points.dtype.kind in "mM":
+            edges = edges.astype(step_points.dtype)
+        left, right = edges[:-1], edges[1:]
+        if agg in ("mean", "integral"):
+            integrals, durations = stats.statistic._integrals_over_intervals(
+                self, left, right
+            )
+            values = integrals / durations if agg == "mean" else integrals
+        elif agg in ("max", "min"):
+            if step_points is None:
+                values = np.full(len(left), self.initial_value, dtype=float)
+            else:
+                # indexes to the values preceded by the initial value
+                first = np.searchsorted(step_points, left, side="right")
+                last = np.searchsorted(step_points, right, side="left")
+                values = stats.statistic._range_extrema(self, agg, first, last)
+        elif agg == "last":
+            values = self.limit(right, side="left")
+        else:
+            raise ValueError(
+                "'agg' must be one of 'mean', 'max', 'min', 'integral' or 'last'."
+            )
+        is_dates = edges.dtype.kind in "mM"
+        if as_series:
+            if agg == "integral" and is_dates:
+                unit = np.datetime_data(edges.dtype)[0]
+                values = np.round(values).astype(f"timedelta64[{unit}]")
+            index = pd.IntervalIndex.from_arrays(
+                _make_index(left, tz), _make_index(right, tz), closed=self._closed
+            )
+            return pd.Series(values, index=index)
+        if agg == "integral" and is_dates:
+            raise ValueError(
+                "Integrals over intervals of dates are durations, which cannot be the values of a step function.  Use as_series=True."
+            )
+        if step_points is None:
+            step_points = np.array([], dtype=edges.dtype)
+            step_values = np.array([], dtype=float)
+        else:
+            step_values = self._get_values()
+        before, after = step_points < edges[0], step_points > edges[-1]
+        amended_values = np.append(self.initial_value, step_values)
+        final_value = amended_values[np.searchsorted(step_points, edges[-1], "right")]
+        return self.__class__._new(
+            initial_value=self.initial_value,
+            step_points=np.concatenate(
+                [step_points[before], edges, step_points[after]]
+            ),
+            values=np.concatenate(
+                [step_values[before], values, [final_value], step_values[after]]
+            ),
+            closed=self._closed,
+            tz=tz if tz is not None else self._tz,
+        )._remove_redundant_step_points()
+
     def to_frame(self) -> pd.DataFrame:
         """
         Returns a pandas.DataFrame with columns 'start', 'end' and 'value'
@@ -754,17 +1240,15 @@ class Stairs:
         4     4    5     -1
         5     5  inf      0
         """
-        if self._data is None:
+        if self._step_points is None:
             starts = [-inf]
             ends = [inf]
             values = [self.initial_value]
         else:
-            if not self._valid_values:
-                self._create_values()
-            step_points = self._data.index
+            step_points = self._get_index()
             starts = [-inf] + step_points.to_list()
             ends = step_points.to_list() + [inf]
-            values = np.append(self.initial_value, self._data["value"].values)
+            values = np.append(self.initial_value, self._get_values())
         return pd.DataFrame({"start": starts, "end": ends, "value": values})
 
     def pipe(self, func: Callable, *args, **kwargs) -> Any:
@@ -806,10 +1290,11 @@ class Stairs:
 
 
 def _add_operations() -> None:
-    from staircase.core import layering, ops, sampling, slicing
+    from staircase.core import layering, lazy, ops, sampling, slicing
 
     ops.add_operations(Stairs)
     stats.add_methods(Stairs)
     sampling.add_methods(Stairs)
     layering.add_methods(Stairs)
     slicing.add_methods(Stairs)
+    lazy.add_methods(Stairs)
@@ -2,17 +2,23 @@ from staircase.core.accessor import CachedAccessor
 from staircase.core.stats.statistic import _max as max
 from staircase.core.stats.statistic import _min as min
 from staircase.core.stats.statistic import (
+    acorr,
+    acov,
     agg,
     corr,
     cov,
     integral,
+    kurtosis,
     mean,
     median,
     mode,
+    skew,
     std,
     value_sums,
     values_in_range,
     var,
+    xcorr,
+    xcov,
 )
 
 
@@ -23,6 +29,10 @@ def add_methods(cls):
     cls.values_in_range = values_in_range
     cls.cov = cov
     cls.corr = corr
+    cls.xcov = xcov
+    cls.xcorr = xcorr
+    cls.acov = acov
+    cls.acorr = acorr
     cls.agg = agg
 
     cls.integral = integral
@@ -31,5 +41,7 @@ def add_methods(cls):
     cls.mode = mode
     cls.std = std
     cls.var = var
+    cls.skew = skew
+    cls.kurtosis = kurtosis
 
     cls.dist = CachedAccessor("dist", Dist)
@@ -5,6 +5,370 @@ import pandas as pd
 
 import staircase as sc
 
+_NO_VALUES = "There are no values which are not null over an interval of finite length."
+
+
+def _sorted_values(stairs):
+    """
+    Sums the lengths of the intervals over which each value of a step function
+    occurs, in order of the values, and cumulates them as probabilities.
+
+    Parameters
+    ----------
+    stairs : :class:`Stairs`
+
+    Returns
+    -------
+    tuple
+        The sorted unique values which are not null, their probabilities, the
+        cumulative probabilities, and the total weight, which is a timedelta if
+        the step points are datetime-like.  The arrays are empty if all values
+        between the step points are null.
+
+    Raises
+    ------
+    ValueError
+        If there are no step points.
+    """
+    if stairs._step_points is None:
+        raise ValueError(_NO_VALUES)
+    # null values are coded as -1 by factorize
+    codes, values = pd.factorize(stairs._get_values()[:-1], sort=True)
+    weights = np.diff(stairs._step_points)
+    if codes[codes.argmin()] < 0:
+        notnull = codes >= 0
+        codes, weights = codes[notnull], weights[notnull]
+    total = weights.sum()
+    if weights.dtype.kind == "m":
+        total = pd.Timedelta(total)
+        weights = weights.view("int64")
+    weights = np.bincount(codes, weights=weights, minlength=len(values))
+    if not len(values):
+        return values, weights, weights, total
+    # cumulating the weights before normalising is exact for integer weights, so
+    # that cumulative probabilities which should equal a percentile do
+    cumulative = np.cumsum(weights)
+    return values, weights / cumulative[-1], cumulative / cumulative[-1], total
+
+
+def _segmented_tally(ids, values, durations, size):
+    """
+    Sums the durations of each value in each of many segments, as per
+    :func:`_sorted_values`, such as the slices of a step function.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        The segment, in ``range(size)``, of each value.
+    values, durations : numpy.ndarray
+        Values which are not null, and their positive durations, which may be
+        timedeltas.
+    size : int
+        The number of segments.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Offsets, such that the tally of segment i is at ``offsets[i]:offsets[i + 1]``,
+        and for each entry of the tally its segment, its value, the sum of its
+        durations, as a float, and the cumulative percentage of the segment up to
+        and including it.  Values are sorted within each segment.
+    """
+    if durations.dtype.kind == "m":
+        durations = durations.view("int64")
+    # sorts by segment and value, as per numpy.lexsort, with a sort of the values
+    # and a sort of integer keys, which is several times faster
+    by_value = np.argsort(values)
+    keys = ids[by_value] * len(values) + np.arange(len(values))
+    order = by_value[np.sort(keys) % max(len(values), 1)]
+    ids, values, durations = ids[order], values[order], durations[order]
+    boundaries = np.ones(len(ids), dtype=bool)
+    boundaries[1:] = (ids[1:] != ids[:-1]) | (values[1:] != values[:-1])
+    boundaries = np.flatnonzero(boundaries)
+    if len(boundaries):
+        durations = np.add.reduceat(durations, boundaries)
+    ids, values = ids[boundaries], values[boundaries]
+    offsets = np.searchsorted(ids, np.arange(size + 1))
+    # durations of timedeltas are cumulated as integers, which is exact
+    cumulative = np.append(0, np.cumsum(durations))
+    starts = cumulative[offsets[:-1]]
+    totals = cumulative[offsets[1:]] - starts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = (cumulative[1:] - starts[ids]) / totals[ids] * 100
+    return offsets, ids, values, durations.astype("float64"), percentages
+
+
+def _segmented_percentiles(offsets, ids, values, percentages, q):
+    """
+    Samples the percentiles of each segment of a tally, as per :meth:`Xtiles.sample`
+    for the percentiles of each segment.
+
+    Parameters
+    ----------
+    offsets, ids, values, percentages : numpy.ndarray
+        A tally, as per :func:`_segmented_tally`.
+    q : array-like of float
+        The percentiles.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array with a row for each segment, and a column for each percentile.
+        Null for segments without values.
+    """
+    q = np.asarray(q, dtype="float64").reshape(-1)
+    # null percentiles are beyond all step points of the percentile function
+    q = np.where(np.isnan(q), np.inf, q)
+    # The cumulative percentages are compared with the percentiles by coding
+    # both as integers, which preserve their order within each segment.  The
+    # value at a percentile is the mean of the values before and after it, as
+    # found by a binary search of the codes.
+    distinct = np.unique(q)
+    width = 2 * len(distinct) + 2
+    positions = np.searchsorted(distinct, percentages)
+    matches = distinct[np.minimum(positions, len(distinct) - 1)] == percentages
+    codes = ids * width + 2 * positions + matches
+    segments = np.arange(len(offsets) - 1)[:, None]
+    query_codes = segments * width + 2 * np.searchsorted(distinct, q) + 1
+    last = (offsets[1:] - 1)[:, None]
+    empty = offsets[1:] == offsets[:-1]
+    padded_values = np.append(values, np.nan)
+    result = []
+    for side in ("left", "right"):
+        index = np.minimum(np.searchsorted(codes, query_codes, side=side), last)
+        index[empty] = len(values)
+        result.append(padded_values[index])
+    return (result[0] + result[1]) / 2
+
+
+def _segmented_modes(offsets, ids, values, durations):
+    """
+    Finds the value with the greatest duration in each segment of a tally, as per
+    :func:`_segmented_tally`, or the least such value if there are several, as per
+    :meth:`Stairs.mode`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Null for segments without values.
+    """
+    size = len(offsets) - 1
+    nonempty = offsets[1:] > offsets[:-1]
+    maxima = np.full(size, np.inf)
+    if nonempty.any():
+        maxima[nonempty] = np.maximum.reduceat(durations, offsets[:-1][nonempty])
+    candidates = np.flatnonzero(durations == maxima[ids])
+    # values are sorted within each segment, so the first candidate is the least
+    firsts = np.ones(len(candidates), dtype=bool)
+    firsts[1:] = ids[candidates[1:]] != ids[candidates[:-1]]
+    modes = np.full(size, np.nan)
+    modes[ids[candidates[firsts]]] = values[candidates[firsts]]
+    return modes
+
+
+def _describe_tally(offsets, ids, values, durations, percentages, percentiles):
+    """
+    Calculates the statistics of :meth:`Stairs.describe` for each segment of a
+    tally, as per :func:`_segmented_tally`.
+
+    Returns
+    -------
+    dict
+        Arrays of the statistics, with an entry for each segment, keyed by name.
+    """
+    size = len(offsets) - 1
+    counts = np.diff(offsets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        totals = np.bincount(ids, weights=durations, minlength=size)
+        means = np.bincount(ids, weights=durations * values, minlength=size) / totals
+        # the corrected two-pass algorithm, as per Stairs.var
+        deviations = values - means[ids]
+        corrections = (
+            np.bincount(ids, weights=durations * deviations, minlength=size) / totals
+        )
+        variances = (
+            np.bincount(ids, weights=durations * deviations**2, minlength=size) / totals
+            - corrections**2
+        )
+    variances[counts == 1] = 0
+    padded_values = np.append(values, np.nan)
+    firsts = np.where(counts > 0, offsets[:-1], len(values))
+    lasts = np.where(counts > 0, offsets[1:] - 1, len(values))
+    return {
+        "unique": counts,
+        "mean": means,
+        "std": np.sqrt(np.maximum(variances, 0)),
+        "min": padded_values[firsts],
+        **dict(
+            zip(
+                [f"{percentile}%" for percentile in percentiles],
+                _segmented_percentiles(
+                    offsets, ids, values, percentages, percentiles
+                ).T,
+            )
+        ),
+        "max": padded_values[lasts],
+    }
+
+
+def _pieces_over_intervals(stairs, left, right):
+    """
+    Clips the pieces of a step function, over which it is constant, to each of
+    many intervals.
+
+    Parameters
+    ----------
+    stairs : :class:`Stairs`
+    left, right : numpy.ndarray
+        The bounds of the intervals, in the same representation as the step points.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The interval, value and duration of each clipped piece which is not null
+        and has positive duration.  Durations are timedeltas for datetime step
+        functions.
+    """
+    size = len(left)
+    if stairs._step_points is None:
+        ids = np.arange(size)
+        values = np.full(size, stairs.initial_value, dtype="float64")
+        starts, ends = left, right
+    else:
+        step_points = stairs._step_points
+        # piece i of the step function precedes step point i, and the first and
+        # last pieces are unbounded
+        first = np.searchsorted(step_points, left, side="right")
+        last = np.searchsorted(step_points, right, side="left")
+        counts = np.maximum(last - first + 1, 0)
+        ids = np.repeat(np.arange(size), counts)
+        pieces = (
+            first[ids]
+            + np.arange(len(ids))
+            - np.repeat(np.cumsum(counts) - counts, counts)
+        )
+        values = np.append(stairs.initial_value, stairs._get_values())[pieces]
+        count = len(step_points)
+        starts = np.where(
+            pieces > 0,
+            np.maximum(step_points[np.maximum(pieces - 1, 0)], left[ids]),
+            left[ids],
+        )
+        ends = np.where(
+            pieces < count,
+            np.minimum(step_points[np.minimum(pieces, count - 1)], right[ids]),
+            right[ids],
+        )
+    durations = ends - starts
+    keep = ~np.isnan(values) & (durations > durations.dtype.type(0))
+    return ids[keep], values[keep].astype("float64"), durations[keep]
+
+
+def _tally_over_intervals(stairs, left, right):
+    """
+    Tallies the values of a step function over many intervals, as per
+    :func:`_segmented_tally`.
+
+    Parameters
+    ----------
+    stairs : :class:`Stairs`
+    left, right : numpy.ndarray
+        The bounds of the intervals, in the same representation as the step points.
+    """
+    return _segmented_tally(*_pieces_over_intervals(stairs, left, right), len(left))
+
+
+def _hist_over_intervals(stairs, left, right, bins="unit", closed="left", stat="sum"):
+    """
+    Calculates histogram data for a step function over each of many intervals, as
+    per :meth:`Stairs.hist`.
+
+    Parameters
+    ----------
+    stairs : :class:`Stairs`
+    left, right : numpy.ndarray
+        The bounds of the intervals, in the same representation as the step points.
+    bins, closed, stat
+        As per :meth:`Stairs.hist`.  Unit bins cover the values over all intervals.
+
+    Returns
+    -------
+    tuple
+        An array with a row for each interval and a column for each bin, and the
+        bins, as a :class:`pandas.IntervalIndex`.
+    """
+    ids, values, durations = _pieces_over_intervals(stairs, left, right)
+    size = len(left)
+    if isinstance(bins, str) and bins == "unit":
+        if not len(values):
+            raise ValueError(_NO_VALUES)
+        round_func = np.floor if closed == "left" else np.ceil
+        bins = range(
+            int(round_func(values.min())) - (closed == "right"),
+            int(round_func(values.max())) + (closed == "left") + 1,
+        )
+    if not isinstance(bins, pd.IntervalIndex):
+        bins = pd.IntervalIndex.from_breaks(bins, closed=closed)
+    lefts = bins.left.to_numpy(dtype="float64")
+    rights = bins.right.to_numpy(dtype="float64")
+
+    # the bin containing each value, found from the right bounds of the bins,
+    # which are non-overlapping and monotonic increasing
+    positions = np.searchsorted(
+        rights, values, side="right" if bins.closed == "left" else "left"
+    )
+    inside = positions < len(bins)
+    positions = np.minimum(positions, len(bins) - 1)
+    if bins.closed == "left":
+        inside &= lefts[positions] <= values
+    else:
+        inside &= lefts[positions] < values
+    cells = ids[inside] * len(bins) + positions[inside]
+
+    timedeltas = durations.dtype.kind == "m"
+    if timedeltas:
+        # as per Stairs.integral, durations of datetimes are summed as integers
+        unit = np.datetime_data(durations.dtype)[0]
+        durations = durations.view("int64")
+        sums = np.zeros(size * len(bins), dtype="int64")
+        np.add.at(sums, cells, durations[inside])
+    else:
+        sums = np.bincount(cells, weights=durations[inside], minlength=size * len(bins))
+    sums = sums.reshape(size, len(bins))
+
+    # inspired by seaborn.histplot, as per ECDF.hist.  Histograms which cannot be
+    # normalised are zero, as are bins without values.
+    if stat in ("probability", "density"):
+        if stat == "probability":
+            totals = np.bincount(ids, weights=durations, minlength=size)
+        else:
+            totals = sums @ (rights - lefts)
+        totals = np.where(totals == 0, np.inf, totals)
+        return sums / totals[:, None], bins
+    result = sums / (rights - lefts) if stat == "frequency" else sums
+    if timedeltas:
+        result = np.round(result).astype("int64").view(f"timedelta64[{unit}]")
+    return result, bins
+
+
+def _describe(stairs, percentiles):
+    # the implementation of Stairs.describe, from the tally of the values
+    try:
+        values, probabilities, cumulative_probabilities, _ = stairs.dist._get_sorted()
+    except ValueError:
+        values = probabilities = cumulative_probabilities = np.array([])
+    result = _describe_tally(
+        np.array([0, len(values)]),
+        np.zeros(len(values), dtype="int64"),
+        values,
+        probabilities,
+        cumulative_probabilities * 100,
+        percentiles,
+    )
+    # the minimum and maximum are over the whole step function, as per Stairs.min
+    result["min"], result["max"] = [stairs.min()], [stairs.max()]
+    return pd.Series({name: column[0] for name, column in result.items()}, dtype=float)
+
 
 class Xtiles(sc.core.stairs.Stairs):
 
@@ -12,22 +376,31 @@ class Xtiles(sc.core.stairs.Stairs):
     scale_factor = None
 
     def sample(self, x):
-        return (self.limit(x, side="left") + self.limit(x, side="right")) / 2
+        # the mean of the left and right limits, with a binary search of the step
+        # points for each
+        amended_values = np.append(self.initial_value, self._get_values())
+        left = amended_values[np.searchsorted(self._step_points, x, side="left")]
+        right = amended_values[np.searchsorted(self._step_points, x, side="right")]
+        return (left + right) / 2
 
     def __call__(self, *args, **kwargs):
         return self.sample(*args, **kwargs)
 
     @classmethod
-    def from_ecdf(cls, ecdf):
-        assert ecdf._data is not None
+    def _from_sorted_values(cls, values, cumulative_probabilities):
+        if not len(values):
+            raise ValueError(_NO_VALUES)
         return cls._new(
-            initial_value=ecdf._data.index[0],
-            data=pd.DataFrame(
-                {"value": np.append(ecdf._data.index, ecdf._data.index[-1])},
-                index=np.append(0, ecdf._get_values().values * cls.scale_factor),
-            ),
+            initial_value=values[0],
+            step_points=np.append(0, cumulative_probabilities * cls.scale_factor),
+            values=np.append(values, values[-1]),
         )
 
+    @classmethod
+    def from_ecdf(cls, ecdf):
+        assert ecdf._step_points is not None
+        return cls._from_sorted_values(ecdf._step_points, ecdf._get_values())
+
 
 class Percentiles(Xtiles):
 
@@ -42,9 +415,11 @@ class Fractiles(Xtiles):
 
     def to_percentiles(self):
 
-        data = self._get_values().copy()
-        data.index = data.index * 100
-        return Percentiles._new(initial_value=self.initial_value, data=data.to_frame())
+        return Percentiles._new(
+            initial_value=self.initial_value,
+            step_points=self._step_points * 100,
+            values=self._get_values(),
+        )
 
 
 class ECDF(sc.core.stairs.Stairs):
@@ -53,22 +428,26 @@ class ECDF(sc.core.stairs.Stairs):
 
     @staticmethod
     def from_stairs(stairs):
-        ecdf_deltas = stairs.value_sums(dropna=True).rename("delta")
-        deltas_sum = ecdf_deltas.sum()
-        normalized_probability_deltas = ecdf_deltas / deltas_sum
+        return ECDF._from_sorted_values(*_sorted_values(stairs))
 
+    @staticmethod
+    def _from_sorted_values(values, probabilities, cumulative_probabilities, total):
         ecdf = ECDF._new(
             initial_value=0,
-            data=normalized_probability_deltas.to_frame(),
+            step_points=values,
+            deltas=probabilities,
+            values=cumulative_probabilities,
             closed="left",
         )
-        ecdf._denormalize_probability_factor = deltas_sum
+        ecdf._denormalize_probability_factor = total
         return ecdf
 
     def hist(self, bins="unit", closed="left", stat="sum"):
 
         step_points = self.step_points
         if isinstance(bins, str) and bins == "unit":
+            if not len(step_points):
+                raise ValueError(_NO_VALUES)
             round_func = math.floor if closed == "left" else math.ceil
             bins = range(
                 round_func(min(step_points)) - (closed == "right"),
@@ -111,14 +490,21 @@ class Dist:
         self._stairs = stairs
 
     def _reset(self):
+        self._sorted = None
         self._ecdf = None
         self._fractiles = None
         self._percentiles = None
 
+    def _get_sorted(self):
+        # the sorted values, shared by the ECDF, fractiles and percentiles
+        if self._sorted is None:
+            self._sorted = _sorted_values(self._stairs)
+        return self._sorted
+
     @property
     def ecdf(self):
         if self._ecdf is None:
-            self._ecdf = ECDF.from_stairs(self._stairs)
+            self._ecdf = ECDF._from_sorted_values(*self._get_sorted())
         return self._ecdf
 
     def hist(self, bins="unit", closed="left", stat="sum"):
@@ -127,13 +513,19 @@ class Dist:
     @property
     def fractile(self):
         if self._fractiles is None:
-            self._fractiles = Fractiles.from_ecdf(self.ecdf)
+            values, _, cumulative_probabilities, _ = self._get_sorted()
+            self._fractiles = Fractiles._from_sorted_values(
+                values, cumulative_probabilities
+            )
         return self._fractiles
 
     @property
     def percentile(self):
         if self._percentiles is None:
-            self._percentiles = Percentiles.from_ecdf(self.ecdf)
+            values, _, cumulative_probabilities, _ = self._get_sorted()
+            self._percentiles = Percentiles._from_sorted_values(
+                values, cumulative_probabilities
+            )
         return self._percentiles
 
     def quantiles(self, n):
@@ -86,6 +86,20 @@ var_example = _stat_example.format(
     stairs2="s3",
     result2="0.805555",
 )
+skew_example = _stat_example.format(
+    func="skew",
+    stairs1="s1",
+    result1="-0.493382",
+    stairs2="s3",
+    result2="-0.332971",
+)
+kurtosis_example = _stat_example.format(
+    func="kurtosis",
+    stairs1="s1",
+    result1="-1.371901",
+    stairs2="s3",
+    result2="-1.676576",
+)
 
 
 def _get_example(calculation):
@@ -98,6 +112,8 @@ def _get_example(calculation):
         "mode": mode_example,
         "var": var_example,
         "std": std_example,
+        "skew": skew_example,
+        "kurtosis": kurtosis_example,
     }[calculation]
 
 
@@ -106,6 +122,8 @@ _calc_map = {
     "percentile": "x-th percentile",
     "var": "variance",
     "std": "standard deviation",
+    "skew": "skewness",
+    "kurtosis": "excess kurtosis",
 }
 
 _see_also_map = {
@@ -116,6 +134,8 @@ _see_also_map = {
     "mode": "Stairs.mean, Stairs.median",
     "var": "Stairs.std",
     "std": "Stairs.var",
+    "skew": "Stairs.kurtosis, Stairs.var",
+    "kurtosis": "Stairs.skew, Stairs.var",
 }
 
 
@@ -141,6 +161,8 @@ median_docstring = _gen_docstring("median")
 mode_docstring = _gen_docstring("mode")
 var_docstring = _gen_docstring("var")
 std_docstring = _gen_docstring("std")
+skew_docstring = _gen_docstring("skew")
+kurtosis_docstring = _gen_docstring("kurtosis")
 
 
 # AGG ------------------------------------------------------------------
@@ -150,7 +172,7 @@ Returns the aggregation of the step function defined over a domain.
 
 Parameters
 ----------
-name : {'max', 'min', 'mode', 'median', 'mean', 'integral', 'var', 'std'}
+name : {'max', 'min', 'mode', 'median', 'mean', 'integral', 'var', 'std', 'skew', 'kurtosis'}
     The name of the function which which to perform the aggregation.
 where : tuple or list of length two, optional
     Indicates the domain interval over which to evaluate the step function.
@@ -167,7 +189,7 @@ float
 
 See Also
 --------
-Stairs.max, Stairs.min, Stairs.mode, Stairs.median, Stairs.mean, Stairs.integral, Stairs.var, Stairs.std
+Stairs.max, Stairs.min, Stairs.mode, Stairs.median, Stairs.mean, Stairs.integral, Stairs.var, Stairs.std, Stairs.skew, Stairs.kurtosis
 
 Examples
 --------
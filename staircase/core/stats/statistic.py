@@ -1,5 +1,3 @@
-import warnings
-
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_list_like
@@ -9,31 +7,318 @@ from staircase.constants import inf
 from staircase.core.ops.masking import _get_slice_index
 from staircase.core.stats import docstrings
 from staircase.docstrings import examples
-from staircase.util import _get_lims, _replace_none_with_infs
+from staircase.util import (
+    _changed,
+    _get_lims,
+    _is_bounded,
+    _masked,
+    _replace_none_with_infs,
+    _split_index,
+)
 from staircase.util._decorators import Appender
 
+_INT64_BOUND = 2.0**63
+
+# the number of antiderivatives evaluated at once for lagged statistics, which
+# limits the size of temporary arrays
+_LAG_CHUNK_SIZE = 2**20
+
 
 def _cache_integral_and_mean(self):
-    if self._data is None or len(self._data) < 2:
+    if self._step_points is None or len(self._step_points) < 2:
         self._integral_and_mean = np.nan, np.nan
+        return
+    values = self._get_values()[:-1]
+    durations = np.diff(self._step_points)
+    notnull = ~np.isnan(values)
+    values, durations = values[notnull], durations[notnull]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if not np.issubdtype(durations.dtype, np.timedelta64):
+            integral = (values * durations).sum()
+            if np.issubdtype(integral.dtype, np.integer) and not (
+                np.abs(values.astype("float64") * durations).sum() < _INT64_BOUND
+            ):
+                # int64 arithmetic wraps on overflow, whereas Python integers do not
+                integral = (values.astype(object) * durations.astype(object)).sum()
+            self._integral_and_mean = (integral, integral / durations.sum())
+            return
+        # timedeltas are integral with the durations as integers, in the units of
+        # the step points, so that overflow can be detected
+        unit = np.datetime_data(durations.dtype)[0]
+        counts = durations.astype("int64")
+        total = counts.sum()
+        areas = values * counts
+        if not (np.abs(areas) < _INT64_BOUND).all() or not (
+            np.abs(areas.sum()) < _INT64_BOUND
+        ):
+            self._integral_and_mean = (None, (values * (counts / total)).sum())
+            raise OverflowError("Integral exceeds the range of timedelta64")
+        # multiplying a Timedelta by a float truncates towards zero, and a sum of
+        # int64 is exact if the result is in range, despite any intermediate overflow
+        integral = areas.astype("int64").sum()
+        self._integral_and_mean = (
+            pd.Timedelta(np.timedelta64(integral, unit)),
+            float(integral / total),
+        )
+
+
+def _shape_statistics(variance, third_moment, fourth_moment):
+    # the skewness and excess kurtosis, from the central moments, which are null
+    # where the variance is zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.where(variance > 0, variance, np.nan)
+        return third_moment / variance**1.5, fourth_moment / variance**2 - 3
+
+
+def _cache_moments(self):
+    # the mean, variance, skewness and excess kurtosis, from the central moments of
+    # the values weighted by duration
+    if self._step_points is None or len(self._step_points) < 2:
+        self._moments = (np.nan,) * 4
+        return
+    values = self._get_values()[:-1]
+    durations = np.diff(self._step_points)
+    notnull = ~np.isnan(values)
+    values, durations = values[notnull], durations[notnull]
+    if not len(values):
+        self._moments = (np.nan,) * 4
+        return
+    # values may be integers, which cannot hold the corrected deviations
+    values = values.astype("float64")
+    if np.issubdtype(durations.dtype, np.timedelta64):
+        durations = durations.astype("int64")
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # durations are normalised before they are multiplied by values, as per the
+        # mean of timedeltas, so that they do not overflow
+        weights = durations / durations.sum()
+        if values.min() == values.max():
+            centre = values[0]
+        else:
+            centre = (weights * values).sum()
+        deviations = values - centre
+        # the corrected two-pass algorithm, which compensates for rounding of the
+        # mean
+        correction = (weights * deviations).sum()
+        deviations -= correction
+        squares = deviations * deviations
+        variance = (weights * squares).sum()
+        third_moment = (weights * squares * deviations).sum()
+        fourth_moment = (weights * squares * squares).sum()
+    self._moments = (
+        centre + correction,
+        variance,
+        *map(float, _shape_statistics(variance, third_moment, fourth_moment)),
+    )
+
+
+def _get_moments(self):
+    if self._moments is None:
+        _cache_moments(self)
+    return self._moments
+
+
+def _to_positions(points, origin):
+    # positions relative to origin, as floats in the units of the domain
+    difference = points - origin
+    if np.issubdtype(difference.dtype, np.timedelta64):
+        difference = difference.astype("int64")
+    return difference.astype("float64")
+
+
+def _get_prefix_integral(self):
+    # the integral, and duration of non-null values, from the first step point to
+    # each step point.  Arrays are prefixed with an entry for the first step point,
+    # which is used for positions preceding it.
+    if self._prefix_integral is None:
+        origin = self._step_points[0]
+        positions = _to_positions(self._step_points, origin)
+        values = self._get_values()
+        notnull = ~np.isnan(values[:-1])
+        durations = np.where(notnull, np.diff(positions), 0)
+        areas = np.where(notnull, values[:-1], 0) * durations
+        self._prefix_integral = (
+            origin,
+            positions,
+            np.append(0, positions),
+            np.append([0, 0], np.cumsum(areas)),
+            np.append([0, 0], np.cumsum(durations)),
+            np.append(self.initial_value, values),
+        )
+    return self._prefix_integral
+
+
+def _pieces_at(self, x):
+    # indexes of the pieces of the step function containing x, as per the prefix
+    # integral, and the offsets of x from their starts, which are zero for pieces
+    # which are null
+    origin, positions, anchors, _, _, values = _get_prefix_integral(self)
+    x = _to_positions(x, origin)
+    index = np.searchsorted(positions, x, side="right")
+    return index, np.where(np.isnan(values[index]), 0, x - anchors[index])
+
+
+def _get_prefix_moments(self):
+    # the integrals of the first four powers of the values, from the first step
+    # point to each step point, as per the prefix integral.  Values are centred on
+    # the mean, to limit the loss of precision, and nulls are zero.
+    if self._prefix_moments is None:
+        _, positions, _, _, _, values = _get_prefix_integral(self)
+        centre = mean(self)
+        if np.isnan(centre):
+            centre = 0
+        deviations = np.where(np.isnan(values), 0, values - centre)
+        squares = deviations * deviations
+        powers = np.column_stack(
+            [deviations, squares, squares * deviations, squares * squares]
+        )
+        cumulative = np.zeros(powers.shape)
+        cumulative[2:] = np.cumsum(powers[1:-1] * np.diff(positions)[:, None], axis=0)
+        self._prefix_moments = centre, cumulative, powers
+    return self._prefix_moments
+
+
+def _integrals_over_intervals(self, left, right):
+    """
+    Calculates integrals of the step function over many intervals.
+
+    Parameters
+    ----------
+    left, right : numpy.ndarray
+        The bounds of the intervals, in the same representation as the step points.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The integrals, and the durations over which the step function is not null,
+        as floats in the units of the domain.  Integrals are NaN where the duration
+        is zero.
+    """
+    if self._step_points is None:
+        durations = _to_positions(right, left)
+        if np.isnan(self.initial_value):
+            durations = np.zeros(len(durations))
+        integrals = self.initial_value * durations
     else:
-        value_sums = self.value_sums(group=False)
-        value_sums = value_sums[value_sums.index.notnull()]
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                # integral calculated this way to force an overflow error if required
-                # pandas.TimedeltaIndex * int is not raising an overflow error when it ideally should
-                integral = np.array(
-                    [x * y for x, y in zip(value_sums.index, value_sums)]
-                ).sum()
-                mean = integral / value_sums.sum()
-                self._integral_and_mean = (integral, mean)
-        except (OverflowError, ValueError) as exc:
-            integral = None
-            mean = ((value_sums / value_sums.sum()) * value_sums.index).sum()
-            self._integral_and_mean = (integral, mean)
-            raise exc
+        _, _, _, cumulative_integral, cumulative_duration, values = (
+            _get_prefix_integral(self)
+        )
+
+        def antiderivatives(x):
+            index, offset = _pieces_at(self, x)
+            return (
+                cumulative_integral[index] + np.nan_to_num(values[index]) * offset,
+                cumulative_duration[index] + offset,
+            )
+
+        left_integrals, left_durations = antiderivatives(left)
+        right_integrals, right_durations = antiderivatives(right)
+        integrals = right_integrals - left_integrals
+        durations = right_durations - left_durations
+    integrals = np.where(durations > 0, integrals, np.nan)
+    return integrals, durations
+
+
+def _moments_over_intervals(self, left, right):
+    """
+    Calculates the mean, variance, skewness and excess kurtosis of the step
+    function over many intervals.
+
+    Parameters
+    ----------
+    left, right : numpy.ndarray
+        The bounds of the intervals, in the same representation as the step points.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The statistics, which are NaN where the step function is null over the
+        interval.  Skewness and kurtosis are also NaN where the variance is zero.
+    """
+    if self._step_points is None:
+        durations = _to_positions(right, left)
+        notnull = (durations > 0) & ~np.isnan(self.initial_value)
+        means = np.where(notnull, self.initial_value, np.nan)
+        variances = np.where(notnull, 0.0, np.nan)
+        return (means, variances, *_shape_statistics(variances, 0, 0))
+    centre, cumulative, powers = _get_prefix_moments(self)
+    cumulative_duration = _get_prefix_integral(self)[4]
+
+    def antiderivatives(x):
+        index, offset = _pieces_at(self, x)
+        return (
+            cumulative[index] + powers[index] * offset[:, None],
+            cumulative_duration[index] + offset,
+        )
+
+    left_integrals, left_durations = antiderivatives(left)
+    right_integrals, right_durations = antiderivatives(right)
+    durations = right_durations - left_durations
+    with np.errstate(divide="ignore", invalid="ignore"):
+        durations = np.where(durations > 0, durations, np.nan)
+        first, second, third, fourth = (
+            (right_integrals - left_integrals) / durations[:, None]
+        ).T
+        # central moments from the moments about the centre
+        variances = second - first**2
+        # variances of constant step functions are zero, up to rounding
+        variances = np.where(variances <= 1e-12 * second, 0, variances)
+        third_moments = third - 3 * first * second + 2 * first**3
+        fourth_moments = (
+            fourth - 4 * first * third + 6 * first**2 * second - 3 * first**4
+        )
+    return (
+        centre + first,
+        variances,
+        *_shape_statistics(variances, third_moments, fourth_moments),
+    )
+
+
+def _get_sparse_table(self, how, level):
+    # level k of the sparse table holds the maximum (or minimum) of each 2**k
+    # consecutive values, preceded by the initial value, with nulls ignored.
+    # Levels are created as they are required.
+    if self._sparse_tables is None:
+        self._sparse_tables = {}
+    if how not in self._sparse_tables:
+        values = np.append(self.initial_value, self._get_values())
+        fill = -np.inf if how == "max" else np.inf
+        self._sparse_tables[how] = [np.where(np.isnan(values), fill, values)]
+    table = self._sparse_tables[how]
+    func = np.maximum if how == "max" else np.minimum
+    while len(table) <= level:
+        width = 2 ** (len(table) - 1)
+        table.append(func(table[-1][:-width], table[-1][width:]))
+    return table
+
+
+def _range_extrema(self, how, first, last):
+    """
+    Calculates the maximum, or minimum, of values over many ranges of step points.
+
+    Parameters
+    ----------
+    how : {"max", "min"}
+    first, last : numpy.ndarray
+        Inclusive bounds of the ranges, as indexes to the values preceded by the
+        initial value.  Each range must not be empty.
+
+    Returns
+    -------
+    numpy.ndarray
+        The maximums, or minimums, with null values ignored.  NaN if all values
+        in a range are null.
+    """
+    levels = np.log2(last - first + 1).astype("int64")
+    table = _get_sparse_table(self, how, levels.max(initial=0))
+    func = np.maximum if how == "max" else np.minimum
+    result = np.empty(len(first))
+    for level in np.unique(levels):
+        rows = levels == level
+        result[rows] = func(
+            table[level][first[rows]], table[level][last[rows] - 2**level + 1]
+        )
+    result[np.isinf(result)] = np.nan
+    return result
 
 
 @Appender(docstrings.integral_docstring, join="\n", indents=1)
@@ -42,9 +327,12 @@ def integral(self):
         try:
             _cache_integral_and_mean(self)
         except (OverflowError, ValueError):
-            raise OverflowError(
-                "Integral calculation results in overflow error.  Consider scaling down step function values to accommodate."
-            )
+            pass
+    if self._integral_and_mean is None or self._integral_and_mean[0] is None:
+        # also the case if the overflow occurred when calculating the mean
+        raise OverflowError(
+            "Integral calculation results in overflow error.  Consider scaling down step function values to accommodate."
+        )
     return self._integral_and_mean[0]
 
 
@@ -66,12 +354,10 @@ def median(self):
 @Appender(docstrings.value_sums_docstring, join="\n", indents=1)
 def value_sums(self, dropna=True, group=True):
 
-    if self._data is None:
+    if self._step_points is None:
         return None
 
-    value_sums = pd.Series(
-        np.diff(self._data.index.values), index=self._get_values().iloc[:-1]
-    )
+    value_sums = pd.Series(np.diff(self._step_points), index=self._get_values()[:-1])
     # .values used to avoid a strange numpy Future Warning
     if group:
         result = value_sums.groupby(value_sums.index.values).sum()
@@ -92,16 +378,7 @@ def mode(self):
 
 @Appender(docstrings.var_docstring, join="\n", indents=1)
 def var(self):
-    percentile_minus_mean = self.dist.percentile - mean(self)
-    values = percentile_minus_mean._get_values()
-    squared_values = values * values
-    return (
-        sc.Stairs._new(
-            initial_value=0,
-            data=pd.DataFrame({"value": squared_values}),
-        ).agg("integral", (0, 100))
-        / 100
-    )
+    return _get_moments(self)[1]
 
 
 @Appender(docstrings.std_docstring, join="\n", indents=1)
@@ -109,6 +386,16 @@ def std(self):
     return np.sqrt(var(self))
 
 
+@Appender(docstrings.skew_docstring, join="\n", indents=1)
+def skew(self):
+    return _get_moments(self)[2]
+
+
+@Appender(docstrings.kurtosis_docstring, join="\n", indents=1)
+def kurtosis(self):
+    return _get_moments(self)[3]
+
+
 @Appender(docstrings.values_in_range_docstring, join="\n", indents=1)
 def values_in_range(self, where=(-inf, inf), closed=None):
     where = _replace_none_with_infs(where)
@@ -120,22 +407,37 @@ def values_in_range(self, where=(-inf, inf), closed=None):
     left_index, right_index = _get_slice_index(self, lower, upper, lower_how, upper_how)
     if right_index == -1:
         return np.array([self.initial_value])
-    values = self._get_values().iloc[max(0, left_index) : right_index]
+    values = self._get_values()[max(0, left_index) : right_index]
     if left_index < 0 and not np.isnan(self.initial_value):
         values = np.append([self.initial_value], values)
     unique = np.unique(values)
     return unique[~np.isnan(unique)]
 
 
+def _extremum_in_range(self, func, where, closed):
+    # as per values_in_range, without finding unique values
+    where = _replace_none_with_infs(where)
+    if closed is None:
+        closed = self._closed
+    lower, upper = where
+    lower_how, upper_how = _get_lims(self, closed)
+    left_index, right_index = _get_slice_index(self, lower, upper, lower_how, upper_how)
+    if right_index == -1:
+        return self.initial_value
+    values = self._get_values()[max(0, left_index) : right_index]
+    if left_index < 0:
+        values = np.append([self.initial_value], values)
+    if np.isnan(values).all():
+        raise ValueError("There are no values in the range which are not null")
+    return func.reduce(values)
+
+
 def _min(
     self,
     where=(-inf, inf),
     closed=None,
 ):
-    where = _replace_none_with_infs(where)
-    if closed is None:
-        closed = self._closed
-    return min(self.values_in_range(where, closed))
+    return _extremum_in_range(self, np.fmin, where, closed)
 
 
 def _max(
@@ -143,10 +445,7 @@ def _max(
     where=(-inf, inf),
     closed=None,
 ):
-    where = _replace_none_with_infs(where)
-    if closed is None:
-        closed = self._closed
-    return max(self.values_in_range(where, closed))
+    return _extremum_in_range(self, np.fmax, where, closed)
 
 
 @Appender(docstrings.agg_docstring, join="\n", indents=1)
@@ -266,6 +565,548 @@ def corr(self, other, where=(-inf, inf), lag=0, clip="pre"):
     return self.cov(other, where) / denominator
 
 
+def _lag_pieces(self, origin, unit):
+    # positions of the step points relative to origin, the values of the pieces of
+    # the step function (starting with the initial value), and for each piece
+    # whether it is not null, and its value and squared value, where nulls are
+    # zero.  Values of pieces are centred, and the centre is returned last.
+    if self._step_points is None:
+        positions = np.array([], dtype="float64")
+        values = np.array([self.initial_value], dtype="float64")
+    else:
+        positions = _to_lag_positions(self._step_points - origin, unit)
+        values = np.append(self.initial_value, self._get_values()).astype("float64")
+    notnull = ~np.isnan(values)
+    centre = values[notnull].mean() if notnull.any() else 0
+    centred = np.where(notnull, values - centre, 0)
+    pieces = np.column_stack([notnull, centred, centred**2])
+    return positions, values, pieces, centre
+
+
+def _to_lag_positions(differences, unit):
+    # differences of points, as floats in the units of the step points
+    differences = np.asarray(differences)
+    if np.issubdtype(differences.dtype, np.timedelta64):
+        return differences / np.timedelta64(1, unit)
+    return differences.astype("float64")
+
+
+def _to_lag_bound(bound, origin, unit):
+    # a bound of the domain, as a position relative to origin
+    if bound == -inf:
+        return -np.inf
+    if bound == inf:
+        return np.inf
+    return _to_lag_positions(_split_index(pd.Index([bound]))[0] - origin, unit)[0]
+
+
+def _is_irregular(self):
+    # whether the step function has infinite values, or redundant step points, for
+    # which moments on an unbounded domain do not follow Stairs.cov
+    if self._step_points is None:
+        return bool(np.isinf(self.initial_value))
+    values = np.append(self.initial_value, self._get_values()).astype("float64")
+    return bool(np.isinf(values).any() or not _changed(values[1:], values[:-1]).all())
+
+
+def _piecewise_antiderivative(positions, pieces, x):
+    # integrals of the columns of pieces, from the first step point to x
+    cumulative = np.zeros(pieces.shape)
+    cumulative[2:] = np.cumsum(pieces[1:-1] * np.diff(positions)[:, None], axis=0)
+    anchors = np.append(positions[:1], positions) if len(positions) else np.zeros(1)
+    index = np.searchsorted(positions, x, side="right")
+    return cumulative[index] + pieces[index] * (x - anchors[index])[..., None]
+
+
+def _lagged_moments(
+    self_positions, self_pieces, other_positions, other_pieces, lags, lefts, rights
+):
+    """
+    Calculates integrals of the products of a step function with another, which is
+    translated by many lags, on the domain where neither is null.
+
+    Step points and pieces are as per _lag_pieces, and the domain for each lag is
+    the interval from *lefts* to *rights*, which are positions relative to the same
+    origin as the step points.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array with a row for each lag, and columns for the duration of the
+        domain, the integrals of both step functions, the integral of their
+        product and the integrals of their squares.  Step functions are centred.
+    """
+    result = np.full((len(lags), 6), np.nan)
+
+    # the integral of a product, over a piece of the translated step function, is
+    # the value of the piece multiplied by the difference of antiderivatives of
+    # the other step function at the bounds of the piece.  Summed over pieces, the
+    # antiderivative at each bound is multiplied by the difference of the values
+    # of the pieces on either side of it.
+    padded = np.vstack([np.zeros((1, 3)), other_pieces, np.zeros((1, 3))])
+    coefficients = padded[:-1] - padded[1:]
+    lags_per_chunk = max(1, _LAG_CHUNK_SIZE // (len(other_positions) + 2))
+    for start in range(0, len(lags), lags_per_chunk):
+        chunk = slice(start, start + lags_per_chunk)
+        piece_bounds = np.column_stack(
+            [
+                lefts[chunk],
+                np.clip(
+                    other_positions - lags[chunk, None],
+                    lefts[chunk, None],
+                    rights[chunk, None],
+                ),
+                rights[chunk],
+            ]
+        )
+        antiderivatives = _piecewise_antiderivative(
+            self_positions, self_pieces, piece_bounds
+        )
+        integrals = antiderivatives.transpose(0, 2, 1) @ coefficients
+        result[chunk] = integrals[:, [0, 1, 0, 1, 2, 0], [0, 0, 1, 1, 0, 2]]
+    return result
+
+
+def _count_translated(positions, shifts, x, side):
+    # the number of positions, translated to the left by shifts, which precede x or
+    # coincide with it if side is "right".  Positions are searched for x translated
+    # to the right, and the counts corrected where rounding differs.
+    compare = np.less_equal if side == "right" else np.less
+    padded = np.concatenate([[-np.inf], positions, [np.inf]])
+    counts = np.searchsorted(positions, x + shifts, side=side)
+    while True:
+        over = (counts > 0) & ~compare(padded[counts] - shifts, x)
+        under = (counts < len(positions)) & compare(padded[counts + 1] - shifts, x)
+        if not (over.any() or under.any()):
+            return counts
+        counts = counts - over + under
+
+
+def _lag_span_ends(
+    self_positions, self_values, other_positions, other_values, lags, lefts, rights
+):
+    """
+    Finds the first and last step points of a step function, and of another which
+    is translated by each lag, once each is clipped to the domain and masked where
+    the other is null, and of the product of the two.
+
+    Step points are checked in blocks from the bounds of the domain inwards, which
+    grow until the first and last step points are found, and so usually only the
+    first blocks are checked.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The first and last step points, and the values preceding the first and
+        following the last, in arrays with a row for each lag and columns for the
+        step function, the translated step function and their product.  Step points
+        are infinite where a step function has none.
+    """
+    size = len(lags)
+    firsts, lasts = np.full((size, 3), np.inf), np.full((size, 3), -np.inf)
+    befores, afters = np.full((size, 3), np.nan), np.full((size, 3), np.nan)
+    step_points = [(self_positions, np.zeros(size)), (other_positions, lags)]
+
+    # each is null where either step function is null, so step points are only
+    # sought between those where both step functions are first and last not null
+    lows, highs = lefts, rights
+    for (positions, shifts), values in zip(step_points, (self_values, other_values)):
+        notnull = np.flatnonzero(~np.isnan(values))
+        if not len(notnull):
+            lows, highs = np.full(size, np.inf), np.full(size, -np.inf)
+            break
+        if notnull[0] > 0:
+            lows = np.maximum(lows, positions[notnull[0] - 1] - shifts)
+        if notnull[-1] < len(positions):
+            highs = np.minimum(highs, positions[notnull[-1]] - shifts)
+    starts = [_count_translated(p, s, lows, "left") for p, s in step_points]
+    ends = [_count_translated(p, s, highs, "right") for p, s in step_points]
+    bounds = np.column_stack([lefts, rights])
+    most = max(len(self_positions), len(other_positions), 1)
+    lags_per_chunk = max(1, _LAG_CHUNK_SIZE // (4 * most + 2))
+    for offset in range(0, size, lags_per_chunk):
+        rows = np.arange(offset, min(offset + lags_per_chunk, size))
+        width = 16
+        while len(rows):
+            # the step points following the first blocks, and preceding the last
+            # blocks, beyond which the first and last step points are not sought
+            following = np.full(len(rows), np.inf)
+            preceding = np.full(len(rows), -np.inf)
+            x = [bounds[rows]]
+            for (positions, shifts), start, end in zip(step_points, starts, ends):
+                shifts, start, end = shifts[rows], start[rows], end[rows]
+                if not len(positions):
+                    continue
+                steps = np.arange(width)
+                columns = np.hstack(
+                    [start[:, None] + steps, end[:, None] - width + steps]
+                )
+                valid = (columns >= start[:, None]) & (columns < end[:, None])
+                x.append(
+                    np.where(
+                        valid,
+                        positions[np.where(valid, columns, 0)] - shifts[:, None],
+                        np.nan,
+                    )
+                )
+                inner = start + width < end - width
+                following[inner] = np.minimum(
+                    following[inner], positions[(start + width)[inner]] - shifts[inner]
+                )
+                preceding[inner] = np.maximum(
+                    preceding[inner],
+                    positions[(end - width - 1)[inner]] - shifts[inner],
+                )
+            x = np.hstack(x)
+            finite = np.isfinite(x)
+            lower, upper = lefts[rows, None], rights[rows, None]
+            sides = []
+            for positions, values, shifts in (
+                (self_positions, self_values, 0),
+                (other_positions, other_values, lags[rows, None]),
+            ):
+                points = np.where(finite, x, 0)
+                after = values[_count_translated(positions, shifts, points, "right")]
+                before = values[_count_translated(positions, shifts, points, "left")]
+                after[(x < lower) | (x >= upper)] = np.nan
+                before[(x <= lower) | (x > upper)] = np.nan
+                sides.append((after, before))
+            (self_after, self_before), (other_after, other_before) = sides
+
+            found = np.ones(len(rows), dtype=bool)
+            block = np.arange(len(rows))
+            for column, (after, before) in enumerate(
+                [
+                    (
+                        _masked(self_after, other_after),
+                        _masked(self_before, other_before),
+                    ),
+                    (
+                        _masked(other_after, self_after),
+                        _masked(other_before, self_before),
+                    ),
+                    (self_after * other_after, self_before * other_before),
+                ]
+            ):
+                changed = _changed(after, before) & finite
+                first = np.where(changed, x, np.inf).argmin(axis=1)
+                last = np.where(changed, x, -np.inf).argmax(axis=1)
+                some = changed.any(axis=1)
+                first_points = np.where(some, x[block, first], np.inf)
+                last_points = np.where(some, x[block, last], -np.inf)
+                found &= (first_points <= following) & (last_points >= preceding)
+                firsts[rows, column] = first_points
+                lasts[rows, column] = last_points
+                befores[rows, column] = before[block, first]
+                afters[rows, column] = after[block, last]
+            rows = rows[~found]
+            # blocks are no wider than the step points
+            width = min(16 * width, most)
+    return firsts, lasts, befores, afters
+
+
+def _tail_moments(lengths, values, centre):
+    # the duration of non-null values, and integrals of values and their squares,
+    # where constant values, less centre, extend over lengths
+    notnull = ~np.isnan(values)
+    lengths = np.where(notnull, lengths, 0)
+    deviations = np.where(notnull, values - centre, 0)
+    return [(moment * lengths).sum(axis=1) for moment in (1, deviations, deviations**2)]
+
+
+def _central_moments(durations, integral, squares, scale=None):
+    # the mean and variance of a centred step function, from its integrals, which
+    # are null where the duration is zero.  Variances are rounded to zero relative
+    # to the integral of squares, or to scale if it is given.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        durations = np.where(durations > 0, durations, np.nan)
+        mean = integral / durations
+        second_moment = squares / durations
+        variance = second_moment - mean**2
+        tolerance = 1e-12 * (squares if scale is None else scale) / durations
+    # variances of constant step functions are zero, up to rounding
+    return mean, np.where(variance <= tolerance, 0, variance)
+
+
+def _lagged_cov_and_var(self, other, lags, where, clip):
+    """
+    Calculates the covariance of a step function with another, which is translated
+    by many lags, and the variance of each, as per Stairs.cov and Stairs.corr.
+
+    If the domain is bounded then the moments are over the domain where neither
+    step function is null.  Otherwise they are over the span of the step points of
+    each step function, and of their product, once each is masked where the other
+    is null, and these spans differ with the lag.
+    """
+    assert clip in ["pre", "post"]
+    lower, upper = where
+    nulls = np.full(len(lags), np.nan)
+    if lower != -inf:
+        origin = _split_index(pd.Index([lower]))[0][0]
+    elif self._step_points is not None:
+        origin = self._step_points[0]
+    elif other._step_points is not None:
+        origin = other._step_points[0]
+    else:
+        return nulls, [nulls, nulls]
+    unit = np.datetime_data(origin.dtype)[0] if origin.dtype.kind in "mM" else None
+    if unit is None and not _is_bounded(where):
+        # numeric step points are their own positions, so that translated step
+        # points are rounded as per Stairs.shift
+        origin = np.zeros(1, dtype=origin.dtype)[0]
+    self_positions, self_values, self_pieces, self_centre = _lag_pieces(
+        self, origin, unit
+    )
+    other_positions, other_values, other_pieces, other_centre = _lag_pieces(
+        other, origin, unit
+    )
+    lags = _to_lag_positions(pd.Index(lags).values, unit)
+
+    # the upper bound of the domain is translated with the lag, as per Stairs.corr
+    lefts = np.full(lags.shape, _to_lag_bound(lower, origin, unit))
+    rights = _to_lag_bound(upper, origin, unit) - (lags if clip == "pre" else 0)
+    rights = np.maximum(lefts, rights)
+
+    if not _is_bounded(where):
+        # outside of its own span each step function, and their product, is
+        # constant, so moments over each span are those over all spans, less
+        # those of the constant values outside of it
+        firsts, lasts, befores, afters = _lag_span_ends(
+            self_positions,
+            self_values,
+            other_positions,
+            other_values,
+            lags,
+            lefts,
+            rights,
+        )
+        empty = ~(firsts < lasts)
+        firsts[empty], lasts[empty] = np.inf, -np.inf
+        lefts, rights = firsts.min(axis=1), lasts.max(axis=1)
+        spanned = lefts < rights
+        lefts, rights = np.where(spanned, lefts, 0), np.where(spanned, rights, 0)
+    moments = _lagged_moments(
+        self_positions,
+        self_pieces,
+        other_positions,
+        other_pieces,
+        lags,
+        lefts,
+        rights,
+    ).T
+    durations, integral, other_integral, products, squares, other_squares = moments
+    if _is_bounded(where):
+        mean, variance = _central_moments(durations, integral, squares)
+        other_mean, other_variance = _central_moments(
+            durations, other_integral, other_squares
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariances = products / durations - mean * other_mean
+        return covariances, [variance, other_variance]
+
+    tails = [
+        _tail_moments(
+            np.where(
+                empty[:, column, None],
+                0,
+                np.column_stack([firsts[:, column] - lefts, rights - lasts[:, column]]),
+            ),
+            np.column_stack([befores[:, column], afters[:, column]]),
+            centre,
+        )
+        for column, centre in enumerate([self_centre, other_centre, 0])
+    ]
+    # durations are rounded to zero, and variances are rounded relative to the
+    # moments over all spans, from which those of the tails are subtracted
+    span_durations = [
+        np.where(
+            empty[:, column] | (durations - tail[0] <= 1e-12 * (rights - lefts)),
+            0,
+            durations - tail[0],
+        )
+        for column, tail in enumerate(tails)
+    ]
+    (mean, variance), (other_mean, other_variance) = [
+        _central_moments(
+            span_durations[column], integral - tail[1], squares - tail[2], squares
+        )
+        for column, tail, integral, squares in (
+            (0, tails[0], integral, squares),
+            (1, tails[1], other_integral, other_squares),
+        )
+    ]
+    # the integral of the product, with the centres of the step functions restored
+    products = (
+        products
+        + self_centre * other_integral
+        + other_centre * integral
+        + self_centre * other_centre * durations
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        product_durations = np.where(span_durations[2] > 0, span_durations[2], np.nan)
+        covariances = (products - tails[2][1]) / product_durations - (
+            mean + self_centre
+        ) * (other_mean + other_centre)
+    return covariances, [variance, other_variance]
+
+
+def _lags_index(lags):
+    return pd.Index(lags if is_list_like(lags) else [lags])
+
+
+def _per_lag(func, self, other, lags, where, clip):
+    return np.array(
+        [func(self, other, where=where, lag=lag, clip=clip) for lag in lags],
+        dtype="float64",
+    )
+
+
+@Appender(examples.xcov_example, join="\n", indents=1)
+def xcov(self, other, lags, where=(-inf, inf), clip="pre"):
+    """
+    Calculates the cross-covariance for many lags.
+
+    The result for each lag is equal to :meth:`Stairs.cov` with the same *lag*.
+    Prefix integrals of *self* are calculated once and used for all lags, unless
+    *where* is unbounded and either step function has infinite values or redundant
+    step points, in which case :meth:`Stairs.cov` is called for each lag.
+
+    Parameters
+    ----------
+    other: :class:`Stairs`
+        the stairs instance with which to compute the cross-covariance
+    lags : array-like of int, float or pandas.Timedelta
+        The amounts by which *other* is translated to the left.
+    where : tuple or list of length two, optional
+        Indicates the domain interval over which to perform the calculation.
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+    clip : {'pre', 'post'}, default 'pre'
+        Determines if the domain is applied before or after *other* is translated.
+        If 'pre' then the domain over which the calculation is performed is the overlap
+        of the original domain and the translated domain.
+
+    Returns
+    -------
+    :class:`pandas.Series`
+        The cross-covariance, indexed by *lags*
+
+    See Also
+    --------
+    Stairs.cov, Stairs.xcorr, Stairs.acov
+    """
+    lags = _lags_index(lags)
+    where = _replace_none_with_infs(where)
+    if not _is_bounded(where) and (_is_irregular(self) or _is_irregular(other)):
+        return pd.Series(_per_lag(cov, self, other, lags, where, clip), index=lags)
+    covariances, _ = _lagged_cov_and_var(self, other, lags, where, clip)
+    return pd.Series(covariances, index=lags)
+
+
+@Appender(examples.xcorr_example, join="\n", indents=1)
+def xcorr(self, other, lags, where=(-inf, inf), clip="pre"):
+    """
+    Calculates the cross-correlation for many lags.
+
+    The result for each lag is equal to :meth:`Stairs.corr` with the same *lag*.
+    Prefix integrals of *self* are calculated once and used for all lags, unless
+    *where* is unbounded and either step function has infinite values or redundant
+    step points, in which case :meth:`Stairs.corr` is called for each lag.
+
+    Parameters
+    ----------
+    other: :class:`Stairs`
+        the stairs instance with which to compute the cross-correlation
+    lags : array-like of int, float or pandas.Timedelta
+        The amounts by which *other* is translated to the left.
+    where : tuple or list of length two, optional
+        Indicates the domain interval over which to perform the calculation.
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+    clip : {'pre', 'post'}, default 'pre'
+        Determines if the domain is applied before or after *other* is translated.
+        If 'pre' then the domain over which the calculation is performed is the overlap
+        of the original domain and the translated domain.
+
+    Returns
+    -------
+    :class:`pandas.Series`
+        The cross-correlation, indexed by *lags*.  Null where either step function is
+        constant on the domain.
+
+    See Also
+    --------
+    Stairs.corr, Stairs.xcov, Stairs.acorr
+    """
+    lags = _lags_index(lags)
+    where = _replace_none_with_infs(where)
+    if not _is_bounded(where) and (_is_irregular(self) or _is_irregular(other)):
+        return pd.Series(_per_lag(corr, self, other, lags, where, clip), index=lags)
+    covariances, (variance, other_variance) = _lagged_cov_and_var(
+        self, other, lags, where, clip
+    )
+    denominators = np.sqrt(variance * other_variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlations = np.where(denominators == 0, np.nan, covariances / denominators)
+    return pd.Series(correlations, index=lags)
+
+
+@Appender(examples.acov_example, join="\n", indents=1)
+def acov(self, lags, where=(-inf, inf), clip="pre"):
+    """
+    Calculates the autocovariance for many lags.
+
+    Equivalent to :meth:`Stairs.xcov` with *other* equal to *self*.
+
+    Parameters
+    ----------
+    lags : array-like of int, float or pandas.Timedelta
+        The amounts by which the step function is translated to the left.
+    where : tuple or list of length two, optional
+        Indicates the domain interval over which to perform the calculation.
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+    clip : {'pre', 'post'}, default 'pre'
+        Determines if the domain is applied before or after the step function is translated.
+
+    Returns
+    -------
+    :class:`pandas.Series`
+        The autocovariance, indexed by *lags*
+
+    See Also
+    --------
+    Stairs.xcov, Stairs.acorr
+    """
+    return xcov(self, self, lags, where, clip)
+
+
+@Appender(examples.acorr_example, join="\n", indents=1)
+def acorr(self, lags, where=(-inf, inf), clip="pre"):
+    """
+    Calculates the autocorrelation for many lags.
+
+    Equivalent to :meth:`Stairs.xcorr` with *other* equal to *self*.
+
+    Parameters
+    ----------
+    lags : array-like of int, float or pandas.Timedelta
+        The amounts by which the step function is translated to the left.
+    where : tuple or list of length two, optional
+        Indicates the domain interval over which to perform the calculation.
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+    clip : {'pre', 'post'}, default 'pre'
+        Determines if the domain is applied before or after the step function is translated.
+
+    Returns
+    -------
+    :class:`pandas.Series`
+        The autocorrelation, indexed by *lags*
+
+    See Also
+    --------
+    Stairs.xcorr, Stairs.acov
+    """
+    return xcorr(self, self, lags, where, clip)
+
+
 def _get_stairs_method(name):
     return {
         "integral": integral,
@@ -278,4 +1119,6 @@ def _get_stairs_method(name):
         "_min": _min,
         "std": std,
         "var": var,
+        "skew": skew,
+        "kurtosis": kurtosis,
     }[name]
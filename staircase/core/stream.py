@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Literal
+
+import staircase as sc
+from staircase.core.layering import (
+    _check_args_dtypes,
+    _convert_to_series,
+    _preprocess_layer_args,
+    _sum_deltas_by_step_point,
+)
+from staircase.util import _make_index, _split_index, _to_point
+
+
+def _merge_runs(run, other):
+    # runs may overlap, so are merged with a sort and reduce
+    return _sum_deltas_by_step_point([run[0], other[0]], [run[1], other[1]])
+
+
+def _concatenate_runs(run, other):
+    # *other* is strictly after *run*
+    return np.concatenate([run[0], other[0]]), np.concatenate([run[1], other[1]])
+
+
+def _append_run(runs, run, merge):
+    """
+    Appends a run of step points and deltas, merging runs which are no larger
+    than the runs after them, as in a binary counter.
+
+    Run sizes therefore decrease geometrically, so there are O(log n) runs and
+    each step point is merged O(log n) times.
+    """
+    runs.append(run)
+    while len(runs) > 1 and len(runs[-2][0]) <= len(runs[-1][0]):
+        other = runs.pop()
+        runs[-1] = merge(runs[-1], other)
+
+
+class StairsBuilder:
+    """
+    Incrementally constructs a :class:`Stairs` from intervals which arrive in chunks.
+
+    Intervals are expected to arrive roughly in order of their start points.  The
+    builder keeps a *watermark*, before which the step function is considered
+    final.  Step changes at or after the watermark, such as the ends of open
+    intervals, are kept in a pending buffer.  Each chunk is sorted on its own, and
+    sorted chunks are merged with chunks of a similar size, so that each step
+    change is merged O(log n) times.  Late intervals which are merged only re-sort
+    the finalised chunks they fall in.
+
+    Nothing is finalised until the watermark is set, with *lateness* or
+    :meth:`StairsBuilder.advance`.  Until then all step changes are pending.
+
+    Parameters
+    ----------
+    initial_value : float, default 0
+        The value of the step function at negative infinity.
+    closed : {"left", "right"}, default "left"
+        Indicates whether the half-open intervals comprising the step function should be interpreted
+        as left-closed or right-closed.
+    lateness : int, float, or timedelta-like, optional
+        If given, the watermark is advanced after each chunk to the largest start
+        point seen, less *lateness*.  Otherwise the watermark is only advanced
+        with :meth:`StairsBuilder.advance`.
+    late : {"raise", "drop", "merge"}, default "raise"
+        How to handle intervals with a start or end point before the watermark,
+        including intervals which start at negative infinity once a watermark is set.
+        "raise" rejects the chunk with a ValueError, "drop" discards the late
+        intervals, and "merge" merges them into the finalised step changes.
+
+    See Also
+    --------
+    Stairs.from_stream
+
+    Examples
+    --------
+
+    >>> import staircase as sc
+    >>> builder = sc.StairsBuilder(lateness=2).add([1, 2], [5, 3]).add([4, 6], [7, 9])
+    >>> builder.watermark
+    4
+    >>> builder.to_stairs().step_values
+    1    1.0
+    2    2.0
+    3    1.0
+    4    2.0
+    5    1.0
+    6    2.0
+    7    1.0
+    9    0.0
+    Name: value, dtype: float64
+    """
+
+    def __init__(
+        self,
+        initial_value: float = 0,
+        closed: Literal["left", "right"] = "left",
+        lateness=None,
+        late: Literal["raise", "drop", "merge"] = "raise",
+    ):
+        if late not in ("raise", "drop", "merge"):
+            raise ValueError("late must be one of 'raise', 'drop' or 'merge'")
+        self._initial_value = initial_value
+        self._closed = closed
+        self._lateness = None if lateness is None else _to_point(lateness)
+        self._late = late
+        self._watermark = None
+        self._tz = None
+        # finalised (step points, deltas) chunks, each sorted and strictly before
+        # the chunks after it, and before the watermark
+        self._final = []
+        # (step points, deltas) runs at or after the watermark, each sorted and
+        # unique, but overlapping one another
+        self._pending = []
+
+    @property
+    def watermark(self):
+        """
+        The point before which the step function is final, or None.
+        """
+        if self._watermark is None:
+            return None
+        watermark = _make_index(np.array([self._watermark]), self._tz)[0]
+        if isinstance(watermark, np.number):
+            watermark = watermark.item()
+        return watermark
+
+    def add(self, start=None, end=None, value=None, frame=None) -> StairsBuilder:
+        """
+        Adds a chunk of intervals.
+
+        The parameters are interpreted as they are in :meth:`Stairs.layer`.
+
+        Parameters
+        ----------
+        start : scalar, array-like or string, default None
+            Start point(s) of the interval(s).
+            A value of None is interpreted as negative infinity.
+        end : scalar, array-like or string, default None
+            End points(s) of the interval(s).
+            A value of None is interpreted as positive infinity.
+        value : float, array-like or string, default None
+            Value(s) of the interval(s).
+            A value of None is equivalent to a value of 1.
+        frame : :class:`pandas.DataFrame`, optional
+            A dataframe containing named columns, whose names may appear as values
+            for the other parameters.
+
+        Returns
+        -------
+        :class:`StairsBuilder`
+            The current instance is returned to facilitate method chaining
+        """
+        start, end, value = _preprocess_layer_args(frame, start, end, value)
+        value = np.array(value)
+        assert not pd.isna(value).any(), "value parameter cannot contain null values"
+        start = _convert_to_series(start)
+        end = _convert_to_series(end)
+        _check_args_dtypes(start, end)
+
+        # start and end are padded with nulls to a common length
+        length = max(len(start), len(end))
+        value = np.broadcast_to(value, length)
+        start_points, start_tz = _split_index(start)
+        end_points, end_tz = _split_index(end)
+        start_notnull = np.append(
+            ~pd.isna(start_points), np.zeros(length - len(start), bool)
+        )
+        end_notnull = np.append(~pd.isna(end_points), np.zeros(length - len(end), bool))
+        # padded points are masked as null, so their values are irrelevant
+        start_points = np.append(
+            start_points, np.zeros(length - len(start), start_points.dtype)
+        )
+        end_points = np.append(
+            end_points, np.zeros(length - len(end), end_points.dtype)
+        )
+        if self._tz is None:
+            self._tz = start_tz if start_tz is not None else end_tz
+
+        if self._watermark is not None:
+            # a null start point, at negative infinity, precedes any watermark
+            late = ~start_notnull
+            late[start_notnull] |= start_points[start_notnull] < self._watermark
+            late[end_notnull] |= end_points[end_notnull] < self._watermark
+            if late.any():
+                if self._late == "raise":
+                    raise ValueError(
+                        f"{late.sum()} interval(s) precede the watermark {self.watermark}"
+                    )
+                if self._late == "drop":
+                    keep = ~late
+                    start_points, end_points, value = (
+                        start_points[keep],
+                        end_points[keep],
+                        value[keep],
+                    )
+                    start_notnull, end_notnull = start_notnull[keep], end_notnull[keep]
+
+        self._initial_value += value[~start_notnull].sum()
+        step_points, deltas = _sum_deltas_by_step_point(
+            [start_points[start_notnull], end_points[end_notnull]],
+            [value[start_notnull].astype("float64"), -value[end_notnull]],
+        )
+        if step_points is not None:
+            if self._watermark is not None:
+                # only possible when late intervals are merged
+                late_count = np.searchsorted(step_points, self._watermark)
+                if late_count:
+                    self._merge_final(step_points[:late_count], deltas[:late_count])
+                    step_points = step_points[late_count:]
+                    deltas = deltas[late_count:]
+            if len(step_points):
+                _append_run(self._pending, (step_points, deltas), _merge_runs)
+
+        if self._lateness is not None and start_notnull.any():
+            self.advance(start_points[start_notnull].max() - self._lateness)
+        return self
+
+    def _merge_final(self, step_points, deltas):
+        # late step changes are merged into the finalised chunks they fall in,
+        # each of which starts before the chunks after it
+        if not self._final:
+            self._final.append((step_points, deltas))
+            return
+        starts = np.array([chunk[0][0] for chunk in self._final])
+        chunk_ids = np.maximum(
+            np.searchsorted(starts, step_points, side="right") - 1, 0
+        )
+        bounds = np.flatnonzero(np.append(True, chunk_ids[1:] != chunk_ids[:-1]))
+        for begin, end in zip(bounds, np.append(bounds[1:], len(chunk_ids))):
+            i = chunk_ids[begin]
+            self._final[i] = _merge_runs(
+                self._final[i], (step_points[begin:end], deltas[begin:end])
+            )
+
+    def advance(self, watermark) -> StairsBuilder:
+        """
+        Advances the watermark, finalising the step function before it.
+
+        A watermark which precedes the current watermark is ignored.
+
+        Parameters
+        ----------
+        watermark : int, float, or datetime-like
+            The point before which no more intervals are expected.
+
+        Returns
+        -------
+        :class:`StairsBuilder`
+            The current instance is returned to facilitate method chaining
+        """
+        if not isinstance(watermark, np.generic):
+            watermark = _to_point(watermark)
+        if self._watermark is not None and watermark <= self._watermark:
+            return self
+        self._watermark = watermark
+        final, pending = [], []
+        for step_points, deltas in self._pending:
+            split = np.searchsorted(step_points, watermark)
+            if split:
+                final.append((step_points[:split], deltas[:split]))
+            if split < len(step_points):
+                pending.append((step_points[split:], deltas[split:]))
+        self._pending = pending
+        if final:
+            step_points, deltas = _sum_deltas_by_step_point(*zip(*final))
+            _append_run(self._final, (step_points, deltas), _concatenate_runs)
+        return self
+
+    def to_stairs(self) -> sc.Stairs:
+        """
+        Creates a :class:`Stairs` from the intervals added so far.
+
+        The builder may continue to be used afterwards.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        runs = self._final
+        if self._pending:
+            runs = runs + [_sum_deltas_by_step_point(*zip(*self._pending))]
+        step_points = [points for points, _ in runs]
+        deltas = [d for _, d in runs]
+        stairs = sc.Stairs._new(
+            initial_value=self._initial_value,
+            step_points=np.concatenate(step_points) if step_points else None,
+            deltas=np.concatenate(deltas) if deltas else None,
+            closed=self._closed,
+            tz=self._tz,
+        )
+        return stairs._remove_redundant_step_points()
@@ -316,6 +316,147 @@ Examples
 0.4961389383568339
 """
 
+xcov_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+    :include-source: False
+
+    >>> fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(7,3), sharey=True, sharex=True, tight_layout=True, dpi=400)
+    >>> for ax, title, stair_instance in zip(axes, ("s1", "s2"), (s1, s2)):
+    ...     stair_instance.plot(ax=ax, label=title, arrows=True)
+    ...     ax.set_title(title)
+
+>>> s1.xcov(s2, [-1, 0, 1], where=(1, 4.5))
+-1    0.358025
+ 0    0.122449
+ 1    0.160000
+dtype: float64
+
+>>> # equivalent to
+>>> pd.Series([s1.cov(s2, where=(1, 4.5), lag=lag) for lag in [-1, 0, 1]], index=[-1, 0, 1])
+-1    0.358025
+ 0    0.122449
+ 1    0.160000
+dtype: float64
+"""
+
+xcorr_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+    :include-source: False
+
+    >>> fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(7,3), sharey=True, sharex=True, tight_layout=True, dpi=400)
+    >>> for ax, title, stair_instance in zip(axes, ("s1", "s2"), (s1, s2)):
+    ...     stair_instance.plot(ax=ax, label=title, arrows=True)
+    ...     ax.set_title(title)
+
+>>> s1.xcorr(s2, [0, 0.5, 1], where=(1, 5.5))
+0.0    0.415376
+0.5    0.420230
+1.0    0.496139
+dtype: float64
+"""
+
+acov_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+    :include-source: False
+
+    >>> s1.plot(arrows=True)
+
+>>> s1.acov([0, 1, 2], where=(1, 5))
+0    0.687500
+1   -0.333333
+2    0.500000
+dtype: float64
+"""
+
+acorr_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+    :include-source: False
+
+    >>> s1.plot(arrows=True)
+
+>>> s1.acorr([0, 1, 2], where=(1, 5))
+0    1.000000
+1   -0.866025
+2    1.000000
+dtype: float64
+"""
+
+rolling_integral_example = """
+Examples
+--------
+
+>>> s2.rolling_integral(window=[-1, 1])
+-1.0    0.0
+ 1.0    1.0
+ 2.0    0.5
+ 3.0   -1.0
+ 4.0   -2.0
+ 4.5   -2.0
+ 6.5    0.0
+dtype: float64
+"""
+
+rolling_max_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+
+    >>> fig, ax = plt.subplots(figsize=(5,3), tight_layout=True, dpi=400)
+    >>> s2.plot(ax=ax, label="s2")
+    >>> s2.rolling_max(window=[-1, 0]).plot(ax=ax, label="rolling max")
+    >>> ax.legend()
+"""
+
+rolling_min_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+
+    >>> fig, ax = plt.subplots(figsize=(5,3), tight_layout=True, dpi=400)
+    >>> s2.plot(ax=ax, label="s2")
+    >>> s2.rolling_min(window=[-1, 0]).plot(ax=ax, label="rolling min")
+    >>> ax.legend()
+"""
+
+resample_grid_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+
+    >>> fig, ax = plt.subplots(figsize=(5,3), tight_layout=True, dpi=400)
+    >>> s2.plot(ax=ax, label="s2")
+    >>> s2.resample_grid(2, agg="max").plot(ax=ax, label="resampled by max")
+    >>> ax.legend()
+
+>>> s2.resample_grid(2, agg="mean", as_series=True)
+[0.0, 2.0)    0.50
+[2.0, 4.0)   -0.50
+[4.0, 6.0)   -0.75
+dtype: float64
+"""
+
 rolling_mean_example = """
 Examples
 --------
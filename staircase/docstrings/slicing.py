@@ -28,13 +28,43 @@ Parameters
 ----------
 funcs : str, or list of str
     The aggregation functions to apply. Currently supports "min", "max",
-    "mean", "median", "mode", "integral".
+    "mean", "median", "mode", "integral", "var", "std", "skew", "kurtosis".
 
 Returns
 -------
 :class:`pandas.Dataframe`
 """
 
+percentile_header = """
+Calculates percentiles of each step function slice, as per :meth:`Stairs.percentile`
+
+Parameters
+----------
+q : float or array-like of float
+    The percentiles, in the range 0 to 100.
+
+Returns
+-------
+:class:`pandas.Series` or :class:`pandas.DataFrame`
+    A Series if *q* is a scalar, otherwise a DataFrame where each row corresponds to a
+    step function slice and each column corresponds to a percentile.
+"""
+
+describe_header = """
+Generates descriptive statistics for each of the step function slices, as per
+:meth:`Stairs.describe`
+
+Parameters
+----------
+percentiles : array-like of float, default (25, 50, 75)
+    The percentiles to include in output.  Numbers should be in the range 0 to 100.
+
+Returns
+-------
+:class:`pandas.Dataframe`
+    Each row corresponds to a step function slice.  Each column corresponds to a statistic.
+"""
+
 hist_header = """
 Calculates histogram data for each of the step function slices
 
@@ -67,7 +97,7 @@ the slices with the new values.
 
 Parameters
 ----------
-func : {"min", "max", "mean", "median", "mode", "integral"}
+func : {"min", "max", "mean", "median", "mode", "integral", "var", "std", "skew", "kurtosis"}
     The function applied to the step function slices.
 
 Returns
@@ -151,6 +181,70 @@ mode_example = """
 dtype: float64
 """
 
+var_example = """
+>>> sf.slice(pd.date_range("2021", periods=12, freq="MS")).var()
+[2021-01-01, 2021-02-01)    1496.288675
+[2021-02-01, 2021-03-01)     303.896786
+[2021-03-01, 2021-04-01)    3122.082301
+[2021-04-01, 2021-05-01)    1452.445861
+[2021-05-01, 2021-06-01)     770.359702
+[2021-06-01, 2021-07-01)    1376.623244
+[2021-07-01, 2021-08-01)     991.191489
+[2021-08-01, 2021-09-01)     289.436093
+[2021-09-01, 2021-10-01)     331.527341
+[2021-10-01, 2021-11-01)     221.984532
+[2021-11-01, 2021-12-01)     383.696670
+dtype: float64
+"""
+
+std_example = """
+>>> sf.slice(pd.date_range("2021", periods=12, freq="MS")).std()
+[2021-01-01, 2021-02-01)    38.681891
+[2021-02-01, 2021-03-01)    17.432636
+[2021-03-01, 2021-04-01)    55.875597
+[2021-04-01, 2021-05-01)    38.110968
+[2021-05-01, 2021-06-01)    27.755354
+[2021-06-01, 2021-07-01)    37.102874
+[2021-07-01, 2021-08-01)    31.483194
+[2021-08-01, 2021-09-01)    17.012821
+[2021-09-01, 2021-10-01)    18.207892
+[2021-10-01, 2021-11-01)    14.899145
+[2021-11-01, 2021-12-01)    19.588177
+dtype: float64
+"""
+
+skew_example = """
+>>> sf.slice(pd.date_range("2021", periods=12, freq="MS")).skew()
+[2021-01-01, 2021-02-01)    -0.691723
+[2021-02-01, 2021-03-01)     0.013120
+[2021-03-01, 2021-04-01)    -0.320457
+[2021-04-01, 2021-05-01)    -0.277416
+[2021-05-01, 2021-06-01)     0.714982
+[2021-06-01, 2021-07-01)     0.861900
+[2021-07-01, 2021-08-01)     0.127466
+[2021-08-01, 2021-09-01)    -1.161266
+[2021-09-01, 2021-10-01)     0.609004
+[2021-10-01, 2021-11-01)     0.480850
+[2021-11-01, 2021-12-01)    -0.049302
+dtype: float64
+"""
+
+kurtosis_example = """
+>>> sf.slice(pd.date_range("2021", periods=12, freq="MS")).kurtosis()
+[2021-01-01, 2021-02-01)    -0.783065
+[2021-02-01, 2021-03-01)    -0.818025
+[2021-03-01, 2021-04-01)    -1.224092
+[2021-04-01, 2021-05-01)    -1.213921
+[2021-05-01, 2021-06-01)    -0.712928
+[2021-06-01, 2021-07-01)    -0.331527
+[2021-07-01, 2021-08-01)    -1.165352
+[2021-08-01, 2021-09-01)     0.765656
+[2021-09-01, 2021-10-01)     0.110079
+[2021-10-01, 2021-11-01)    -0.529246
+[2021-11-01, 2021-12-01)    -0.987615
+dtype: float64
+"""
+
 min_example = """
 >>> sf.slice(pd.date_range("2021", periods=12, freq="MS")).min()
 [2021-01-01, 2021-02-01)    354.0
@@ -220,6 +314,40 @@ agg_example = """
 [2021-11-01, 2021-12-01)  434.0  509.0
 """
 
+percentile_example = """
+>>> cuts = pd.date_range("2021", periods=12, freq="MS")
+>>> sf.slice(cuts).percentile([10, 90])
+                             10     90
+[2021-01-01, 2021-02-01)  374.0  476.0
+[2021-02-01, 2021-03-01)  352.0  398.0
+[2021-03-01, 2021-04-01)  420.0  574.0
+[2021-04-01, 2021-05-01)  444.0  550.0
+[2021-05-01, 2021-06-01)  369.0  436.0
+[2021-06-01, 2021-07-01)  357.0  468.0
+[2021-07-01, 2021-08-01)  451.0  532.0
+[2021-08-01, 2021-09-01)  448.0  494.0
+[2021-09-01, 2021-10-01)  423.0  470.0
+[2021-10-01, 2021-11-01)  449.0  484.0
+[2021-11-01, 2021-12-01)  447.0  500.0
+"""
+
+describe_example = """
+>>> cuts = pd.date_range("2021", periods=12, freq="MS")
+>>> sf.slice(cuts).describe(percentiles=[50])
+                          unique        mean        std    min    50%    max
+[2021-01-01, 2021-02-01)      81  436.869646  38.681891  354.0  442.0  492.0
+[2021-02-01, 2021-03-01)      52  374.335764  17.432636  338.0  375.0  418.0
+[2021-03-01, 2021-04-01)      83  501.771729  55.875597  401.0  509.0  587.0
+[2021-04-01, 2021-05-01)      77  502.593889  38.110968  437.0  508.0  564.0
+[2021-05-01, 2021-06-01)      71  396.009341  27.755354  356.0  384.0  463.0
+[2021-06-01, 2021-07-01)      70  398.588958  37.102874  344.0  387.0  480.0
+[2021-07-01, 2021-08-01)      62  488.410708  31.483194  436.0  486.0  543.0
+[2021-08-01, 2021-09-01)      53  475.959341  17.012821  426.0  482.0  502.0
+[2021-09-01, 2021-10-01)      52  438.847106  18.207892  399.0  435.0  486.0
+[2021-10-01, 2021-11-01)      56  463.746685  14.899145  434.0  462.0  505.0
+[2021-11-01, 2021-12-01)      58  474.082616  19.588177  434.0  474.0  509.0
+"""
+
 hist_example = """
 >>> cuts = pd.date_range("2021", periods=12, freq="MS")
 >>> sf.slice(cuts).hist(bins=[300, 400, 500, 600], stat="probability")
@@ -281,8 +409,24 @@ mode_docstring = "\n".join(
 integral_docstring = "\n".join(
     [base_header.format(name="integral"), example_header, integral_example]
 )
+var_docstring = "\n".join(
+    [base_header.format(name="variance"), example_header, var_example]
+)
+std_docstring = "\n".join(
+    [base_header.format(name="standard deviation"), example_header, std_example]
+)
+skew_docstring = "\n".join(
+    [base_header.format(name="skewness"), example_header, skew_example]
+)
+kurtosis_docstring = "\n".join(
+    [base_header.format(name="excess kurtosis"), example_header, kurtosis_example]
+)
 apply_docstring = "\n".join([apply_header, example_header, apply_example])
 agg_docstring = "\n".join([agg_header, example_header, agg_example])
+percentile_docstring = "\n".join(
+    [percentile_header, example_header, percentile_example]
+)
+describe_docstring = "\n".join([describe_header, example_header, describe_example])
 hist_docstring = "\n".join([hist_header, example_header, hist_example])
 resample_docstring = "\n".join([resample_header, example_header, resample_example])
 
@@ -293,4 +437,8 @@ _docstrings = {
     "mode": mode_docstring,
     "median": median_docstring,
     "integral": integral_docstring,
+    "var": var_docstring,
+    "std": std_docstring,
+    "skew": skew_docstring,
+    "kurtosis": kurtosis_docstring,
 }
@@ -0,0 +1,2 @@
+from staircase.io.json import from_json, read_json, to_json, write_json
+from staircase.io.pickle import from_bytes, read_bytes, to_bytes, write_bytes
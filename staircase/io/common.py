@@ -0,0 +1,153 @@
+"""
+Helpers shared by the binary and JSON formats.
+
+Both formats store step functions as columns, as per
+:class:`staircase.core.arrays.columnar._StairsColumns`.  The step points of
+timezone aware datetimes are stored in UTC, with the name of the timezone.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytz
+
+import staircase as sc
+from staircase.core.arrays.columnar import _StairsColumns
+
+FORMAT_VERSION = 1
+
+# kinds of numpy dtypes which step points may have
+_STEP_POINT_KINDS = "iufMm"
+
+
+def _check_version(version):
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Version {version} of the staircase format is not supported by this "
+            f"version of staircase, which supports versions up to {FORMAT_VERSION}."
+        )
+
+
+def _check_step_points(step_points):
+    if step_points.dtype.kind not in _STEP_POINT_KINDS:
+        raise ValueError(
+            f"Step points with dtype {step_points.dtype} cannot be serialized."
+        )
+
+
+def _encode_tz(tz):
+    """
+    Returns the name of a timezone, or None, and whether it is a pytz timezone.
+    """
+    if tz is None:
+        return None, False
+    if isinstance(tz, pytz.BaseTzInfo):
+        return tz.zone, True
+    name = str(tz)
+    try:
+        pd.DatetimeTZDtype(tz=name)
+    except (KeyError, TypeError, ValueError):
+        # fixed offsets are stored as such, eg "UTC+10:00"
+        offset = tz.utcoffset(None)
+        if offset is None:
+            raise ValueError(f"The timezone {tz!r} cannot be serialized.")
+        name = str(datetime.timezone(offset))
+    return name, False
+
+
+def _decode_tz(name, is_pytz):
+    if name is None:
+        return None
+    if is_pytz:
+        return pytz.timezone(name)
+    return pd.DatetimeTZDtype(tz=name).tz
+
+
+def _to_parts(obj):
+    """
+    Decomposes a :class:`Stairs` or :class:`StairsArray` into a header, of values
+    which can be encoded as JSON, and arrays.
+
+    Raises
+    ------
+    TypeError
+        If *obj* is not a :class:`Stairs` or :class:`StairsArray`.
+    ValueError
+        If the step points or timezone cannot be serialized, or the step
+        functions of a :class:`StairsArray` cannot be stored in columns.
+    """
+    if isinstance(obj, sc.Stairs):
+        header = {
+            "type": "Stairs",
+            "initial_value": float(obj.initial_value),
+            "closed": obj.closed,
+        }
+        if obj._step_points is None:
+            arrays = {
+                "step_points": np.array([], dtype="float64"),
+                "values": np.array([], dtype="float64"),
+            }
+        else:
+            arrays = {"step_points": obj._step_points, "values": obj._get_values()}
+        tz = obj._tz
+    elif isinstance(obj, sc.StairsArray):
+        columns = obj._get_columns()
+        if columns is None:
+            raise ValueError(
+                "Only StairsArray whose step functions can be stored in columns can be serialized."
+            )
+        header = {"type": "StairsArray"}
+        arrays = {
+            "step_points": columns.step_points,
+            "values": columns.values,
+            "offsets": columns.offsets,
+            "initial_values": columns.initial_values,
+            "right": columns.closed == "right",
+            "isna": columns.isna,
+        }
+        tz = columns.tz
+    else:
+        raise TypeError(
+            f"Only Stairs and StairsArray can be serialized, not {type(obj).__name__}."
+        )
+    _check_step_points(arrays["step_points"])
+    header["tz"], header["pytz"] = _encode_tz(tz)
+    return header, arrays
+
+
+def _from_parts(header, arrays):
+    """
+    Inverse of :func:`_to_parts`.
+
+    Raises
+    ------
+    ValueError
+        If the header does not describe a :class:`Stairs` or :class:`StairsArray`.
+    """
+    tz = _decode_tz(header["tz"], header["pytz"])
+    if header["type"] == "StairsArray":
+        return sc.StairsArray(
+            _StairsColumns(
+                arrays["step_points"],
+                arrays["values"],
+                arrays["offsets"],
+                arrays["initial_values"],
+                np.where(arrays["right"], "right", "left").astype("<U5"),
+                arrays["isna"],
+                tz,
+            )
+        )
+    if header["type"] != "Stairs":
+        raise ValueError(f"Unknown type of data: {header['type']}.")
+    if not len(arrays["step_points"]):
+        return sc.Stairs._new(
+            initial_value=header["initial_value"], closed=header["closed"]
+        )
+    return sc.Stairs._new(
+        initial_value=header["initial_value"],
+        step_points=arrays["step_points"],
+        values=arrays["values"],
+        closed=header["closed"],
+        tz=tz,
+    )
@@ -0,0 +1,168 @@
+"""
+A JSON format for :class:`Stairs` and :class:`StairsArray`, for interoperability.
+
+A document is an object with the keys ``"format"``, ``"version"`` and ``"type"``,
+and the header of the binary format, such as ``"initial_value"`` and ``"closed"``
+for a :class:`Stairs`.  Each array of the binary format is a list under its own
+name, where null values are ``null``, datetimes are ISO 8601 strings in UTC, and
+timedeltas are integers in the unit given by the ``"dtype"`` key.
+"""
+
+import json
+
+import numpy as np
+
+from staircase.io.common import FORMAT_VERSION, _check_version, _from_parts, _to_parts
+
+_FORMAT = "staircase"
+
+# the dtypes of the arrays, other than step points, which are fixed
+_DTYPES = {
+    "values": "float64",
+    "offsets": "int64",
+    "initial_values": "float64",
+    "right": "bool",
+    "isna": "bool",
+}
+
+
+def _to_list(array):
+    if array.dtype.kind == "M":
+        return np.datetime_as_string(array).tolist()
+    if array.dtype.kind == "m":
+        return array.view("int64").tolist()
+    if array.dtype.kind == "f":
+        return np.where(np.isnan(array), None, array).tolist()
+    return array.tolist()
+
+
+def _from_list(values, dtype):
+    dtype = np.dtype(dtype)
+    if dtype.kind == "m":
+        return np.array(values, dtype="int64").view(dtype)
+    # null values are converted to nan by numpy
+    return np.array(values, dtype=dtype)
+
+
+def to_json(obj) -> str:
+    """
+    Serializes a :class:`Stairs` or :class:`StairsArray` to a JSON string.
+
+    Parameters
+    ----------
+    obj : :class:`Stairs` or :class:`StairsArray`
+
+    Returns
+    -------
+    str
+
+    Raises
+    ------
+    TypeError
+        If *obj* is not a :class:`Stairs` or :class:`StairsArray`.
+    ValueError
+        If the step points or timezone cannot be serialized, or the step
+        functions of a :class:`StairsArray` cannot be stored in columns.
+
+    See Also
+    --------
+    staircase.io.from_json
+    staircase.io.to_bytes
+
+    Examples
+    --------
+
+    >>> text = sc.io.to_json(s1)
+    >>> sc.io.from_json(text).identical(s1)
+    True
+    """
+    header, arrays = _to_parts(obj)
+    document = {"format": _FORMAT, "version": FORMAT_VERSION}
+    document.update(header)
+    # the initial value of a Stairs may be null
+    document = {
+        key: None if isinstance(value, float) and np.isnan(value) else value
+        for key, value in document.items()
+    }
+    document["dtype"] = str(arrays["step_points"].dtype)
+    document.update({name: _to_list(array) for name, array in arrays.items()})
+    return json.dumps(document)
+
+
+def from_json(text: str):
+    """
+    Deserializes a :class:`Stairs` or :class:`StairsArray` from a JSON string.
+
+    Parameters
+    ----------
+    text : str
+        A string created by :func:`staircase.io.to_json`.
+
+    Returns
+    -------
+    :class:`Stairs` or :class:`StairsArray`
+
+    Raises
+    ------
+    ValueError
+        If *text* is not in the staircase JSON format, or its version is not
+        supported.
+
+    See Also
+    --------
+    staircase.io.to_json
+    """
+    document = json.loads(text)
+    if not isinstance(document, dict) or document.get("format") != _FORMAT:
+        raise ValueError("The text is not in the staircase JSON format.")
+    _check_version(document["version"])
+    if document.get("initial_value", 0) is None:
+        document["initial_value"] = np.nan
+    dtypes = dict(_DTYPES, step_points=document["dtype"])
+    arrays = {
+        name: _from_list(document[name], dtype)
+        for name, dtype in dtypes.items()
+        if name in document
+    }
+    return _from_parts(document, arrays)
+
+
+def write_json(obj, path):
+    """
+    Writes a :class:`Stairs` or :class:`StairsArray` to a file in the JSON format.
+
+    Parameters
+    ----------
+    obj : :class:`Stairs` or :class:`StairsArray`
+    path : str or path-like
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    staircase.io.read_json
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(to_json(obj))
+
+
+def read_json(path):
+    """
+    Reads a :class:`Stairs` or :class:`StairsArray` from a file in the JSON format.
+
+    Parameters
+    ----------
+    path : str or path-like
+
+    Returns
+    -------
+    :class:`Stairs` or :class:`StairsArray`
+
+    See Also
+    --------
+    staircase.io.write_json
+    """
+    with open(path, encoding="utf-8") as f:
+        return from_json(f.read())
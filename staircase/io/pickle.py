@@ -0,0 +1,188 @@
+"""
+A compact binary format for :class:`Stairs` and :class:`StairsArray`.
+
+The format consists of
+
+- the magic bytes ``b"STAIRCSE"``
+- the version of the format, and the length of the header in bytes, as
+  little-endian unsigned 32-bit integers
+- the header, as UTF-8 encoded JSON, describing the step functions and the
+  dtype and length of each array
+- the arrays, as raw little-endian bytes, each starting at a multiple of eight
+  bytes
+
+Arrays are read with :func:`numpy.frombuffer`, so they are neither parsed nor
+copied.  They are read-only views of the bytes, as are the arrays of all
+:class:`Stairs`.  Step functions are pickled in this format.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+import staircase as sc
+from staircase.io.common import FORMAT_VERSION, _check_version, _from_parts, _to_parts
+
+_MAGIC = b"STAIRCSE"
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+
+def _padding(length):
+    return b"\x00" * (-length % _ALIGNMENT)
+
+
+def _little_endian(array):
+    return np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+
+
+def to_bytes(obj) -> bytes:
+    """
+    Serializes a :class:`Stairs` or :class:`StairsArray` to bytes.
+
+    Parameters
+    ----------
+    obj : :class:`Stairs` or :class:`StairsArray`
+
+    Returns
+    -------
+    bytes
+
+    Raises
+    ------
+    TypeError
+        If *obj* is not a :class:`Stairs` or :class:`StairsArray`.
+    ValueError
+        If the step points or timezone cannot be serialized, or the step
+        functions of a :class:`StairsArray` cannot be stored in columns.
+
+    See Also
+    --------
+    staircase.io.from_bytes
+    staircase.io.to_json
+
+    Examples
+    --------
+
+    >>> data = sc.io.to_bytes(s1)
+    >>> sc.io.from_bytes(data).identical(s1)
+    True
+    """
+    header, arrays = _to_parts(obj)
+    arrays = {name: _little_endian(array) for name, array in arrays.items()}
+    header["arrays"] = [
+        [name, array.dtype.str, len(array)] for name, array in arrays.items()
+    ]
+    encoded_header = json.dumps(header).encode("utf-8")
+    chunks = [
+        _PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(encoded_header)),
+        encoded_header,
+        _padding(len(encoded_header)),
+    ]
+    for array in arrays.values():
+        chunks.append(memoryview(array.view(np.uint8)))
+        chunks.append(_padding(array.nbytes))
+    return b"".join(chunks)
+
+
+def from_bytes(data):
+    """
+    Deserializes a :class:`Stairs` or :class:`StairsArray` from bytes.
+
+    The arrays of the result are views of *data*, rather than copies.
+
+    Parameters
+    ----------
+    data : bytes-like
+        Bytes created by :func:`staircase.io.to_bytes`.
+
+    Returns
+    -------
+    :class:`Stairs` or :class:`StairsArray`
+
+    Raises
+    ------
+    ValueError
+        If *data* is not in the staircase binary format, or its version is not
+        supported.
+
+    See Also
+    --------
+    staircase.io.to_bytes
+    """
+    data = memoryview(data).cast("B")
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("The data is not in the staircase binary format.")
+    magic, version, header_length = _PREAMBLE.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("The data is not in the staircase binary format.")
+    _check_version(version)
+    offset = _PREAMBLE.size
+    header = json.loads(bytes(data[offset : offset + header_length]))
+    offset += header_length + len(_padding(header_length))
+    arrays = {}
+    for name, dtype, length in header["arrays"]:
+        dtype = np.dtype(dtype)
+        arrays[name] = np.frombuffer(data, dtype=dtype, count=length, offset=offset)
+        offset += dtype.itemsize * length + len(_padding(dtype.itemsize * length))
+    return _from_parts(header, arrays)
+
+
+def write_bytes(obj, path):
+    """
+    Writes a :class:`Stairs` or :class:`StairsArray` to a file in the binary format.
+
+    Parameters
+    ----------
+    obj : :class:`Stairs` or :class:`StairsArray`
+    path : str or path-like
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    staircase.io.read_bytes
+    """
+    with open(path, "wb") as f:
+        f.write(to_bytes(obj))
+
+
+def read_bytes(path):
+    """
+    Reads a :class:`Stairs` or :class:`StairsArray` from a file in the binary format.
+
+    Parameters
+    ----------
+    path : str or path-like
+
+    Returns
+    -------
+    :class:`Stairs` or :class:`StairsArray`
+
+    See Also
+    --------
+    staircase.io.write_bytes
+    """
+    with open(path, "rb") as f:
+        return from_bytes(f.read())
+
+
+def _restore(cls, data):
+    # the inverse of _reduce for subclasses of Stairs and StairsArray
+    obj = from_bytes(data)
+    obj.__class__ = cls
+    return obj
+
+
+def _reduce(obj):
+    # the implementation of __reduce__ for Stairs and StairsArray.  The type of
+    # subclasses is restored, with any attributes which the base class lacks.
+    data = to_bytes(obj)
+    if type(obj) in (sc.Stairs, sc.StairsArray):
+        return from_bytes, (data,)
+    attributes = vars(from_bytes(data))
+    state = {name: value for name, value in vars(obj).items() if name not in attributes}
+    return _restore, (type(obj), data), state or None
@@ -22,17 +22,55 @@ def _is_datetime_like(x):
     )
 
 
-def _sanitize_binary_operands(self, other, copy_other=False):
+def _split_index(index):
+    """
+    Decompose a pandas index of step points into a numpy array and timezone.
+
+    Timezone aware datetimes are stored as UTC datetime64 values, which is what
+    :meth:`pandas.DatetimeIndex.values` returns, so that comparisons with
+    sampling points (also converted via ``.values``) are consistent.
+
+    Parameters
+    ----------
+    index : pandas.Index
+
+    Returns
+    -------
+    tuple of numpy.ndarray and tzinfo (or None)
+    """
+    return np.asarray(index.values), getattr(index.dtype, "tz", None)
+
+
+def _to_point(x):
+    # converts a scalar to the representation used for step points
+    return _split_index(pd.Index([x]))[0][0]
+
+
+def _make_index(step_points, tz=None):
+    """
+    Inverse of :func:`_split_index`.
+
+    Parameters
+    ----------
+    step_points : numpy.ndarray
+    tz : tzinfo, optional
+
+    Returns
+    -------
+    pandas.Index
+    """
+    index = pd.Index(step_points, copy=False)
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return index
+
+
+def _sanitize_binary_operands(self, other):
+    # the arrays of step functions are read-only, so operands are not copied
     if not isinstance(self, sc.Stairs):
         self = sc.Stairs(initial_value=self, closed=other.closed)
-    else:
-        self = self.copy()
-
     if not isinstance(other, sc.Stairs):
         other = sc.Stairs(initial_value=other, closed=self.closed)
-    else:
-        if copy_other:
-            other = other.copy()
     return self, other
 
 
@@ -63,3 +101,17 @@ def _replace_none_with_infs(tuple_):
     if right is None:
         right = inf
     return (left, right)
+
+
+def _is_bounded(tuple_):
+    return all(bound not in (-inf, inf) for bound in _replace_none_with_infs(tuple_))
+
+
+def _masked(values, other):
+    # values which are null where other is null
+    return np.where(np.isnan(other), np.nan, values)
+
+
+def _changed(values, previous):
+    # whether values differ from previous values, where nulls are equal
+    return (values != previous) & ~(np.isnan(values) & np.isnan(previous))
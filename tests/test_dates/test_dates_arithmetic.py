@@ -357,3 +357,22 @@ def test_divide_dates_scalar(date_func):
         check_index_type=False,
     )
     assert_expected_type(result, date_func)
+
+
+def test_lazy_dates(date_func):
+    expected = (s1(date_func) + s2(date_func)) * s3(date_func) - s4(date_func)
+    result = (s1(date_func).lazy() + s2(date_func)) * s3(date_func) - s4(date_func)
+    result = result.compute()
+    assert result.identical(expected)
+    assert_expected_type(result, date_func)
+
+
+def test_inplace_accumulation_dates(date_func):
+    expected = s1(date_func) + s2(date_func) - s3(date_func) + s4(date_func)
+    result = Stairs()
+    result += s1(date_func)
+    result += s2(date_func)
+    result -= s3(date_func)
+    result += s4(date_func)
+    assert result.identical(expected)
+    assert_expected_type(result, date_func)
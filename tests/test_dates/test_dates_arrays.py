@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -601,3 +603,120 @@ def test_aggregation_with_constant_stairs(func, swap_order):
     s2 = sc.Stairs()
     arr = [s2, s1] if swap_order else [s1, s2]
     func(arr)
+
+
+def test_columnar_sample_and_stats(date_func):
+    data = [s1(date_func), s2(date_func)]
+    series = pd.Series(sc.StairsArray(data).to_columnar(), dtype="Stairs")
+    ts3 = timestamp(2020, 1, 3, date_func=date_func)
+    ts6 = timestamp(2020, 1, 6, date_func=date_func)
+    pd.testing.assert_frame_equal(
+        series.sc.sample([ts6, ts3]),
+        pd.DataFrame({ts6: [-0.5, -2.5], ts3: [2.75, -0.5]}),
+        check_index_type=False,
+    )
+    assert list(series.sc.integral()) == [s.integral() for s in data]
+    np.testing.assert_allclose(series.sc.mean(), [s.mean() for s in data])
+    np.testing.assert_allclose(series.sc.max(), [s.max() for s in data])
+    assert series.iloc[1].identical(data[1])
+
+
+def test_columnar_describe(date_func):
+    data = [
+        s1(date_func),
+        None,
+        s2(date_func).mask(
+            (
+                timestamp(2020, 1, 3, date_func=date_func),
+                timestamp(2020, 1, 4, date_func=date_func),
+            )
+        ),
+    ]
+    series = pd.Series(sc.StairsArray(data).to_columnar(), dtype="Stairs")
+    expected = pd.DataFrame(
+        [pd.Series(dtype=float) if s is None else s.describe() for s in data]
+    )
+    pd.testing.assert_frame_equal(series.sc.describe(), expected, check_dtype=False)
+
+
+def test_describe_different_timezones():
+    stairs_utc = sc.Stairs().layer(
+        pd.Timestamp("2020-01-02", tz="UTC"), pd.Timestamp("2020-01-04", tz="UTC")
+    )
+    stairs_aus = sc.Stairs().layer(
+        pd.Timestamp("2020-01-03", tz="Australia/Sydney"),
+        pd.Timestamp("2020-01-05", tz="Australia/Sydney"),
+        2,
+    )
+    series = pd.Series([stairs_utc, None, stairs_aus], dtype="Stairs")
+    result = series.sc.describe(percentiles=[50])
+    assert list(result.columns) == ["unique", "mean", "std", "min", "50%", "max"]
+    assert result["max"].tolist()[::2] == [1, 2]
+    assert result.iloc[1].isna().all()
+
+
+def test_sample_matrix_different_timezones():
+    stairs_utc = sc.Stairs().layer(
+        pd.Timestamp("2020-01-02", tz="UTC"), pd.Timestamp("2020-01-04", tz="UTC")
+    )
+    stairs_aus = sc.Stairs().layer(
+        pd.Timestamp("2020-01-03", tz="Australia/Sydney"),
+        pd.Timestamp("2020-01-05", tz="Australia/Sydney"),
+    )
+    series = pd.Series([stairs_utc, None, stairs_aus], dtype="Stairs")
+    x = pd.DatetimeIndex(
+        ["2020-01-01 00:00", "2020-01-03 12:00", "2020-01-04 12:00"], tz="UTC"
+    )
+    np.testing.assert_array_equal(
+        series.sc.sample(x, as_frame=False),
+        [[0, 1, 0], [np.nan, np.nan, np.nan], [0, 1, 1]],
+    )
+
+
+def test_mixed_step_point_types_not_columnar():
+    stairs_num = sc.Stairs().layer(1, 3)
+    stairs_dt = sc.Stairs().layer(
+        pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-04"), 2
+    )
+    array = sc.StairsArray([stairs_num, None, stairs_dt])
+    assert array._get_columns() is None
+    with pytest.raises(ValueError):
+        array.to_columnar()
+    series = pd.Series(array, dtype="Stairs")
+    np.testing.assert_array_equal(series.sc.max(), [1, np.nan, 2])
+    np.testing.assert_array_equal(series.sc.mean(), [1, np.nan, 2])
+
+
+@pytest.mark.parametrize(
+    "stairs",
+    [
+        sc.Stairs().layer(1, 3),
+        sc.Stairs().layer(
+            pd.Timestamp("2020-01-03", tz="Australia/Sydney"),
+            pd.Timestamp("2020-01-05", tz="Australia/Sydney"),
+            2,
+        ),
+    ],
+)
+def test_pickle_not_columnar(stairs):
+    stairs_utc = sc.Stairs().layer(
+        pd.Timestamp("2020-01-02", tz="UTC"), pd.Timestamp("2020-01-04", tz="UTC")
+    )
+    series = pd.Series([stairs_utc, None, stairs], dtype="Stairs")
+    result = pickle.loads(pickle.dumps(series))
+    assert result.dtype == series.dtype
+    assert result.iloc[0].identical(stairs_utc)
+    assert result.iloc[1] is None
+    assert result.iloc[2].identical(stairs)
+    with pytest.raises(ValueError):
+        sc.io.to_bytes(series.values)
+
+
+@pytest.mark.parametrize("func", ["cov", "corr"])
+def test_cov_corr_matrix_unbounded_where_dates(date_func, func):
+    data = [s1(date_func), s2(date_func).mask((s1(date_func).step_points[1], None))]
+    result = getattr(sc, func)(data).values
+    expected = np.array([[getattr(a, func)(b) for b in data] for a in data])
+    if func == "corr":
+        np.fill_diagonal(expected, 1)
+    np.testing.assert_allclose(result, expected)
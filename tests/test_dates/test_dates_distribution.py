@@ -467,3 +467,8 @@ def test_hist_default_bins(date_func, stairs_func, bounds, closed):
     bounds = [timestamp(*args, date_func=date_func) for args in bounds]
     hist = stairs_instance.clip(*bounds).hist(closed=closed, stat="probability")
     assert abs(hist.sum() - 1) < 0.000001
+
+
+def test_percentile_dates_vectorized(date_func):
+    q = [-10, 0, 20, 40, 50, 60, 80, 100, 110]
+    assert list(s1(date_func).percentile(q)) == [s1(date_func).percentile(x) for x in q]
@@ -5,9 +5,11 @@ import pandas as pd
 import pytest
 import pytz
 
+import staircase as sc
 import staircase.test_data as test_data
 from staircase import Stairs
 from staircase.constants import inf
+from staircase.core.layering import _sum_deltas_by_step_point_groupby
 
 
 def pytest_generate_tests(metafunc):
@@ -356,3 +358,179 @@ def test_from_values(date_func):
     print(sf._data)
     print(s1(date_func)._data)
     assert sf.identical(s1(date_func))
+
+
+def test_layering_test_data_matches_groupby():
+    df = test_data.make_test_data(dates=True, seed=42)
+    result = Stairs(df, "start", "end", "value")
+    start = df["start"].dropna()
+    end = df["end"].dropna()
+    step_points, deltas = _sum_deltas_by_step_point_groupby(
+        [start.values, end.values],
+        [df.loc[start.index, "value"].values, -df.loc[end.index, "value"].values],
+    )
+    expected = pd.Series(deltas, index=step_points)
+    pd.testing.assert_series_equal(
+        result.step_changes,
+        expected[expected != 0],
+        check_names=False,
+        check_dtype=False,
+        check_index_type=False,
+    )
+    assert result.initial_value == df.loc[df["start"].isna(), "value"].sum()
+
+
+def test_layering_scalar_buffered(date_func):
+    result = Stairs()
+    result.layer(
+        timestamp(2020, 1, 1, date_func=date_func),
+        timestamp(2020, 1, 10, date_func=date_func),
+        2,
+    )
+    result.layer(
+        timestamp(2020, 1, 3, date_func=date_func),
+        timestamp(2020, 1, 1, date_func=date_func),
+        -3,
+    )
+    result.layer(None, timestamp(2020, 1, 3, date_func=date_func), 3)
+    assert result._pending_layers
+    expected = Stairs().layer(
+        [
+            timestamp(2020, 1, 1, date_func=date_func),
+            timestamp(2020, 1, 3, date_func=date_func),
+            None,
+        ],
+        [
+            timestamp(2020, 1, 10, date_func=date_func),
+            timestamp(2020, 1, 1, date_func=date_func),
+            timestamp(2020, 1, 3, date_func=date_func),
+        ],
+        [2, -3, 3],
+    )
+    assert result.identical(expected)
+    assert not result._pending_layers
+    assert_expected_type(result, date_func)
+
+
+def test_from_stream(date_func):
+    df = test_data.make_test_data(dates=True, seed=42)
+    df = df.dropna(subset=["start"]).sort_values("start")
+    df["start"] = df["start"].map(lambda ts: timestamp(ts, date_func=date_func))
+    df["end"] = df["end"].map(
+        lambda ts: None if pd.isna(ts) else timestamp(ts, date_func=date_func)
+    )
+    chunks = [
+        (df["start"].iloc[i : i + 50], df["end"].iloc[i : i + 50])
+        for i in range(0, len(df), 50)
+    ]
+    result = Stairs.from_stream(chunks, lateness=pd.Timedelta("7D"))
+    expected = Stairs(df, "start", "end")
+    assert result.identical(expected)
+    assert result.step_changes.index.dtype == expected.step_changes.index.dtype
+
+
+@pytest.mark.parametrize("tz", [None, "Australia/Sydney"])
+def test_rolling_mean_engines(tz):
+    df = test_data.make_test_data(dates=True, seed=3)
+    df["start"] = df["start"].dt.tz_localize(tz)
+    df["end"] = df["end"].dt.tz_localize(tz)
+    stairs = Stairs(df, "start", "end", "value")
+    window = (pd.Timedelta("-1D"), pd.Timedelta("6h"))
+    where = (pd.Timestamp("2021-02-01", tz=tz), pd.Timestamp("2021-05-01", tz=tz))
+    pd.testing.assert_series_equal(
+        stairs.rolling_mean(window, where),
+        stairs.rolling_mean(window, where, engine="slice"),
+        check_freq=False,
+    )
+
+
+@pytest.mark.parametrize("tz", [None, "Australia/Sydney"])
+@pytest.mark.parametrize("freq", ["6h", "D", "MS"])
+@pytest.mark.parametrize("agg", ["mean", "max", "integral"])
+def test_resample_grid_dates(tz, freq, agg):
+    df = test_data.make_test_data(dates=True, seed=3)
+    df["start"] = df["start"].dt.tz_localize(tz)
+    df["end"] = df["end"].dt.tz_localize(tz)
+    stairs = Stairs(df, "start", "end", "value")
+    result = stairs.resample_grid(freq, agg, as_series=True)
+    assert result.index.left[0] <= stairs.step_changes.index[0]
+    assert result.index.right[-1] >= stairs.step_changes.index[-1]
+    assert result.index.left[0] == result.index.left[0].floor("D")
+    pd.testing.assert_series_equal(
+        result, getattr(stairs.slice(result.index), agg)(), check_exact=False
+    )
+
+
+def test_resample_grid_dates_stairs():
+    stairs = Stairs().layer(
+        pd.Timestamp("2020-01-01 06:00"), pd.Timestamp("2020-01-02")
+    )
+    result = stairs.resample_grid("12h")
+    expected = pd.Series(
+        [0.5, 1.0, 0.0],
+        index=pd.DatetimeIndex(
+            ["2020-01-01 00:00", "2020-01-01 12:00", "2020-01-02 00:00"]
+        ),
+    )
+    pd.testing.assert_series_equal(
+        result.step_values, expected, check_names=False, check_index_type=False
+    )
+    with pytest.raises(ValueError):
+        stairs.resample_grid("12h", agg="integral")
+
+
+def test_rolling_max_dates():
+    stairs = Stairs().layer(
+        [pd.Timestamp("2020-01-01"), pd.Timestamp("2020-01-03")],
+        [pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-05")],
+        [2, 1],
+    )
+    result = stairs.rolling_max((pd.Timedelta("-1D"), pd.Timedelta(0)))
+    expected = pd.Series(
+        [2.0, 1.0, 0.0],
+        index=pd.to_datetime(["2020-01-01", "2020-01-03", "2020-01-06"]),
+    )
+    pd.testing.assert_series_equal(
+        result.step_values, expected, check_names=False, check_index_type=False
+    )
+
+
+@pytest.mark.parametrize("format", ["bytes", "json"])
+def test_io_round_trip_dates(date_func, format):
+    serialize, deserialize = {
+        "bytes": (sc.io.to_bytes, sc.io.from_bytes),
+        "json": (sc.io.to_json, sc.io.from_json),
+    }[format]
+    stairs = s1(date_func).mask((s2(date_func).step_points[1], None))
+    result = deserialize(serialize(stairs))
+    assert result.identical(stairs)
+    assert_expected_type(result, date_func)
+    array = sc.StairsArray([s2(date_func), None, s3(date_func)])
+    result = deserialize(serialize(array))
+    assert result[0].identical(s2(date_func))
+    assert result[1] is None
+    assert_expected_type(result[2], date_func)
+
+
+@pytest.mark.parametrize("pending", [False, True])
+def test_layer_scalar_incompatible_point_type(pending):
+    stairs = Stairs().layer(0, 5, 2)
+    if pending:
+        stairs.layer(1, 3)
+    with pytest.raises(TypeError):
+        stairs.layer(pd.Timestamp("2020"), pd.Timestamp("2021"))
+    with pytest.raises(TypeError):
+        stairs.layer(pd.Timedelta("1D"), None)
+    expected = Stairs().layer([0, 1], [5, 3], [2, 1] if pending else [2, 0])
+    assert stairs.identical(expected)
+
+
+def test_layer_scalar_timezones():
+    start, end = pd.Timestamp("2020", tz="UTC"), pd.Timestamp("2021", tz="UTC")
+    stairs = Stairs().layer(start, end)
+    with pytest.raises(TypeError):
+        stairs.layer(pd.Timestamp("2020"), pd.Timestamp("2021"))
+    sydney = pd.Timestamp("2020-06-01", tz="Australia/Sydney")
+    stairs.layer(sydney, None)
+    expected = Stairs().layer([start, sydney.tz_convert("UTC")], [end, None])
+    assert stairs.identical(expected)
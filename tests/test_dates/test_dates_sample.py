@@ -282,3 +282,15 @@ def test_limit_dates_4(date_func):
         ),
         [4.5, 2],
     )
+
+
+def test_sample_dates_index(date_func):
+    points = [timestamp(2020, 1, day, date_func=date_func) for day in range(1, 20)]
+    index = pd.Index(points)
+    expected = s1(date_func).sample(points)
+    assert _compare_iterables(s1(date_func).sample(index), expected)
+    assert _compare_iterables(s1(date_func).sample(pd.Series(index)), expected)
+    assert _compare_iterables(
+        s1(date_func).limit(index[::-1], side="left")[::-1],
+        s1(date_func).limit(index, side="left", assume_sorted=True),
+    )
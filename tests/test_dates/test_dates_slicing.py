@@ -16,3 +16,83 @@ def test_slice_month_period_range(freq_str):
     slicer1._create_slices()
     slicer2._create_slices()
     assert all([s1.identical(s2) for s1, s2, in zip(slicer1._slices, slicer2._slices)])
+
+
+@pytest.mark.parametrize("tz", [None, "Australia/Sydney"])
+def test_slicing_prefix_integral_matches_slices(tz):
+    df = sc.make_test_data(dates=True, seed=3)
+    df["start"] = df["start"].dt.tz_localize(tz)
+    df["end"] = df["end"].dt.tz_localize(tz)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01", tz=tz), pd.Timestamp("2021-03-20", tz=tz))
+    )
+    slicer = stairs.slice(pd.date_range("2020-12-01", "2022-02-01", freq="7D", tz=tz))
+    pd.testing.assert_series_equal(slicer.integral(), slicer._slices_integral())
+    pd.testing.assert_series_equal(slicer.mean(), slicer._slices_mean())
+
+
+@pytest.mark.parametrize("func", ["max", "min"])
+def test_slicing_range_extrema_matches_slices(func):
+    df = sc.make_test_data(dates=True, seed=3)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-20"))
+    )
+    slicer = stairs.slice(pd.date_range("2020-12-01", "2022-02-01", freq="3D"))
+    pd.testing.assert_series_equal(
+        getattr(slicer, f"_{func}")(), getattr(slicer, f"_slices_{func}")()
+    )
+
+
+@pytest.mark.parametrize("func", ["var", "skew", "kurtosis"])
+def test_slicing_moments_match_slices(func):
+    df = sc.make_test_data(dates=True, seed=3)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-20"))
+    )
+    slicer = stairs.slice(pd.date_range("2020-12-01", "2022-02-01", freq="7D"))
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(), getattr(slicer, f"_slices_{func}")(), check_exact=False
+    )
+
+
+def test_slicing_describe_matches_slices():
+    df = sc.make_test_data(dates=True, seed=3)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-20"))
+    )
+    slicer = stairs.slice(pd.date_range("2020-12-01", "2022-02-01", freq="7D"))
+    pd.testing.assert_frame_equal(
+        slicer.describe(), slicer.apply(sc.Stairs.describe), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("stat", ["sum", "frequency", "density", "probability"])
+def test_slicing_hist_matches_slices(stat):
+    df = sc.make_test_data(dates=True, seed=3)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-04"))
+    )
+    slicer = stairs.slice(pd.date_range("2021-01-01", "2021-06-01", freq="7D"))
+    bins = [0, 100, 200, 300, 400, 500]
+    result = slicer.hist(bins=bins, stat=stat)
+    expected = slicer._slices_hist(bins=bins, stat=stat)
+    if stat in ("sum", "frequency"):
+        # the durations are exact, rather than products of probabilities
+        assert ((result - expected).abs() <= pd.Timedelta(1, "us")).all().all()
+    else:
+        pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("func", ["median", "mode"])
+def test_slicing_median_mode_match_slices(func):
+    df = sc.make_test_data(dates=True, seed=3)
+    stairs = sc.Stairs(df, "start", "end", "value").mask(
+        (pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-04"))
+    )
+    slicer = stairs.slice(pd.date_range("2020-12-01", "2022-02-01", freq="7D"))
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(), getattr(slicer, f"_slices_{func}")()
+    )
+    pd.testing.assert_frame_equal(
+        slicer.percentile([5, 95]), slicer._slices_percentile([5, 95])
+    )
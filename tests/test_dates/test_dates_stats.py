@@ -518,6 +518,12 @@ def test_s1_std(date_func, bounds, expected):
     assert np.isclose(s1(date_func).agg("std", *bounds), expected, atol=0.00001)
 
 
+def test_s1_skew_kurtosis(date_func):
+    # from the moments of the values of s1(date_func).value_sums()
+    assert np.isclose(s1(date_func).skew(), 0.41295036021294357)
+    assert np.isclose(s1(date_func).kurtosis(), -1.2696)
+
+
 # low, high = (2020,1,1), timestamp(2020,1,10, date_func=date_func)
 # total_secs = int((high-low).total_seconds())
 # pts = [low + pd.Timedelta(x, unit='sec') for x in np.linspace(0, total_secs, total_secs)]
@@ -958,3 +964,40 @@ def test_mean_no_overflow():
         .layer(pd.Timestamp("1990"), pd.Timestamp("2060"), 4000)
     )
     s.mean()
+
+
+def test_integral_overflow_after_mean():
+    s = (
+        Stairs()
+        .layer(pd.Timestamp("1980"), pd.Timestamp("2050"), 5000)
+        .layer(pd.Timestamp("1990"), pd.Timestamp("2060"), 4000)
+    )
+    s.mean()
+    with pytest.raises(OverflowError):
+        s.integral()
+
+
+def test_integral_fractional_values():
+    s = (
+        Stairs()
+        .layer(pd.Timestamp("2021"), pd.Timestamp("2021") + pd.Timedelta(3, "us"), 0.5)
+        .layer(pd.Timestamp("2021-01-02"), pd.Timestamp("2021-01-05"), -1.7)
+        .mask((pd.Timestamp("2021-01-03"), pd.Timestamp("2021-01-04")))
+    )
+    expected = pd.Timedelta(3, "us") * 0.5 + pd.Timedelta(2, "D") * -1.7
+    duration = pd.Timedelta(3, "D")
+    assert s.integral() == expected
+    assert s.mean() == pytest.approx(expected / duration)
+
+
+@pytest.mark.parametrize("clip", ["pre", "post"])
+def test_xcorr_match_lagged(date_func, clip):
+    lower = timestamp(2020, 1, 1, date_func=date_func)
+    upper = timestamp(2020, 1, 8, date_func=date_func)
+    lags = pd.to_timedelta([-1, 0, 1, 2.5], unit="D")
+    result = s1(date_func).xcorr(s2(date_func), lags, where=(lower, upper), clip=clip)
+    expected = [
+        s1(date_func).corr(s2(date_func), where=(lower, upper), lag=lag, clip=clip)
+        for lag in lags
+    ]
+    np.testing.assert_allclose(result.values, expected, atol=0.00001)
@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from staircase import Stairs
+from staircase.core.exceptions import ClosedMismatchError
 
 
 def s1(closed="left"):
@@ -326,3 +327,234 @@ def test_binary_ops_with_nan(s1_fix, op, nan_pos):
     operands = (np.nan, s1_fix) if nan_pos == "first" else (s1_fix, np.nan)
     result = op(*operands)
     assert result._data is None, "wrong internal representation in resulting Stairs"
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.lt,
+        operator.ge,
+        operator.eq,
+        operator.and_,
+        operator.or_,
+        operator.xor,
+    ],
+)
+def test_binary_ops_pointwise_with_masks(op):
+    rng = np.random.default_rng(42)
+
+    def make_stairs(initial_value):
+        starts = rng.integers(0, 50, 20)
+        s = Stairs(initial_value=initial_value).layer(
+            starts, starts + rng.integers(1, 10, 20), rng.choice([-1, 0, 0.5, 2], 20)
+        )
+        return s.mask((rng.integers(0, 50), 55)).mask((-5, 2))
+
+    s1, s2 = make_stairs(0), make_stairs(np.nan)
+    points = np.union1d(s1.step_points, s2.step_points)
+    points = np.concatenate([points - 0.5, points])
+    values1, values2 = s1(points), s2(points)
+    null = np.isnan(values1) | np.isnan(values2)
+    if op in (operator.and_, operator.or_, operator.xor):
+        values1, values2 = values1 != 0, values2 != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = op(values1, values2).astype(float)
+    expected[null] = np.nan
+    expected[np.isinf(expected)] = np.nan
+    np.testing.assert_array_equal(op(s1, s2)(points), expected)
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.lt,
+        operator.ge,
+        operator.ne,
+        operator.and_,
+        operator.or_,
+        operator.xor,
+    ],
+)
+@pytest.mark.parametrize(
+    "other", [s2(), s3(), 0, 2, np.nan, Stairs(), Stairs(initial_value=np.nan)]
+)
+def test_lazy_binary_ops(op, other):
+    # multiplication by a scalar keeps redundant step points, so step functions
+    # are compared by their values
+    stairs = s1().mask((2.5, 3.5))
+    points = np.arange(-6, 12, 0.25)
+    for result, expected in (
+        (op(stairs.lazy(), other), op(stairs, other)),
+        (op(other, stairs.lazy()), op(other, stairs)),
+    ):
+        result = result.compute()
+        np.testing.assert_array_equal(result(points), expected(points))
+        np.testing.assert_array_equal(result.initial_value, expected.initial_value)
+
+
+def test_lazy_expression(s1_fix, s2_fix, s3_fix, s4_fix):
+    expected = ((s1_fix + s2_fix - s3_fix) * s4_fix > 1) | ~(s2_fix / 2 == -1.25)
+    result = ((s1_fix.lazy() + s2_fix - s3_fix) * s4_fix > 1) | ~(
+        s2_fix.lazy() / 2 == -1.25
+    )
+    assert result.compute().identical(expected)
+    assert (-s1_fix.lazy()).make_boolean().compute().identical((-s1_fix).make_boolean())
+
+
+def test_lazy_shared_subexpression(s1_fix, s2_fix):
+    total = s1_fix.lazy() + s2_fix
+    result = (total * total - total).compute()
+    expected = (s1_fix + s2_fix) * (s1_fix + s2_fix) - (s1_fix + s2_fix)
+    assert result.identical(expected)
+
+
+def test_lazy_deep_expression(s1_fix):
+    expression = s1_fix.lazy()
+    for _ in range(5000):
+        expression = expression + 1
+    assert expression.compute().identical(s1_fix + 5000)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        # comparison with a number, where the null initial value precedes step
+        # points of other step functions
+        lambda x: (x + s2()) == 0,
+        # comparison of a step function without step points
+        lambda x: (x - x + 1) >= s2().mask((7, 8)),
+        # division into, and of, a number, which only nulls negative infinity at
+        # the initial value
+        lambda x: -1 / (x * 0),
+        lambda x: (-1 / x) + s1(),
+        lambda x: (-1 / (x * 0)) / 2,
+    ],
+)
+@pytest.mark.parametrize(
+    "stairs",
+    [
+        Stairs().layer(4, 6, 1).mask((None, 4)),
+        Stairs().layer(4, 6, 1),
+        s2().mask((7, 8)),
+        s2(),
+    ],
+)
+def test_lazy_null_values(func, stairs):
+    points = np.arange(-6, 12, 0.25)
+    result, expected = func(stairs.lazy()).compute(), func(stairs)
+    np.testing.assert_array_equal(result(points), expected(points))
+    np.testing.assert_array_equal(result.initial_value, expected.initial_value)
+
+
+def test_lazy_closed_mismatch(s2_fix):
+    with pytest.raises(ClosedMismatchError):
+        (s1(closed="right").lazy() + s2_fix).compute()
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.lt,
+        operator.eq,
+        operator.and_,
+        operator.xor,
+    ],
+)
+@pytest.mark.parametrize("other", [s2(), 2, np.nan])
+def test_binary_ops_leave_operands_unchanged(s1_fix, op, other):
+    # operands are not copied, so results must not change them when layered
+    for result in (op(s1_fix, other), op(other, s1_fix)):
+        result.layer(2, 6, 3)
+        result.layer([0, 8], [1, 9])
+    assert s1_fix.identical(s1())
+    if isinstance(other, Stairs):
+        assert other.identical(s2())
+
+
+def test_binary_ops_share_arrays(s1_fix):
+    result = s1_fix + 2
+    assert np.shares_memory(result._step_points, s1_fix._step_points)
+    with pytest.raises(ValueError):
+        result._step_points[0] = 0
+    with pytest.raises(ValueError):
+        s1_fix._get_values()[0] = 0
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 10000])
+def test_inplace_accumulation(buffer_size, monkeypatch):
+    monkeypatch.setattr(Stairs, "layer_buffer_size", buffer_size)
+    collection = [s1(), s2(), s3(), s4(), s1() * 2, Stairs(initial_value=1.5), 2]
+    result, expected = Stairs(), Stairs()
+    for i, other in enumerate(collection * 3):
+        if i % 4 == 3:
+            result -= other
+            expected = expected - other
+        else:
+            result += other
+            expected = expected + other
+        if i % 5 == 0:
+            assert result.identical(expected)
+    assert result.identical(expected)
+    assert not result._pending_arrays
+
+
+def test_inplace_returns_self(s1_fix, s2_fix):
+    result = s1_fix
+    result += s2_fix
+    assert result is s1_fix
+    result -= 1
+    result *= s2_fix
+    assert result is s1_fix
+    assert result.identical((s1() + s2() - 1) * s2())
+    assert s2_fix.identical(s2())
+
+
+def test_inplace_with_self(s1_fix):
+    s1_fix += s1_fix
+    assert s1_fix.identical(s1() * 2)
+    s1_fix -= s1_fix
+    assert s1_fix.identical(Stairs())
+
+
+def test_inplace_clears_cache(s1_fix, s2_fix):
+    assert s1_fix.integral() == pytest.approx(s1().integral())
+    s1_fix += s2_fix
+    assert s1_fix.integral() == pytest.approx((s1() + s2()).integral())
+    s1_fix *= 2
+    assert s1_fix.max() == (s1() + s2()).max() * 2
+
+
+@pytest.mark.parametrize(
+    "other", [s2().mask((2, 4)), np.nan, Stairs(initial_value=np.nan)]
+)
+def test_inplace_with_nan(s1_fix, other):
+    expected = s1() + other
+    s1_fix += other
+    assert s1_fix.identical(expected)
+
+
+def test_inplace_closed_mismatch(s2_fix):
+    result = s1(closed="right")
+    with pytest.raises(ClosedMismatchError):
+        result += s2_fix
+    empty = Stairs()
+    empty += s1(closed="right")
+    assert empty.closed == "right"
+
+
+def test_inplace_with_lazy(s1_fix, s2_fix):
+    result = s1_fix
+    result += s2_fix.lazy()
+    assert result.compute().identical(s1() + s2())
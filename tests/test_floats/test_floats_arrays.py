@@ -1,3 +1,5 @@
+import pickle
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -307,6 +309,60 @@ def test_aggregation_with_closed_right(func):
     assert func([s, s]).number_of_steps == 2
 
 
+@pytest.mark.parametrize(
+    "func, reduce",
+    [
+        (sc.sum, np.sum),
+        (sc.mean, np.mean),
+        (sc.max, np.max),
+        (sc.min, np.min),
+        (sc.logical_or, np.any),
+        (sc.logical_and, np.all),
+    ],
+)
+def test_aggregation_with_nulls(func, reduce):
+    rng = np.random.default_rng(0)
+    collection = [Stairs(initial_value=np.nan), Stairs(initial_value=0.5)]
+    for initial_value in (0, 0, 1, np.nan, 2):
+        starts = rng.integers(0, 30, 5)
+        s = Stairs(initial_value=initial_value).layer(
+            starts, starts + rng.integers(1, 5, 5), rng.choice([-1, 0, 0.5], 5)
+        )
+        collection.append(s.mask((rng.integers(0, 30), 31)))
+    points = np.arange(-1, 35, 0.5)
+    samples = np.array([s(points) for s in collection[1:]])
+    null = np.isnan(samples).any(axis=0)
+    if reduce in (np.any, np.all):
+        samples = samples != 0
+    expected = np.where(null, np.nan, reduce(samples, axis=0))
+    np.testing.assert_allclose(func(collection[1:])(points), expected)
+    assert np.isnan(func(collection)(points)).all()
+
+
+@pytest.mark.parametrize(
+    "func, expected",
+    [
+        (sc.sum, 3),
+        (sc.mean, 1.5),
+        (sc.max, 2),
+        (sc.min, 1),
+        (sc.logical_or, 1),
+        (sc.logical_and, 1),
+    ],
+)
+def test_aggregation_without_step_points(func, expected):
+    result = func([Stairs(initial_value=1), Stairs(initial_value=2)])
+    assert result.number_of_steps == 0
+    assert result.initial_value == expected
+
+
+def test_logical_or_single(IS1):
+    pd.testing.assert_series_equal(
+        sc.logical_or([IS1]).step_values,
+        IS1.make_boolean().step_values,
+    )
+
+
 def test_StairsArray_construction1(IS1, IS2):
     sa1 = sc.StairsArray([IS1, IS2])
     sa2 = sc.StairsArray(sa1)
@@ -388,3 +444,247 @@ def test_toplevel_plot(IS1, IS2):
 def test_accessor_plot(IS1, IS2):
     arr = pd.Series([IS1, IS2], dtype="Stairs")
     arr.sc.plot()
+
+
+def test_StairsArray_from_columns(IS1, IS2):
+    arr = sc.StairsArray.from_columns(
+        step_points=np.concatenate([IS1.step_points, IS2.step_points]),
+        values=np.concatenate([IS1.step_values.values, IS2.step_values.values]),
+        offsets=[0, IS1.number_of_steps, IS1.number_of_steps + IS2.number_of_steps],
+    )
+    assert len(arr) == 2
+    assert arr[0].identical(IS1)
+    assert arr[-1].identical(IS2)
+
+
+def test_StairsArray_from_columns_exception():
+    with pytest.raises(ValueError):
+        sc.StairsArray.from_columns([1, 2, 3], [1, 0, 1], [0, 1, 2])
+
+
+@pytest.fixture
+def columnar_data(IS1, IS2):
+    IS3 = Stairs(initial_value=1.5, closed="right").layer(2, 3).layer(5, 6, -1)
+    return [IS1, None, IS2.mask((3, 4)), Stairs(), IS3, IS1.mask((-5, 11))]
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_StairsArray_columnar_limit(columnar_data, side):
+    arr = sc.StairsArray(columnar_data)
+    x = [6, -5, 2, 3, 3.5, 10, 12]
+    pd.testing.assert_frame_equal(
+        arr.to_columnar().limit(x, side),
+        pd.DataFrame(
+            [
+                np.full(len(x), np.nan) if s is None else s.limit(x, side)
+                for s in columnar_data
+            ],
+            columns=x,
+        ),
+    )
+
+
+def test_StairsArray_columnar_sample(columnar_data):
+    arr = sc.StairsArray(columnar_data)
+    x = [6, -5, 2, 3, 3.5, 10, 12]
+    pd.testing.assert_frame_equal(
+        arr.to_columnar().sample(x),
+        pd.DataFrame(
+            [np.full(len(x), np.nan) if s is None else s(x) for s in columnar_data],
+            columns=x,
+        ),
+    )
+
+
+@pytest.mark.parametrize("x", [3, [6, -5, 2, 3, 3.5, 10, 12]])
+def test_StairsArray_sample_matrix(columnar_data, x):
+    arr = sc.StairsArray(columnar_data)
+    expected = np.array(
+        [
+            np.full(np.size(x), np.nan) if s is None else np.atleast_1d(s(x))
+            for s in columnar_data
+        ]
+    ).reshape(len(columnar_data), np.size(x))
+    np.testing.assert_array_equal(arr.sample_matrix(x), expected)
+    np.testing.assert_array_equal(arr.to_columnar().sample_matrix(x), expected)
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_accessor_limit_as_array(columnar_data, side):
+    series = pd.Series(columnar_data, dtype="Stairs", index=list("abcdef"))
+    x = [6, -5, 2, 3, 3.5, 10, 12]
+    result = series.sc.limit(x, side, as_frame=False)
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(result, series.sc.limit(x, side).values)
+
+
+def test_accessor_sample_as_array_empty():
+    series = pd.Series([], dtype="Stairs")
+    assert series.sc.sample([1, 2], as_frame=False).shape == (0, 2)
+
+
+@pytest.mark.parametrize("method", ["integral", "mean", "max", "min"])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_accessor_elementwise_stats(columnar_data, method, columnar):
+    arr = sc.StairsArray(columnar_data)
+    if columnar:
+        arr = arr.to_columnar()
+    index = list("abcdef")
+    result = pd.Series(arr, index=index).sc
+    expected = [np.nan if s is None else getattr(s, method)() for s in columnar_data]
+    pd.testing.assert_series_equal(
+        getattr(result, method)(),
+        pd.Series(expected, index=index, dtype="float64"),
+    )
+
+
+@pytest.mark.parametrize("percentiles", [(25, 50, 75), (0, 12.5, 100)])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_accessor_describe(columnar_data, percentiles, columnar):
+    arr = sc.StairsArray(columnar_data)
+    if columnar:
+        arr = arr.to_columnar()
+    index = list("abcdef")
+    result = pd.Series(arr, index=index).sc.describe(percentiles)
+    expected = pd.DataFrame(
+        [
+            pd.Series(dtype=float) if s is None else s.describe(percentiles=percentiles)
+            for s in columnar_data
+        ],
+        index=index,
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "op, other",
+    [
+        ("add", 2),
+        ("subtract", 0.5),
+        ("multiply", -3),
+        ("divide", 4),
+        ("divide", 0),
+        ("radd", 1),
+        ("rsubtract", 2.5),
+        ("rmultiply", 0),
+        ("rdivide", 2),
+        ("add", np.nan),
+    ],
+)
+def test_StairsArray_columnar_arithmetic(columnar_data, op, other):
+    result = getattr(sc.StairsArray(columnar_data).to_columnar(), op)(other)
+    x = np.arange(-6, 13, 0.5)
+    for s, r in zip(columnar_data, result):
+        if s is None:
+            assert r is None
+        else:
+            expected = getattr(s, op)(other)
+            np.testing.assert_allclose(r(x), expected(x))
+            np.testing.assert_allclose(r.limit(x, "left"), expected.limit(x, "left"))
+
+
+def test_StairsArray_columnar_negate(columnar_data):
+    result = -sc.StairsArray(columnar_data).to_columnar()
+    for s, r in zip(columnar_data, result):
+        assert (s is None and r is None) or (-s).identical(r)
+
+
+def test_StairsArray_columnar_take(columnar_data):
+    arr = sc.StairsArray(columnar_data).to_columnar()
+    result = arr.take([4, -1, 0, 1], allow_fill=True)
+    assert list(result.isna()) == [False, True, False, True]
+    assert result[0].identical(columnar_data[4])
+    assert result[2].identical(columnar_data[0])
+    result = arr.take([-1, 2])
+    assert result[0].identical(columnar_data[-1])
+    assert result[1].identical(columnar_data[2])
+
+
+def test_StairsArray_columnar_series(columnar_data):
+    series = pd.Series(sc.StairsArray(columnar_data).to_columnar())
+    result = pd.concat([series.iloc[4:], series.iloc[:2]])
+    assert result.values._columns is not None
+    assert list(result.isna()) == [False, False, False, True]
+    for s, r in zip(columnar_data[4:] + columnar_data[:2], result):
+        assert (s is None and r is None) or s.identical(r)
+
+
+def test_StairsArray_columnar_set(columnar_data, IS2):
+    arr = sc.StairsArray(columnar_data).to_columnar()
+    arr[1] = IS2
+    assert arr[1].identical(IS2)
+    assert arr[0].identical(columnar_data[0])
+
+
+@pytest.mark.parametrize(
+    "serialize, deserialize",
+    [(sc.io.to_bytes, sc.io.from_bytes), (sc.io.to_json, sc.io.from_json)],
+)
+def test_StairsArray_io_round_trip(columnar_data, serialize, deserialize):
+    result = deserialize(serialize(sc.StairsArray(columnar_data)))
+    assert list(result.isna()) == [s is None for s in columnar_data]
+    for s, r in zip(columnar_data, result):
+        assert (s is None and r is None) or (s.identical(r) and s.closed == r.closed)
+
+
+def test_StairsArray_pickle(columnar_data):
+    series = pd.Series(sc.StairsArray(columnar_data), dtype="Stairs")
+    result = pickle.loads(pickle.dumps(series))
+    assert result.values._columns is not None
+    pd.testing.assert_series_equal(result.sc.mean(), series.sc.mean())
+
+
+@pytest.mark.parametrize("where", [(-4, 10), (0, 12), (2.5, 6)])
+def test_cov_matrix_with_nulls(IS1, IS2, where):
+    data = [IS1, IS2.mask((3, 4)), IS1.mask((0, 2)) - IS2]
+    result = sc.cov(data, where=where).values
+    expected = [[s1.cov(s2, where=where) for s2 in data] for s1 in data]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_corr_matrix_with_nulls(IS1, IS2):
+    data = [IS1, IS2.mask((3, 4)), IS1.mask((0, 2)) - IS2]
+    result = sc.corr(data, where=(-4, 10)).values
+    expected = [[s1.corr(s2, where=(-4, 10)) for s2 in data] for s1 in data]
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("func", ["cov", "corr"])
+@pytest.mark.parametrize("where", [(None, None), (0, None), (-sc.inf, 6)])
+def test_cov_corr_matrix_unbounded_where(IS1, IS2, func, where):
+    # as per Stairs.cov, means are over the step points of each step function
+    data = [IS1, IS2.mask((3, 4)), Stairs().layer([1, 5], [3, 9], [3, 1])]
+    result = getattr(sc, func)(data, where=where).values
+    expected = np.array(
+        [[getattr(s1, func)(s2, where=where) for s2 in data] for s1 in data]
+    )
+    if func == "corr":
+        np.fill_diagonal(expected, 1)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("func", ["cov", "corr"])
+@pytest.mark.parametrize("where", [(None, None), (2, None)])
+def test_cov_corr_matrix_unbounded_where_irregular(func, where):
+    # redundant step points and infinite values are calculated pairwise
+    data = [
+        Stairs.from_values(0, pd.Series([1, 1, 3, 0], index=[1, 2, 4, 6])),
+        Stairs.from_values(np.nan, pd.Series([2, np.nan, 1, 0], index=[0, 3, 5, 8])),
+        Stairs().layer([1, 2], [7, 4], [np.inf, -1]),
+        Stairs().layer([0, 3], [5, 9], [2, 1]).mask((6, 7)),
+        Stairs(initial_value=2),
+    ]
+    result = getattr(sc, func)(data, where=where).values
+    expected = np.array(
+        [[getattr(s1, func)(s2, where=where) for s2 in data] for s1 in data]
+    )
+    if func == "corr":
+        np.fill_diagonal(expected, 1)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_corr_matrix_constant_on_shared_domain(IS1):
+    # the second step function is constant where the first is not null
+    data = [IS1.mask((-5, 3)), Stairs().layer(0, 2, 1)]
+    result = sc.corr(data, where=(-4, 10)).values
+    np.testing.assert_allclose(result, [[1, np.nan], [np.nan, 1]])
@@ -4,7 +4,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from staircase import Stairs
+from staircase import Stairs, StairsBuilder, make_test_data
+from staircase.core.layering import (
+    _sum_deltas_by_step_point,
+    _sum_deltas_by_step_point_groupby,
+)
 
 
 def _expand_interval_definition(start, end=None, value=1):
@@ -440,3 +444,147 @@ def test_layering_series_with_different_index():
         check_dtype=False,
     )
     assert result.initial_value == 0
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sum_deltas_by_step_point_matches_groupby(seed):
+    df = make_test_data(dates=False, positive_only=False, seed=seed)
+    start = df["start"].dropna()
+    end = df["end"].dropna()
+    step_points = [start.values, end.values, np.array([0.5, 50.0, 99.5])]
+    deltas = [
+        df.loc[start.index, "value"].values,
+        -df.loc[end.index, "value"].values,
+        np.array([1, 2, 3]),
+    ]
+    result = _sum_deltas_by_step_point(step_points, deltas)
+    expected = _sum_deltas_by_step_point_groupby(step_points, deltas)
+    np.testing.assert_array_equal(result[0], expected[0])
+    np.testing.assert_array_equal(result[1], expected[1])
+
+
+def test_layering_masked_retains_nan():
+    result = Stairs().layer(1, 3).mask((2, 4)).layer([0, 2.5], [6, 3.5], [1, 2])
+    expected = pd.Series({0.0: 1.0, 1.0: 2.0, 2.0: np.nan, 4.0: 1.0, 6.0: 0.0})
+    pd.testing.assert_series_equal(
+        result.step_values,
+        expected,
+        check_names=False,
+        check_index_type=False,
+    )
+    assert result.initial_value == 0
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 10000])
+def test_layering_scalar_buffered_matches_vectorized(buffer_size, monkeypatch):
+    monkeypatch.setattr(Stairs, "layer_buffer_size", buffer_size)
+    df = make_test_data(dates=False, positive_only=False, seed=0)
+    result = Stairs()
+    for start, end, value in df.itertuples(index=False):
+        result.layer(
+            None if np.isnan(start) else start, None if np.isnan(end) else end, value
+        )
+    assert len(result._pending_layers) < buffer_size
+    expected = Stairs().layer(df["start"], df["end"], df["value"])
+    pd.testing.assert_series_equal(
+        result.step_changes,
+        expected.step_changes,
+        check_dtype=False,
+        check_exact=False,
+    )
+    assert result.initial_value == pytest.approx(expected.initial_value)
+
+
+def test_layering_scalar_buffered_interleaved_reads():
+    result = Stairs.from_values(0, pd.Series([1, 3, 2], index=[1, 2, 3]))
+    result.layer(None, 2, 1)
+    assert result(1.5) == 2
+    result.layer(1.5, 2.5, 2).layer(2.5, None, -1)
+    assert result.initial_value == 1
+    assert result(2.2) == 5
+    result.layer(1, 1.5, -1)
+    expected = pd.Series({1.5: 4.0, 2.0: 5.0, 2.5: 2.0, 3.0: 1.0})
+    pd.testing.assert_series_equal(
+        result.step_values,
+        expected,
+        check_names=False,
+        check_index_type=False,
+    )
+
+
+@pytest.mark.parametrize("mask", [(1.5, 2.5), (None, 1.5), (4.5, None)])
+@pytest.mark.parametrize("start, end", [(None, 2), (0, 2), (2, 5), (5, None)])
+def test_layering_scalar_masked_matches_vectorized(mask, start, end):
+    masked = Stairs().layer([1, 3, 5], [2, 4, 6], [1, 2, 3]).mask(mask)
+    result = masked.copy().layer(start, end, 2).layer(start, end, 3)
+    expected = masked.copy().layer([start], [end], [2]).layer([start], [end], [3])
+    assert result.identical(expected)
+    assert not result._pending_layers
+
+
+@pytest.mark.parametrize("lateness", [None, 0, 5])
+def test_from_stream_matches_layer(lateness):
+    df = make_test_data(dates=False, positive_only=False, seed=0)
+    df = df.dropna(subset=["start"]).sort_values("start")
+    chunks = [df.iloc[i : i + 50] for i in range(0, len(df), 50)]
+    result = Stairs.from_stream(chunks, value="value", lateness=lateness)
+    expected = Stairs(df, "start", "end", "value")
+    assert result.identical(expected)
+
+
+@pytest.mark.parametrize("late", ["drop", "merge"])
+def test_stairs_builder_late(late):
+    builder = StairsBuilder(lateness=2, late=late)
+    builder.add([1, 5], [3, 8], [1, 2]).add(None, 2, 3)
+    assert builder.watermark == 3
+    builder.add([2, 4], [6, 7], [3, 4])
+    if late == "drop":
+        expected = Stairs().layer([1, 5, 4], [3, 8, 7], [1, 2, 4])
+    else:
+        expected = Stairs().layer([1, 5, None, 2, 4], [3, 8, 2, 6, 7], [1, 2, 3, 3, 4])
+    assert builder.to_stairs().identical(expected)
+
+
+def test_stairs_builder_late_raise():
+    builder = StairsBuilder().add([1, 5], [3, 8]).advance(4).advance(2)
+    assert builder.watermark == 4
+    with pytest.raises(ValueError):
+        builder.add(3, 6)
+    builder.add((4, 6), (9, None))
+    expected = Stairs().layer([1, 5, 4, 6], [3, 8, 9, None])
+    assert builder.to_stairs().identical(expected)
+
+
+@pytest.mark.parametrize("late", ["raise", "drop", "merge"])
+def test_stairs_builder_late_unbounded_start(late):
+    builder = StairsBuilder(late=late).add([1], [3]).advance(2)
+    if late == "raise":
+        with pytest.raises(ValueError):
+            builder.add(None, 5, 2)
+        expected = Stairs().layer(1, 3)
+    else:
+        builder.add(None, 5, 2)
+        if late == "drop":
+            expected = Stairs().layer(1, 3)
+        else:
+            expected = Stairs().layer([1, None], [3, 5], [1, 2])
+    assert builder.to_stairs().identical(expected)
+
+
+@pytest.mark.parametrize("start, end", [([1, 2], [3]), ([1], [3, 4]), (None, [3, 4])])
+def test_stairs_builder_unequal_lengths(start, end):
+    result = StairsBuilder().add(start, end, 2).to_stairs()
+    assert result.identical(Stairs().layer(start, end, 2))
+
+
+def test_stairs_builder_merges_runs():
+    df = make_test_data(dates=False, positive_only=False, seed=0)
+    df = df.dropna(subset=["start"])
+    builder = StairsBuilder(late="merge")
+    for i in range(0, len(df), 10):
+        builder.add(df["start"].iloc[i : i + 10], df["end"].iloc[i : i + 10], 1)
+        if i % 100 == 0:
+            builder.advance(df["start"].iloc[i])
+        assert len(builder._pending) <= np.log2(len(df)) + 1
+    expected = Stairs().layer(df["start"], df["end"])
+    assert builder.to_stairs().identical(expected)
@@ -190,3 +190,56 @@ def test_fractile(s1_fix):
         -0.5,
         0.25,
     ]
+
+
+def test_percentile_vectorized(s1_fix):
+    q = np.array([-10, 0, 20, 35.7, 50, 60, 71.4, 100, 110])
+    np.testing.assert_allclose(s1_fix.percentile(q), [s1_fix.percentile(x) for x in q])
+
+
+def test_percentile_limits(s1_fix):
+    # the mean of the left and right limits at a step
+    assert s1_fix.percentile(100 * 5 / 14) == (-1.75 + -0.5) / 2
+    assert s1_fix.percentile(0) == -1.75
+    assert s1_fix.percentile(100) == 2.75
+
+
+def test_ecdf_matches_value_sums(s1_fix):
+    value_sums = s1_fix.value_sums()
+    ecdf = s1_fix.ecdf
+    np.testing.assert_allclose(ecdf.step_points, value_sums.index)
+    np.testing.assert_allclose(ecdf.step_values, value_sums.cumsum() / value_sums.sum())
+
+
+def test_percentile_ignores_null_values(s1_fix):
+    masked = s1_fix.mask((-4, 1))
+    assert masked.percentile(50) == masked.clip(1, 10).percentile(50)
+
+
+def test_distribution_reset_after_layer():
+    s = Stairs().layer(0, 1, 1)
+    assert s.median() == 1
+    s.layer(1, 3, 2)
+    assert s.median() == 2
+    assert s.ecdf(1.5) == 1 / 3
+
+
+@pytest.mark.parametrize("stairs_instance", [Stairs(), Stairs().mask((0, 1))])
+def test_percentile_no_values(stairs_instance):
+    with pytest.raises(ValueError):
+        stairs_instance.percentile(50)
+
+
+def test_distribution_null_values():
+    stairs = Stairs().layer(0, 2, 1).mask((0, 2))
+    assert stairs.ecdf.number_of_steps == 0
+    assert stairs.ecdf(1) == 0
+    result = stairs.hist(bins=[0, 1, 2])
+    assert result.index.equals(pd.IntervalIndex.from_breaks([0, 1, 2], closed="left"))
+    assert result.eq(0).all()
+    assert stairs.hist(bins=[0, 1, 2], stat="probability").eq(0).all()
+    assert stairs.hist(bins=[0, 1, 2], stat="density").isna().all()
+    with pytest.raises(ValueError):
+        stairs.hist()
+    with pytest.raises(ValueError):
+        stairs.percentile(50)
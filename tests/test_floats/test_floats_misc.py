@@ -1,7 +1,12 @@
+import copy
+import json
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
 
+import staircase as sc
 import staircase.test_data as test_data
 from staircase import Stairs
 
@@ -118,12 +123,37 @@ def test_to_dataframe(s1_fix):
         ),
     ],
 )
-def test_s1_rolling_mean(s1_fix, kwargs, expected_index, expected_vals):
-    rm = s1_fix.rolling_mean(**kwargs)
+@pytest.mark.parametrize("engine", ["prefix", "slice"])
+def test_s1_rolling_mean(s1_fix, kwargs, expected_index, expected_vals, engine):
+    rm = s1_fix.rolling_mean(**kwargs, engine=engine)
     assert list(rm.values) == expected_vals
     assert list(rm.index) == expected_index
 
 
+def test_s1_rolling_integral(s1_fix):
+    ri = s1_fix.rolling_integral(window=(-1, 1))
+    assert list(ri.values) == [0.0, -3.5, -3.5, 0.5, 5.5, 4.75, 1.5, -1.0, -1.0, 0.0]
+    assert list(ri.index) == [-5, -3, 0, 2, 4, 5, 6, 7, 9, 11]
+
+
+def test_s1_rolling_max(s1_fix):
+    result = s1_fix.rolling_max(window=(-2, 0))
+    expected = pd.Series({-2: -1.75, 1: 0.25, 3: 2.75, 7: 2.0, 8: -0.5, 10: 0.0})
+    pd.testing.assert_series_equal(
+        result.step_values, expected, check_names=False, check_index_type=False
+    )
+    assert result.initial_value == 0
+
+
+def test_s1_rolling_min_where(s1_fix):
+    result = s1_fix.rolling_min(window=(-2, 0), where=(0, 8))
+    expected = pd.Series({2: -1.75, 3: 0.25, 5: 2.0, 6: -0.5, 8: np.nan})
+    pd.testing.assert_series_equal(
+        result.step_values, expected, check_names=False, check_index_type=False
+    )
+    assert np.isnan(result.initial_value)
+
+
 @pytest.mark.parametrize(
     "kwargs",
     [
@@ -253,3 +283,114 @@ def test_step_points_stepless():
 def test_shift_correct_closed_value(closed):
     result = Stairs(start=1, end=2, closed=closed).shift(1)
     assert result.closed == closed
+
+
+_formats = [
+    (sc.io.to_bytes, sc.io.from_bytes),
+    (sc.io.to_json, sc.io.from_json),
+]
+
+
+@pytest.mark.parametrize("serialize, deserialize", _formats)
+@pytest.mark.parametrize(
+    "stairs",
+    [
+        s1(),
+        s1(closed="right"),
+        s1().mask((2, 3)),
+        Stairs(),
+        Stairs(initial_value=np.nan, closed="right"),
+        Stairs.from_values(2, pd.Series([3, 0, 1], index=[1, 2, 4])),
+        s2() * 2,
+    ],
+)
+def test_io_round_trip(stairs, serialize, deserialize):
+    result = deserialize(serialize(stairs))
+    assert result.identical(stairs)
+    assert result.closed == stairs.closed
+
+
+def test_io_files(tmp_path, s1_fix):
+    sc.io.write_bytes(s1_fix, tmp_path / "s1.bin")
+    sc.io.write_json(s1_fix, tmp_path / "s1.json")
+    assert sc.io.read_bytes(tmp_path / "s1.bin").identical(s1_fix)
+    assert sc.io.read_json(tmp_path / "s1.json").identical(s1_fix)
+
+
+def test_from_bytes_without_copy(s1_fix):
+    data = sc.io.to_bytes(s1_fix)
+    result = sc.io.from_bytes(data)
+    assert np.shares_memory(result._step_points, np.frombuffer(data, dtype=np.uint8))
+    assert not result._step_points.flags.writeable
+
+
+def test_to_json_is_strict():
+    text = sc.io.to_json(s1().mask((2, 3)) + Stairs(initial_value=np.nan))
+
+    def raise_constant(constant):
+        raise ValueError(constant)
+
+    document = json.loads(text, parse_constant=raise_constant)
+    assert document["initial_value"] is None
+    assert document["dtype"] == "float64"
+
+
+def test_io_invalid(s1_fix):
+    with pytest.raises(ValueError):
+        sc.io.from_bytes(b"not step functions")
+    with pytest.raises(ValueError):
+        sc.io.from_json("{}")
+    with pytest.raises(TypeError):
+        sc.io.to_bytes(pd.Series([1, 2]))
+    data = bytearray(sc.io.to_bytes(s1_fix))
+    data[8] = 99  # the version
+    with pytest.raises(ValueError):
+        sc.io.from_bytes(data)
+
+
+def test_pickle(s1_fix):
+    s1_fix.integral()
+    result = pickle.loads(pickle.dumps(s1_fix))
+    assert result.identical(s1_fix)
+    assert result._integral_and_mean is None
+
+
+class _SubStairs(Stairs):
+    pass
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [lambda x: pickle.loads(pickle.dumps(x)), copy.deepcopy]
+)
+@pytest.mark.parametrize("attribute", ["ecdf", "percentile", "fractile"])
+def test_pickle_distribution(s1_fix, roundtrip, attribute):
+    expected = getattr(s1_fix, attribute)
+    result = roundtrip(expected)
+    assert type(result) is type(expected)
+    assert result.identical(expected)
+    assert vars(result).keys() == vars(expected).keys()
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [lambda x: pickle.loads(pickle.dumps(x)), copy.deepcopy]
+)
+def test_pickle_subclass(roundtrip):
+    stairs = _SubStairs().layer([1, 2], [3, 4])
+    stairs.label = "x"
+    result = roundtrip(stairs)
+    assert type(result) is _SubStairs
+    assert result.identical(stairs)
+    assert result.label == "x"
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [lambda x: pickle.loads(pickle.dumps(x)), copy.deepcopy]
+)
+def test_pickle_object_step_points(roundtrip):
+    stairs = Stairs().layer(
+        np.array([pd.Period("2020-01")], dtype=object),
+        np.array([pd.Period("2020-03")], dtype=object),
+    )
+    result = roundtrip(stairs)
+    assert result.identical(stairs)
+    assert result.step_points.tolist() == stairs.step_points.tolist()
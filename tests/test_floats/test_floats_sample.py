@@ -88,3 +88,42 @@ def s4_fix():
 )
 def test_s1_limit(s1_fix, x, kwargs, expected_val):
     assert np.array_equal(s1_fix.limit(x, **kwargs), expected_val)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("side", ["left", "right"])
+@pytest.mark.parametrize("assume_sorted", [False, True])
+def test_s1_limit_sorted(closed, side, assume_sorted):
+    x = np.arange(-6, 12, 0.25)
+    shuffled = np.random.default_rng(0).permutation(x)
+    expected = s1(closed).limit(shuffled, side)[np.argsort(shuffled)]
+    result = s1(closed).limit(x, side, assume_sorted=assume_sorted)
+    assert np.array_equal(result, expected)
+
+
+def test_s1_sample_out():
+    out = np.empty(4)
+    result = s1().sample([-4, -2, 1, 3], out=out)
+    assert result is out
+    assert np.array_equal(out, [-1.75, -1.75, 0.25, 2.75])
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+@pytest.mark.parametrize("assume_sorted", [False, True])
+def test_s1_limit_out(side, assume_sorted):
+    points = np.arange(-6, 12, 0.25)
+    if not assume_sorted:
+        points = np.random.default_rng(0).permutation(points)
+    out = np.empty(len(points))
+    result = s1().limit(points, side, assume_sorted=assume_sorted, out=out)
+    assert result is out
+    assert np.array_equal(out, s1().limit(points, side))
+
+
+def test_s1_sample_out_scalar():
+    with pytest.raises(ValueError):
+        s1().sample(3, out=np.empty(1))
+
+
+def test_s1_sample_empty():
+    assert s1().sample([]).shape == (0,)
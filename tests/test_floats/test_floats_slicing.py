@@ -308,3 +308,212 @@ def test_slicing_resample_mean(s1_fix):
         check_names=False,
         check_index_type=False,
     )
+
+
+def test_resample_grid_mean(s1_fix):
+    pd.testing.assert_series_equal(
+        s1_fix.resample_grid(2, where=(0, 6)).step_values,
+        s1_fix.slice(range(0, 7, 2)).resample("mean").step_values,
+        check_index_type=False,
+    )
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("agg", ["mean", "max", "min", "integral"])
+@pytest.mark.parametrize("freq", [0.7, 3])
+def test_resample_grid_matches_slicer(closed, agg, freq):
+    stairs = s1(closed).mask((2.5, 3.5)) if closed == "left" else s1(closed)
+    result = stairs.resample_grid(freq, agg, as_series=True)
+    assert result.index.left[0] <= -4 and result.index.right[-1] >= 10
+    pd.testing.assert_series_equal(
+        result, getattr(stairs.slice(result.index), agg)(), check_exact=False
+    )
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_resample_grid_last(closed):
+    result = s1(closed).resample_grid(1.5, "last", where=(-1, 8), as_series=True)
+    assert list(result.index.left) == [-1.5, 0, 1.5, 3, 4.5, 6, 7.5]
+    np.testing.assert_array_equal(
+        result.values, s1(closed).limit(result.index.right, side="left")
+    )
+
+
+def test_resample_grid_no_step_points():
+    pd.testing.assert_series_equal(
+        Stairs(initial_value=3).resample_grid(2, "max", where=(1, 5), as_series=True),
+        pd.Series(
+            [3.0] * 3, index=pd.IntervalIndex.from_breaks([0.0, 2, 4, 6], closed="left")
+        ),
+    )
+
+
+def test_resample_grid_exceptions(s1_fix):
+    with pytest.raises(ValueError):
+        s1_fix.resample_grid(2, agg="median")
+    with pytest.raises(ValueError):
+        Stairs().resample_grid(2)
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("func", ["integral", "mean"])
+def test_slicing_prefix_integral_matches_slices(closed, func):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 12, 23), closed=closed)
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(),
+        getattr(slicer, f"_slices_{func}")(),
+    )
+
+
+def test_slicing_integral_overlapping():
+    ii = pd.IntervalIndex.from_arrays([-5, 0, 2.5, 3], [12, 4, 2.5, 9.5])
+    pd.testing.assert_series_equal(
+        s2().slice(ii).integral(),
+        pd.Series([-0.5, -4.0, np.nan, 4.0], index=ii),
+    )
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("func", ["max", "min"])
+def test_slicing_range_extrema_matches_slices(closed, func):
+    stairs = s2().mask((2.5, 3.5)).mask((9, None))
+    ii = pd.IntervalIndex.from_arrays(
+        [-np.inf, -3, -2, 0.5, 2.6, 3, 4, 9.5],
+        [-2, 12, 4, 6.5, 3.4, 8, 4.5, np.inf],
+        closed=closed,
+    )
+    slicer = stairs.slice(ii)
+    result = getattr(slicer, f"_{func}")()
+    pd.testing.assert_series_equal(result, getattr(slicer, f"_slices_{func}")())
+    assert result.isna().tolist() == [False] * 4 + [True, False, False, True]
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("func", ["var", "skew", "kurtosis"])
+def test_slicing_moments_match_slices(closed, func):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 12, 23), closed=closed)
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(),
+        getattr(slicer, f"_slices_{func}")(),
+        check_exact=False,
+        atol=1e-9,
+    )
+
+
+def test_slicing_moments():
+    ii = pd.IntervalIndex.from_arrays([-2, 0, 2.5, 5], [0, 4, 2.5, 7])
+    result = s2().slice(ii).agg(["var", "std", "skew"])
+    expected = pd.DataFrame(
+        {
+            "var": [0, 1.921875, np.nan, 0],
+            "std": [0, np.sqrt(1.921875), np.nan, 0],
+            "skew": [np.nan, 0.92806, np.nan, np.nan],
+        },
+        index=ii,
+    )
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-5)
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("percentiles", [(25, 50, 75), (0, 12.5, 100)])
+def test_slicing_describe_matches_slices(closed, percentiles):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 12, 23), closed=closed)
+    pd.testing.assert_frame_equal(
+        slicer.describe(percentiles),
+        slicer.apply(Stairs.describe, percentiles=percentiles),
+        check_dtype=False,
+    )
+
+
+def test_slicing_describe():
+    ii = pd.IntervalIndex.from_arrays([-2, 0, 5], [0, 4, 9])
+    result = s2().slice(ii).describe(percentiles=[50])
+    expected = pd.DataFrame(
+        {
+            "unique": [1, 4, 3],
+            "mean": [-1.75, -1.0, 0.0],
+            "std": [0.0, 1.386317, 3.061862],
+            "min": [-1.75, -2.5, -2.5],
+            "50%": [-1.75, -1.125, -1.25],
+            "max": [-1.75, 2.0, 5.0],
+        },
+        index=ii,
+    )
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-5)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("stat", ["sum", "frequency", "density", "probability"])
+@pytest.mark.parametrize(
+    "bins",
+    [
+        "unit",
+        [-3, -1, 0, 0.5, 2.5, 5],
+        pd.IntervalIndex.from_tuples([(-2, -1), (0, 1), (1, 2.5)]),
+    ],
+)
+def test_slicing_hist_matches_slices(closed, stat, bins):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 9, 16), closed=closed)
+    result = slicer.hist(bins=bins, closed=closed, stat=stat)
+    expected = slicer._slices_hist(bins=bins, closed=closed, stat=stat)
+    pd.testing.assert_frame_equal(
+        result,
+        expected.reindex(columns=result.columns).fillna(0),
+        check_exact=False,
+    )
+
+
+def test_slicing_hist():
+    result = s2().slice([0, 2, 5]).hist(bins=[-3, -1, 1, 3], stat="probability")
+    expected = pd.DataFrame(
+        [[1.0, 0.0, 0.0], [0.0, 0.5, 0.5]],
+        index=pd.IntervalIndex.from_breaks([0, 2, 5], closed="left"),
+        columns=pd.IntervalIndex.from_breaks([-3, -1, 1, 3], closed="left"),
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("func", ["median", "mode"])
+def test_slicing_median_mode_match_slices(closed, func):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 9, 16), closed=closed)
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(),
+        getattr(slicer, f"_slices_{func}")(),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("q", [30, [0, 12.5, 50, 100]])
+def test_slicing_percentile_matches_slices(q):
+    stairs = s1().mask((2.5, 3.5)).mask((9, None))
+    slicer = stairs.slice(np.linspace(-6, 9, 16))
+    result = slicer.percentile(q)
+    expected = slicer._slices_percentile(q)
+    if isinstance(result, pd.DataFrame):
+        pd.testing.assert_frame_equal(result, expected)
+    else:
+        pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+
+def test_slicing_percentile():
+    ii = pd.IntervalIndex.from_arrays([0, 5, 9.5], [4, 9, 12])
+    slicer = s2().mask((11, None)).slice(ii)
+    expected = pd.DataFrame(
+        [[-2.125, -1.125, 2.0], [-2.5, -1.25, 5.0], [0.0, 0.0, 5.0]],
+        index=ii,
+        columns=[25, 50, 100],
+    )
+    pd.testing.assert_frame_equal(slicer.percentile([25, 50, 100]), expected)
+    assert slicer.mode().tolist() == [-0.5, -2.5, 0.0]
+
+
+def test_slicing_percentile_no_values():
+    slicer = s2().mask((3, None)).slice([0, 2, 4, 6])
+    assert slicer.percentile(50).isna().tolist() == [False, False, True]
+    assert slicer.mode().isna().tolist() == [False, False, True]
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from staircase import Stairs
@@ -110,6 +111,12 @@ def test_mean2(s1_fix, s2_fix):
     assert abs(s2_fix.agg("mean", (2, 8)) - -0.45833333) < 0.000001
 
 
+def test_integral_int_overflow():
+    stairs = Stairs().layer(np.array([0]), np.array([2**40]), np.array([2**30]))
+    assert stairs.integral() == 2**70
+    assert stairs.mean() == 2**30
+
+
 def test_integral_0():
     assert Stairs(initial_value=0).layer(None, 0).integral() is np.nan
 
@@ -186,6 +193,80 @@ def test_s2_std(bounds, expected):
     assert np.isclose(s2().agg("std", *bounds), expected, atol=0.0001)
 
 
+# skew and kurt are the skewness and excess kurtosis of samples, as per np.var
+# skew(st1(np.linspace(-4, 10, 10000000))) = 0.7775808527402104
+# kurt(st1(np.linspace(-4, 10, 10000000))) = -0.680113526753019
+# skew(st1(np.linspace(1, 12, 10000000))) = 0.9273388750655028
+# kurt(st1(np.linspace(1, 12, 10000000))) = -0.8366037141126759
+# skew(st2(np.linspace(-2, 10, 10000000))) = 0.9373107905501923
+# kurt(st2(np.linspace(-2, 10, 10000000))) = -0.5452401305044159
+
+
+@pytest.mark.parametrize(
+    "stairs_func, bounds, expected",
+    [
+        (s1, (), (0.7775808527402104, -0.680113526753019)),
+        (s1, ((1, 12),), (0.9273388750655028, -0.8366037141126759)),
+        (s2, (), (0.9373107905501923, -0.5452401305044159)),
+    ],
+)
+def test_skew_kurtosis(stairs_func, bounds, expected):
+    result = stairs_func().agg(["skew", "kurtosis"], *bounds)
+    assert np.allclose(result.values, expected, atol=0.00001)
+
+
+def test_moments_ignore_null_values():
+    stairs = Stairs().layer([0, 1, 3], [1, 3, 4], [1, 2, 6]).mask((3, 4))
+    assert np.isclose(stairs.var(), 2 / 9)
+    assert np.isclose(stairs.skew(), -1 / np.sqrt(2))
+    assert np.isclose(stairs.kurtosis(), -1.5)
+
+
+def test_moments_constant():
+    stairs = Stairs().layer(0, 1, 0.1).layer(1, 2, 0.1)
+    assert stairs.var() == 0
+    assert np.isnan(stairs.skew())
+    assert np.isnan(stairs.kurtosis())
+
+
+@pytest.mark.parametrize(
+    "stairs",
+    [Stairs().layer([0], [10]), Stairs(initial_value=3).layer(0, 1).layer(1, 2)],
+)
+def test_moments_int_constant(stairs):
+    assert stairs.var() == 0
+    assert stairs.std() == 0
+    assert np.isnan(stairs.skew())
+    assert np.isnan(stairs.kurtosis())
+    assert np.isnan(stairs.corr(stairs))
+
+
+def test_moments_int_values():
+    stairs = Stairs().layer([0, 1, 3], [1, 3, 4], [1, 2, 6])
+    expected = Stairs().layer([0, 1, 3], [1, 3, 4], [1.0, 2.0, 6.0])
+    for statistic in ("mean", "var", "std", "skew", "kurtosis"):
+        assert np.isclose(getattr(stairs, statistic)(), getattr(expected, statistic)())
+
+
+@pytest.mark.parametrize("stairs", [Stairs(), Stairs().layer(0, 1).mask((0, 1))])
+def test_moments_no_values(stairs):
+    assert np.isnan(stairs.var())
+    assert np.isnan(stairs.std())
+
+
+def test_moments_large_offset():
+    # the variance is small relative to the mean
+    stairs = Stairs(initial_value=1e9).layer([0, 1], [1, 2], [1e-3, -1e-3])
+    assert np.isclose(stairs.clip(0, 2).var(), 1e-6, rtol=1e-9)
+
+
+def test_moments_reset_after_layer():
+    stairs = Stairs().layer(0, 2, 1)
+    assert stairs.var() == 0
+    stairs.layer(0, 1, 2)
+    assert stairs.var() == 1
+
+
 # # np.cov(st1(pts[:-100000]), st1(pts[100000:]))[0,1] = 1.9386094481108465
 # # np.cov(st1(np.linspace(-4, 8, 12*100000 + 1)), st1(np.linspace(-2, 10, 12*100000 + 1)))[0,1] = 1.1184896017794723
 # # np.cov(st1(np.linspace(-4, 8, 12*100000 + 1)), st1.shift(-2)(np.linspace(-4, 8, 12*100000 + 1)))[0,1] = 1.1184896017794723
@@ -382,3 +463,104 @@ def test_s1_max(closed, kwargs, expected_val):
 )
 def test_s1_values_in_range(closed, kwargs, expected_val):
     assert np.array_equal(s1(closed=closed).values_in_range(**kwargs), expected_val)
+
+
+@pytest.mark.parametrize("clip", ["pre", "post"])
+@pytest.mark.parametrize("where", [(-4, 10), (0, 8), (1, 7), (None, None), (0, None)])
+@pytest.mark.parametrize("method", ["cov", "corr"])
+def test_xcov_xcorr_match_lagged(method, where, clip):
+    s = s1()
+    other = s2().mask((1, 2))
+    lags = [-2.5, -1, 0, 0.5, 1, 2, 3.25]
+    result = getattr(s, f"x{method}")(other, lags, where=where, clip=clip)
+    expected = [
+        getattr(s, method)(other, where=where, lag=lag, clip=clip) for lag in lags
+    ]
+    assert list(result.index) == lags
+    np.testing.assert_allclose(result.values, expected, atol=0.00001)
+
+
+@pytest.mark.parametrize(
+    "method, where, expected",
+    [
+        ("acov", (-4, 10), {1: 1.9386094481108465, 2: 1.1184896017794723}),
+        ("acorr", (-2, 10), {1: 0.6927353407369307}),
+        ("acorr", (0, 8), {2: -0.2147502741669856}),
+    ],
+)
+def test_s1_acov_acorr(method, where, expected):
+    result = getattr(s1(), method)(list(expected), where=where)
+    np.testing.assert_allclose(result.values, list(expected.values()), atol=0.00001)
+
+
+@pytest.mark.parametrize("method", ["cov", "corr"])
+def test_xcov_xcorr_default_where(method):
+    s = Stairs().layer([0, 2], [4, 6], [1, 2])
+    other = Stairs().layer([1, 5], [3, 9], [3, 1])
+    lags = [0, 1, 2.5]
+    result = getattr(s, f"x{method}")(other, lags)
+    expected = [getattr(s, method)(other, lag=lag) for lag in lags]
+    np.testing.assert_allclose(result.values, expected)
+
+
+@pytest.mark.parametrize("where", [(None, None), (1, None), (None, 7)])
+@pytest.mark.parametrize("method", ["cov", "corr"])
+def test_xcov_xcorr_unbounded_nulls(method, where):
+    # null initial values, a product which is zero on either side of its step points,
+    # and redundant step points, for which Stairs.cov is called for each lag
+    s = Stairs.from_values(0, pd.Series([1, 2, np.nan, 2, 0], index=[0, 2, 3, 4, 9]))
+    others = [
+        Stairs.from_values(np.nan, pd.Series([0, 3, 1, np.nan], index=[1, 4, 5, 10])),
+        Stairs.from_values(0, pd.Series([1, 1, 3, 0], index=[0, 1, 2, 4])),
+    ]
+    lags = [-3, -1, 0, 1.5, 2, 6]
+    for other in others:
+        result = getattr(s, f"x{method}")(other, lags, where=where)
+        expected = [getattr(s, method)(other, where=where, lag=lag) for lag in lags]
+        np.testing.assert_allclose(result.values, expected, atol=0.00001)
+
+
+def test_xcorr_constant():
+    result = s1().xcorr(Stairs(initial_value=2), [0, 1])
+    assert result.isna().all()
+
+
+def test_s2_describe():
+    result = s2().describe()
+    assert list(result.index) == [
+        "unique",
+        "mean",
+        "std",
+        "min",
+        "25%",
+        "50%",
+        "75%",
+        "max",
+    ]
+    np.testing.assert_allclose(
+        result.values, [6, -0.041667, 2.650341, -2.5, -2.125, -1.125, 2, 5], atol=1e-5
+    )
+
+
+def test_s2_describe_where():
+    result = s2().describe(where=(0, 6), percentiles=[0, 50, 100])
+    assert list(result.index) == [
+        "unique",
+        "mean",
+        "std",
+        "min",
+        "0%",
+        "50%",
+        "100%",
+        "max",
+    ]
+    np.testing.assert_allclose(
+        result.values, [4, -0.75, 1.758906, -2.5, -2.5, -1.125, 2, 2], atol=1e-5
+    )
+
+
+def test_describe_no_values():
+    result = Stairs(initial_value=3).describe()
+    assert result["unique"] == 0
+    assert np.isnan(result["mean"])
+    assert result["min"] == result["max"] == 3